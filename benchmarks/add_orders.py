@@ -0,0 +1,77 @@
+"""Benchmark adding orders in batches against adding them one at a time.
+
+Usage:
+
+    python -m benchmarks.add_orders
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import List
+
+from jetblack_finance.order_book import OrderBook, OrderRequest, Side, Style
+
+ORDERS = 2 ** 14
+BATCH_SIZES = (1, 64, 4096)
+REPEATS = 5
+
+
+def make_orders() -> List[OrderRequest]:
+    """A stream of orders about a mid price, some of which cross."""
+    rnd = random.Random(42)
+    orders: List[OrderRequest] = []
+    for _ in range(ORDERS):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        offset = rnd.randint(-2, 20)
+        price = Decimal(100 - offset) if side == Side.BUY else Decimal(101 + offset)
+        orders.append(OrderRequest(side, price, rnd.randint(1, 10), Style.LIMIT))
+    return orders
+
+
+def run_sequential(orders: List[OrderRequest]) -> float:
+    """Add the orders one at a time, returning the time per order.
+
+    As with `timeit` the garbage collector is disabled while timing, as the
+    growing book otherwise makes its collections dominate.
+    """
+    order_book = OrderBook()
+    gc.disable()
+    start = time.perf_counter()
+    for order in orders:
+        order_book.add_order(*order)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed / len(orders)
+
+
+def run_batched(orders: List[OrderRequest], batch_size: int) -> float:
+    """Add the orders in batches, returning the time per order."""
+    order_book = OrderBook()
+    batches = [
+        orders[i:i + batch_size]
+        for i in range(0, len(orders), batch_size)
+    ]
+    gc.disable()
+    start = time.perf_counter()
+    for batch in batches:
+        order_book.add_orders(batch)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed / len(orders)
+
+
+def main() -> None:
+    """Run the benchmark"""
+    orders = make_orders()
+    print(f"{ORDERS} orders, best of {REPEATS}")
+    cost = min(run_sequential(orders) for _ in range(REPEATS))
+    print(f"add_order:        {cost * 1e6:.2f}us per order")
+    for batch_size in BATCH_SIZES:
+        cost = min(run_batched(orders, batch_size) for _ in range(REPEATS))
+        print(f"add_orders({batch_size:>4}): {cost * 1e6:.2f}us per order")
+
+
+if __name__ == '__main__':
+    main()
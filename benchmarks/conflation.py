@@ -0,0 +1,115 @@
+"""Benchmark conflating level updates for a slow consumer.
+
+A burst of orders hits one ticker. The publisher takes the level updates
+after every change, and either sends each of them to the consumer, or passes
+them to a conflator which is flushed to the consumer every few changes. The
+consumer does some work for every update it receives.
+
+Usage:
+
+    python -m benchmarks.conflation
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import Callable, Dict, List
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    LevelConflator,
+    LevelUpdate,
+    Side,
+    Style
+)
+
+ORDERS = 50_000
+FLUSH_EVERY = 100
+
+
+def make_orders() -> List[tuple[Side, Decimal, int]]:
+    """Make a burst of orders near the touch."""
+    rnd = random.Random(42)
+    orders: List[tuple[Side, Decimal, int]] = []
+    for _ in range(ORDERS):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        offset = Decimal(rnd.randint(-2, 10)) / 100
+        price = Decimal(100) - offset if side == Side.BUY else Decimal(100) + offset
+        orders.append((side, price, rnd.randint(1, 10)))
+    return orders
+
+
+class Consumer:
+    """A consumer which renders every update it receives."""
+
+    def __init__(self) -> None:
+        self.levels: Dict[tuple[Side, Decimal], int] = {}
+        self.received = 0
+
+    def on_updates(self, updates: Dict[str, List[LevelUpdate]]) -> None:
+        """Apply and render the updates."""
+        for ticker_updates in updates.values():
+            for update in ticker_updates:
+                self.received += 1
+                self.levels[(update.side, update.price)] = update.size
+                str(update)
+
+
+def every_update(consumer: Consumer) -> Callable[[], None]:
+    """Send every update to the consumer."""
+    orders = make_orders()
+    order_book = ExchangeOrderBook(['AAPL'], tick_sizes={'AAPL': Decimal('0.01')})
+
+    def run() -> None:
+        for side, price, size in orders:
+            order_book.add_order('AAPL', side, price, size, Style.LIMIT)
+            consumer.on_updates(order_book.level_updates())
+
+    return run
+
+
+def conflated(consumer: Consumer) -> Callable[[], None]:
+    """Send the conflated updates to the consumer."""
+    orders = make_orders()
+    order_book = ExchangeOrderBook(['AAPL'], tick_sizes={'AAPL': Decimal('0.01')})
+    conflator = LevelConflator()
+
+    def run() -> None:
+        for count, (side, price, size) in enumerate(orders, 1):
+            order_book.add_order('AAPL', side, price, size, Style.LIMIT)
+            conflator.update(order_book.level_updates())
+            if count % FLUSH_EVERY == 0:
+                consumer.on_updates(conflator.flush())
+        consumer.on_updates(conflator.flush())
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{ORDERS} orders on one ticker, flushed every {FLUSH_EVERY} changes")
+    for name, factory in (
+            ("every update", every_update),
+            ("conflated", conflated),
+    ):
+        consumer = Consumer()
+        elapsed = timed(factory(consumer))
+        print(
+            f"{name:<13} {consumer.received:>7} updates received "
+            f"{elapsed / ORDERS * 1e6:.2f}us per order"
+        )
+
+
+if __name__ == '__main__':
+    main()
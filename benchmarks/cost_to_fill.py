@@ -0,0 +1,111 @@
+"""Benchmark the cost to fill a size against walking the depth.
+
+A pre-trade check asks what it would cost to buy a size from a deep book,
+between changes to the book. Before each query an order is amended, and
+another is cancelled, removing its level, and added again. The cost is either
+found by walking the depth from the best offer, or with `cost_to_fill`.
+
+Usage:
+
+    python -m benchmarks.cost_to_fill
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import Callable, cast
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+QUERIES = 5_000
+
+
+class Book:
+    """A book of offers with one order at each level."""
+
+    def __init__(self, levels: int) -> None:
+        rnd = random.Random(42)
+        self.order_book = OrderBook(tick_size=Decimal('0.01'))
+        self.prices = [Decimal(101) + Decimal(i) / 100 for i in range(levels)]
+        self.order_ids = [
+            self.order_book.add_order(Side.SELL, price, 10, Style.LIMIT)[0]
+            for price in self.prices
+        ]
+        # The best level is left alone, so the sizes can always be filled.
+        self.changes = [
+            (rnd.randrange(1, levels), rnd.randrange(1, levels))
+            for _ in range(QUERIES)
+        ]
+        self.sizes = [rnd.randint(1, levels * 9) for _ in range(QUERIES)]
+
+    def change(self, amend: int, replace: int) -> None:
+        """Amend one order, and cancel and add another."""
+        self.order_book.amend_order(cast(int, self.order_ids[amend]), 9)
+        self.order_book.cancel_order(cast(int, self.order_ids[replace]))
+        self.order_ids[replace], _, _ = self.order_book.add_order(
+            Side.SELL, self.prices[replace], 10, Style.LIMIT
+        )
+
+
+def with_walk(levels: int) -> Callable[[], None]:
+    """Walk the depth from the best offer."""
+    book = Book(levels)
+    order_book = book.order_book
+
+    def run() -> None:
+        for (amend, replace), size in zip(book.changes, book.sizes):
+            book.change(amend, replace)
+            cost = Decimal(0)
+            remaining = size
+            for level in order_book.depth(None)[1]:
+                taken = min(remaining, level.size)
+                cost += taken * level.price
+                remaining -= taken
+                if remaining == 0:
+                    break
+            assert remaining == 0
+
+    return run
+
+
+def with_cost_to_fill(levels: int) -> Callable[[], None]:
+    """Query the cost to fill."""
+    book = Book(levels)
+    order_book = book.order_book
+
+    def run() -> None:
+        for (amend, replace), size in zip(book.changes, book.sizes):
+            book.change(amend, replace)
+            assert order_book.cost_to_fill(Side.BUY, size) is not None
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{QUERIES} changes and queries")
+    for levels in (10, 100, 1000):
+        for name, factory in (
+                ("walk depth", with_walk),
+                ("cost_to_fill", with_cost_to_fill),
+        ):
+            elapsed = timed(factory(levels))
+            print(
+                f"{levels:>5} levels {name:<13} "
+                f"{elapsed / QUERIES * 1e6:.2f}us per query"
+            )
+
+
+if __name__ == '__main__':
+    main()
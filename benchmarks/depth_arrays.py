@@ -0,0 +1,90 @@
+"""Benchmark sampling the depth of a book into NumPy arrays.
+
+An analytic samples the best levels of a book as arrays of prices, sizes and
+counts, either by converting the depth with Python loops, or with
+`depth_arrays` reusing the same arrays. NumPy must be installed.
+
+Usage:
+
+    python -m benchmarks.depth_arrays
+"""
+
+from decimal import Decimal
+import gc
+import time
+from typing import Callable
+
+import numpy as np
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+SAMPLES = 20_000
+
+
+def build() -> OrderBook:
+    """Build a book with 100 levels on each side."""
+    order_book = OrderBook(tick_size=Decimal('0.01'))
+    for i in range(100):
+        offset = Decimal(i) / 100
+        order_book.add_order(Side.BUY, Decimal(100) - offset, 10 + i, Style.LIMIT)
+        order_book.add_order(Side.SELL, Decimal(101) + offset, 10 + i, Style.LIMIT)
+    return order_book
+
+
+def with_loops(levels: int) -> Callable[[], None]:
+    """Convert the depth with Python loops."""
+    order_book = build()
+
+    def run() -> None:
+        for _ in range(SAMPLES):
+            bids, offers = order_book.depth(levels)
+            bids = bids[::-1]
+            np.array([[float(level.price) for level in bids],
+                      [float(level.price) for level in offers]])
+            np.array([[level.size for level in bids],
+                      [level.size for level in offers]])
+            np.array([[level.count for level in bids],
+                      [level.count for level in offers]])
+
+    return run
+
+
+def with_arrays(levels: int) -> Callable[[], None]:
+    """Fill the same arrays with depth_arrays."""
+    order_book = build()
+    arrays = order_book.depth_arrays(levels)
+
+    def run() -> None:
+        for _ in range(SAMPLES):
+            order_book.depth_arrays(levels, arrays)
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{SAMPLES} samples of the depth")
+    for levels in (5, 20, 100):
+        for name, factory in (
+                ("python loops", with_loops),
+                ("depth arrays", with_arrays),
+        ):
+            elapsed = min(timed(factory(levels)) for _ in range(3))
+            print(
+                f"{levels:>4} levels {name:<13} "
+                f"{elapsed / SAMPLES * 1e6:.2f}us per sample"
+            )
+
+
+if __name__ == '__main__':
+    main()
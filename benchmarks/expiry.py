@@ -0,0 +1,54 @@
+"""Benchmark expiring orders in books of different sizes.
+
+A fixed number of orders expire at each step, while the number of resting
+orders which are good until cancelled grows. The cost per expired order should
+grow far more slowly than the book.
+
+Usage:
+
+    python -m benchmarks.expiry
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+STEPS = 1_000
+EXPIRING = 10
+
+
+def build(resting: int) -> OrderBook:
+    """Build a book of resting orders, with orders expiring at each step."""
+    rnd = random.Random(42)
+    order_book = OrderBook()
+    for i in range(resting + STEPS * EXPIRING):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        offset = Decimal(rnd.randint(0, 500)) / 100
+        price = Decimal(100) - offset if side == Side.BUY else Decimal(101) + offset
+        expiry = None if i < resting else rnd.randrange(STEPS)
+        order_book.add_order(side, price, rnd.randint(1, 10), Style.LIMIT, expiry=expiry)
+    return order_book
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{STEPS} steps, {EXPIRING} orders expiring per step")
+    for resting in (10_000, 100_000, 500_000):
+        order_book = build(resting)
+        gc.disable()
+        start = time.perf_counter()
+        expired = sum(len(order_book.expire(now)) for now in range(STEPS))
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        assert expired == STEPS * EXPIRING
+        print(
+            f"{resting:>7} resting orders: "
+            f"{elapsed / expired * 1e6:.2f}us per expired order"
+        )
+
+
+if __name__ == '__main__':
+    main()
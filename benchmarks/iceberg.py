@@ -0,0 +1,74 @@
+"""Benchmark iceberg orders against slices sent by the client.
+
+A seller works a large order by displaying a small peak, which is hit
+repeatedly by buyers. A client without iceberg orders sends a new slice each
+time the displayed order is filled.
+
+Usage:
+
+    python -m benchmarks.iceberg
+"""
+
+from decimal import Decimal
+import gc
+import time
+from typing import Callable
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+TOTAL = 1_000_000
+PEAK = 10
+PRICE = Decimal('100')
+
+
+def with_slices() -> Callable[[], None]:
+    """The client adds a new slice when the last is filled."""
+    order_book = OrderBook()
+
+    def run() -> None:
+        order_book.add_order(Side.SELL, PRICE, PEAK, Style.LIMIT)
+        for _ in range(TOTAL // PEAK - 1):
+            _, fills, _ = order_book.add_order(Side.BUY, PRICE, PEAK, Style.LIMIT)
+            assert fills
+            order_book.add_order(Side.SELL, PRICE, PEAK, Style.LIMIT)
+        order_book.add_order(Side.BUY, PRICE, PEAK, Style.LIMIT)
+
+    return run
+
+
+def with_iceberg() -> Callable[[], None]:
+    """The engine replenishes the iceberg."""
+    order_book = OrderBook()
+
+    def run() -> None:
+        order_book.add_order(Side.SELL, PRICE, TOTAL, Style.ICEBERG, peak=PEAK)
+        for _ in range(TOTAL // PEAK):
+            _, fills, _ = order_book.add_order(Side.BUY, PRICE, PEAK, Style.LIMIT)
+            assert fills
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{TOTAL} shown {PEAK} at a time, {TOTAL // PEAK} fills")
+    for name, factory in (
+            ("client slices", with_slices),
+            ("iceberg", with_iceberg),
+    ):
+        elapsed = min(timed(factory()) for _ in range(3))
+        print(f"{name:<14} {elapsed / (TOTAL // PEAK) * 1e6:.2f}us per fill")
+
+
+if __name__ == '__main__':
+    main()
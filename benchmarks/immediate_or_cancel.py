@@ -0,0 +1,45 @@
+"""Benchmark immediate-or-cancel orders against a deep best level.
+
+Usage:
+
+    python -m benchmarks.immediate_or_cancel
+"""
+
+from decimal import Decimal
+import time
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+LEVEL_SIZE = 5_000
+ORDERS = 5_000
+
+
+def main() -> None:
+    """Run the benchmark"""
+    order_book = OrderBook()
+    for _ in range(LEVEL_SIZE):
+        order_book.add_order(Side.BUY, Decimal('100'), 10, Style.LIMIT)
+    # An immediate-or-cancel order below the best bid waits for a match at
+    # its price.
+    order_book.add_order(Side.BUY, Decimal('99'), 10, Style.IMMEDIATE_OR_CANCEL)
+
+    # Each sell fills the front of the deep level, after which the
+    # immediate-or-cancel orders at the best levels must be found.
+    start = time.perf_counter()
+    for _ in range(ORDERS):
+        _, fills, cancels = order_book.add_order(
+            Side.SELL,
+            Decimal('100'),
+            1,
+            Style.LIMIT
+        )
+        assert len(fills) == 1 and not cancels
+        order_book.add_order(Side.BUY, Decimal('100'), 1, Style.LIMIT)
+    elapsed = time.perf_counter() - start
+
+    print(f"{ORDERS} orders against a level of {LEVEL_SIZE}")
+    print(f"{elapsed / ORDERS * 1e6:.2f}us per order")
+
+
+if __name__ == '__main__':
+    main()
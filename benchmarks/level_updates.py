@@ -0,0 +1,97 @@
+"""Benchmark publishing level updates against diffing the depth.
+
+After every change to a deep book a publisher either takes the depth and
+compares it with the last depth it sent, or takes the level updates.
+
+Usage:
+
+    python -m benchmarks.level_updates
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import Callable, Dict, List
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+EVENTS = 20_000
+
+
+def build(levels: int) -> tuple[OrderBook, List[tuple[Side, Decimal, int]]]:
+    """Build a book with many levels, and orders to add near the best."""
+    rnd = random.Random(42)
+    order_book = OrderBook(tick_size=Decimal('0.01'))
+    for i in range(levels):
+        offset = Decimal(i) / 100
+        order_book.add_order(Side.BUY, Decimal(100) - offset, 10, Style.LIMIT)
+        order_book.add_order(Side.SELL, Decimal(101) + offset, 10, Style.LIMIT)
+    order_book.level_updates()
+    orders: List[tuple[Side, Decimal, int]] = []
+    for _ in range(EVENTS):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        offset = Decimal(rnd.randint(0, 20)) / 100
+        price = Decimal(100) - offset if side == Side.BUY else Decimal(101) + offset
+        orders.append((side, price, 1))
+    return order_book, orders
+
+
+def with_depth(levels: int) -> Callable[[], None]:
+    """Diff the depth after each change."""
+    order_book, orders = build(levels)
+    last: Dict[tuple[Side, Decimal], int] = {}
+
+    def run() -> None:
+        nonlocal last
+        for side, price, size in orders:
+            order_book.add_order(side, price, size, Style.LIMIT)
+            bids, offers = order_book.depth(None)
+            current = {(Side.BUY, level.price): level.size for level in bids}
+            current.update(((Side.SELL, level.price), level.size) for level in offers)
+            changes = [key for key, size in current.items() if last.get(key) != size]
+            assert changes
+            last = current
+
+    return run
+
+
+def with_updates(levels: int) -> Callable[[], None]:
+    """Take the level updates after each change."""
+    order_book, orders = build(levels)
+
+    def run() -> None:
+        for side, price, size in orders:
+            order_book.add_order(side, price, size, Style.LIMIT)
+            assert order_book.level_updates()
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{EVENTS} orders added near the best price")
+    for levels in (10, 100, 1000):
+        for name, factory in (
+                ("depth diff", with_depth),
+                ("level updates", with_updates),
+        ):
+            elapsed = timed(factory(levels))
+            print(
+                f"{levels:>5} levels {name:<14} "
+                f"{elapsed / EVENTS * 1e6:.2f}us per change"
+            )
+
+
+if __name__ == '__main__':
+    main()
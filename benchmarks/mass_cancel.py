@@ -0,0 +1,81 @@
+"""Benchmark cancelling many orders together against one at a time.
+
+Usage:
+
+    python -m benchmarks.mass_cancel
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import Callable, List
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+ORDERS = 50_000
+OWNERS = 10
+
+
+def build() -> tuple[OrderBook, List[tuple[int, str]]]:
+    """Build a book of resting orders spread over many owners."""
+    rnd = random.Random(42)
+    order_book = OrderBook()
+    orders: List[tuple[int, str]] = []
+    for _ in range(ORDERS):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        offset = Decimal(rnd.randint(0, 500)) / 100
+        price = Decimal(100) - offset if side == Side.BUY else Decimal(101) + offset
+        owner = f"owner{rnd.randrange(OWNERS)}"
+        order_id, _, _ = order_book.add_order(
+            side,
+            price,
+            rnd.randint(1, 10),
+            Style.LIMIT,
+            owner=owner
+        )
+        assert order_id is not None
+        orders.append((order_id, owner))
+    return order_book, orders
+
+
+def cancel_each(order_book: OrderBook, order_ids: List[int]) -> None:
+    """Cancel orders one at a time."""
+    for order_id in order_ids:
+        order_book.cancel_order(order_id)
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{ORDERS} orders, {OWNERS} owners")
+
+    order_book, orders = build()
+    owned = [order_id for order_id, owner in orders if owner == 'owner0']
+    elapsed = timed(lambda: cancel_each(order_book, owned))
+    print(f"cancel_order for one owner:  {elapsed * 1e3:.1f}ms")
+
+    order_book, orders = build()
+    elapsed = timed(lambda: order_book.cancel_orders(owner='owner0'))
+    print(f"cancel_orders(owner=...):    {elapsed * 1e3:.1f}ms")
+
+    order_book, orders = build()
+    elapsed = timed(lambda: cancel_each(order_book, [i for i, _ in orders]))
+    print(f"cancel_order for every order: {elapsed * 1e3:.1f}ms")
+
+    order_book, orders = build()
+    elapsed = timed(order_book.cancel_orders)
+    print(f"cancel_orders():              {elapsed * 1e3:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
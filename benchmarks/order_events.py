@@ -0,0 +1,78 @@
+"""Benchmark the cost of recording order events.
+
+Orders are added near the touch of a book, with and without a listener for
+the order events.
+
+Usage:
+
+    python -m benchmarks.order_events
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import Callable, List
+
+from jetblack_finance.order_book import OrderBook, OrderEvent, Side, Style
+
+ORDERS = 100_000
+
+
+def make_orders() -> List[tuple[Side, Decimal, int]]:
+    """Make orders near the touch, some of which cross."""
+    rnd = random.Random(42)
+    orders: List[tuple[Side, Decimal, int]] = []
+    for _ in range(ORDERS):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        offset = Decimal(rnd.randint(-2, 10)) / 100
+        price = Decimal(100) - offset if side == Side.BUY else Decimal(100) + offset
+        orders.append((side, price, rnd.randint(1, 10)))
+    return orders
+
+
+def run_orders(listen: bool) -> Callable[[], None]:
+    """Add the orders, optionally counting the events."""
+    orders = make_orders()
+    events = 0
+
+    def on_events(batch: List[OrderEvent]) -> None:
+        nonlocal events
+        events += len(batch)
+
+    order_book = OrderBook(
+        tick_size=Decimal('0.01'),
+        listener=on_events if listen else None
+    )
+
+    def run() -> None:
+        for side, price, size in orders:
+            order_book.add_order(side, price, size, Style.LIMIT)
+        assert events > 0 or not listen
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{ORDERS} orders added near the touch")
+    for name, listen in (
+            ("no listener", False),
+            ("listener", True),
+    ):
+        elapsed = min(timed(run_orders(listen)) for _ in range(3))
+        print(f"{name:<12} {elapsed / ORDERS * 1e6:.2f}us per order")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the time and memory of the order book with and without object
+pooling.
+
+The workload is a stream of quotes near a drifting mid price, where most
+orders are cancelled and replaced, and some cross. The memory is measured by
+the interpreter rather than by the pool: the peak traced by tracemalloc, and
+the change in the number of blocks held by the allocator across the run.
+
+Usage:
+
+    python -m benchmarks.pooling
+"""
+
+from decimal import Decimal
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Tuple
+
+from jetblack_finance.order_book import Side, Style
+from jetblack_finance.order_book.constants import ALL_PLUGINS
+from jetblack_finance.order_book.order_book_manager import OrderBookManager
+
+TICK_SIZE = Decimal('0.01')
+OPERATIONS = 200_000
+REPEATS = 3
+
+Operation = Tuple[Side, Decimal, int]
+
+
+def make_operations(count: int, seed: int = 42) -> List[Operation]:
+    """Make a stream of orders around a drifting mid price."""
+    rng = random.Random(seed)
+    mid = 10000
+    operations: List[Operation] = []
+    for _ in range(count):
+        mid += rng.randint(-1, 1)
+        side = rng.choice((Side.BUY, Side.SELL))
+        offset = rng.randint(-1, 10)
+        ticks = mid - offset if side == Side.BUY else mid + offset
+        operations.append((side, TICK_SIZE * ticks, rng.randint(1, 100)))
+    return operations
+
+
+def run(manager: OrderBookManager, operations: List[Operation]) -> None:
+    """Add the orders, cancelling the oldest resting orders to keep the book
+    at a steady size.
+    """
+    resting: List[int] = []
+    for side, price, size in operations:
+        order_id, _, _ = manager.add_order(side, price, size, Style.LIMIT)
+        if order_id is not None:
+            resting.append(order_id)
+        if len(resting) > 500:
+            order_id = resting.pop(0)
+            try:
+                manager.cancel_order(order_id)
+            except KeyError:
+                pass  # The order has been filled.
+
+
+def measure(pooling: bool, operations: List[Operation]) -> None:
+    """Measure the best of a number of runs, and a run tracing allocations."""
+    per_million = 1_000_000 / len(operations)
+
+    elapsed = float('inf')
+    for _ in range(REPEATS):
+        manager = OrderBookManager(ALL_PLUGINS, TICK_SIZE, pooling=pooling)
+        gc.collect()
+        start = time.perf_counter()
+        run(manager, operations)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    manager = OrderBookManager(ALL_PLUGINS, TICK_SIZE, pooling=pooling)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    run(manager, operations)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    blocks = sys.getallocatedblocks() - blocks
+
+    print(f"pooling={pooling}")
+    print(f"  time per million operations: {elapsed * per_million:.2f}s")
+    print(f"  peak traced memory: {peak / 1024:,.0f} KiB")
+    print(f"  blocks held after the run: {blocks:,}")
+
+
+def main() -> None:
+    """Run the benchmark"""
+    operations = make_operations(OPERATIONS)
+    for pooling in (False, True):
+        measure(pooling, operations)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark quote updates against cancelling and adding orders.
+
+Market makers quote a bid and offer on each ticker, and most updates change
+only one side, or nothing at all.
+
+Usage:
+
+    python -m benchmarks.quotes
+"""
+
+from decimal import Decimal
+import gc
+import random
+import time
+from typing import Callable, Dict, List
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    QuoteUpdate,
+    Side,
+    Style
+)
+
+TICKERS = [f"T{i}" for i in range(20)]
+OWNERS = [f"mm{i}" for i in range(10)]
+UPDATES = 100_000
+
+
+def make_updates() -> List[QuoteUpdate]:
+    """Make quote updates which move each side with some probability."""
+    rnd = random.Random(42)
+    quotes: Dict[tuple[str, str], List[int]] = {
+        (ticker, owner): [rnd.randint(990, 999), rnd.randint(1001, 1010)]
+        for ticker in TICKERS
+        for owner in OWNERS
+    }
+    updates: List[QuoteUpdate] = []
+    for _ in range(UPDATES):
+        ticker, owner = rnd.choice(TICKERS), rnd.choice(OWNERS)
+        bid, offer = quote = quotes[(ticker, owner)]
+        if rnd.random() < 0.3:
+            quote[0] = bid = rnd.randint(990, 999)
+        if rnd.random() < 0.3:
+            quote[1] = offer = rnd.randint(1001, 1010)
+        updates.append(
+            QuoteUpdate(ticker, owner, Decimal(bid) / 10, 10, Decimal(offer) / 10, 10)
+        )
+    return updates
+
+
+def with_quotes(updates: List[QuoteUpdate]) -> Callable[[], None]:
+    """Apply the updates with update_quotes."""
+    order_book = ExchangeOrderBook(TICKERS)
+
+    def run() -> None:
+        order_book.update_quotes(updates)
+
+    return run
+
+
+def with_orders(updates: List[QuoteUpdate]) -> Callable[[], None]:
+    """Apply the updates by cancelling and adding both sides."""
+    order_book = ExchangeOrderBook(TICKERS)
+    order_ids: Dict[tuple[str, str], List[int]] = {}
+
+    def run() -> None:
+        for ticker, owner, bid_price, bid_size, offer_price, offer_size in updates:
+            # Every update in the benchmark quotes both sides.
+            assert bid_price is not None and offer_price is not None
+            for order_id in order_ids.pop((ticker, owner), []):
+                order_book.cancel_order(ticker, order_id)
+            bid_id, _, _ = order_book.add_order(
+                ticker, Side.BUY, bid_price, bid_size, Style.LIMIT, owner=owner
+            )
+            offer_id, _, _ = order_book.add_order(
+                ticker, Side.SELL, offer_price, offer_size, Style.LIMIT, owner=owner
+            )
+            assert bid_id is not None and offer_id is not None
+            order_ids[(ticker, owner)] = [bid_id, offer_id]
+
+    return run
+
+
+def timed(func: Callable[[], None]) -> float:
+    """Time a function, with the garbage collector disabled."""
+    gc.disable()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark"""
+    updates = make_updates()
+    print(f"{UPDATES} updates, {len(TICKERS)} tickers, {len(OWNERS)} owners")
+    for name, factory in (
+            ("cancel and add", with_orders),
+            ("update_quotes", with_quotes),
+    ):
+        elapsed = min(timed(factory(updates)) for _ in range(3))
+        print(f"{name:<15} {UPDATES / elapsed:>10,.0f} updates/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark a trade which triggers many levels of stops at once.
+
+Usage:
+
+    python -m benchmarks.stops
+"""
+
+from decimal import Decimal
+import time
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+STOP_LEVELS = 500
+STOPS_PER_LEVEL = 4
+RUNS = 10
+
+
+def run() -> float:
+    """Trigger the stops, returning the time per stop."""
+    elapsed = 0.0
+    for _ in range(RUNS):
+        order_book = OrderBook(())
+        # The market gaps from the bid at 1000 to the bid at 400, triggering
+        # every stop. The stops are released as limit orders at their stop
+        # prices, above the bid, so they rest.
+        order_book.add_order(Side.BUY, Decimal(1000), 1, Style.LIMIT)
+        order_book.add_order(
+            Side.BUY,
+            Decimal(400),
+            STOP_LEVELS * STOPS_PER_LEVEL,
+            Style.LIMIT
+        )
+        for level in range(1, STOP_LEVELS + 1):
+            for _ in range(STOPS_PER_LEVEL):
+                order_book.add_order(
+                    Side.SELL,
+                    Decimal(1000 - level),
+                    1,
+                    Style.STOP
+                )
+
+        start = time.perf_counter()
+        _, fills, _ = order_book.add_order(
+            Side.SELL,
+            Decimal(1000),
+            1,
+            Style.LIMIT
+        )
+        elapsed += time.perf_counter() - start
+        assert len(fills) == 1
+        assert not order_book.stop_offers
+        assert len(order_book.offers) == STOP_LEVELS
+
+    return elapsed / (RUNS * STOP_LEVELS * STOPS_PER_LEVEL)
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{STOP_LEVELS} levels of {STOPS_PER_LEVEL} stops")
+    print(f"{run() * 1e6:.2f}us per triggered stop")
+
+
+if __name__ == '__main__':
+    main()
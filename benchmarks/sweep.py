@@ -0,0 +1,52 @@
+"""Benchmark an aggressor sweeping many small resting orders.
+
+Usage:
+
+    python -m benchmarks.sweep
+"""
+
+from decimal import Decimal
+import time
+from typing import Sequence
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+from jetblack_finance.order_book.abstract_types import PluginFactory
+from jetblack_finance.order_book.constants import ALL_PLUGINS
+
+LEVELS = 200
+ORDERS_PER_LEVEL = 50
+SWEEPS = 20
+
+
+def run(plugins: Sequence[PluginFactory]) -> float:
+    """Sweep a book of small offers, returning the time per resting order."""
+    elapsed = 0.0
+    for _ in range(SWEEPS):
+        order_book = OrderBook(plugins)
+        for level in range(LEVELS):
+            price = Decimal(100 + level)
+            for _ in range(ORDERS_PER_LEVEL):
+                order_book.add_order(Side.SELL, price, 1, Style.LIMIT)
+
+        start = time.perf_counter()
+        _, fills, _ = order_book.add_order(
+            Side.BUY,
+            Decimal(100 + LEVELS),
+            LEVELS * ORDERS_PER_LEVEL,
+            Style.LIMIT
+        )
+        elapsed += time.perf_counter() - start
+        assert len(fills) == LEVELS * ORDERS_PER_LEVEL
+
+    return elapsed / (SWEEPS * LEVELS * ORDERS_PER_LEVEL)
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"{LEVELS} levels of {ORDERS_PER_LEVEL} orders")
+    print(f"no plugins:  {run(()) * 1e6:.2f}us per fill")
+    print(f"all plugins: {run(ALL_PLUGINS) * 1e6:.2f}us per fill")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark matching throughput with decimal and integer tick prices.
+
+The books have no plugins, so only the limit order path is measured. The
+modes are run alternately, and the best of the runs of each is reported, as
+the difference between them is small against the noise of a single run.
+
+Usage:
+
+    python -m benchmarks.tick_size
+"""
+
+from decimal import Decimal
+import random
+import time
+from typing import List, Tuple
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+
+TICK_SIZE = Decimal('0.01')
+REPEATS = 5
+
+OrderArgs = Tuple[Side, Decimal, int, Style]
+
+
+def make_orders(count: int, seed: int = 42) -> List[OrderArgs]:
+    """Make a stream of limit orders around a drifting mid price."""
+    rng = random.Random(seed)
+    mid = 10000
+    orders: List[OrderArgs] = []
+    for _ in range(count):
+        mid += rng.randint(-2, 2)
+        side = rng.choice((Side.BUY, Side.SELL))
+        offset = rng.randint(-5, 50)
+        ticks = mid - offset if side == Side.BUY else mid + offset
+        orders.append(
+            (side, TICK_SIZE * ticks, rng.randint(1, 100), Style.LIMIT)
+        )
+    return orders
+
+
+def run(order_book: OrderBook, orders: List[OrderArgs]) -> Tuple[float, int]:
+    """Add the orders returning the elapsed time and the number of fills."""
+    fill_count = 0
+    start = time.perf_counter()
+    for side, price, size, style in orders:
+        _, fills, _ = order_book.add_order(side, price, size, style)
+        fill_count += len(fills)
+    return time.perf_counter() - start, fill_count
+
+
+def main() -> None:
+    """Run the benchmark"""
+    orders = make_orders(200_000)
+
+    decimal_elapsed = tick_elapsed = float('inf')
+    for _ in range(REPEATS):
+        elapsed, decimal_fills = run(OrderBook(()), orders)
+        decimal_elapsed = min(decimal_elapsed, elapsed)
+        elapsed, tick_fills = run(OrderBook((), TICK_SIZE), orders)
+        tick_elapsed = min(tick_elapsed, elapsed)
+        assert decimal_fills == tick_fills
+
+    print(f"orders: {len(orders)}, fills: {decimal_fills}")
+    print(f"decimal: {len(orders) / decimal_elapsed:,.0f} orders/s")
+    print(f"ticks:   {len(orders) / tick_elapsed:,.0f} orders/s")
+    print(f"speedup: {decimal_elapsed / tick_elapsed:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,18 +2,43 @@
 
 from .aggregate_order import AggregateOrder
 from .aggregate_order_side import AggregateOrderSide
+from .conflator import Conflator, LevelConflator, TopOfBookConflator
+from .depth_arrays import DepthArrays
 from .exchange_order_book import ExchangeOrderBook
 from .fill import Fill
+from .ladder_aggregate_order_side import LadderAggregateOrderSide
+from .lazy_aggregate_order_side import LazyAggregateOrderSide
+from .level_update import LevelUpdate
 from .order import Order, Side, Style
 from .order_book import OrderBook
+from .order_event import OrderEvent, OrderEventKind, OrderEventListener
+from .order_request import OrderRequest
+from .quote import QuoteResult, QuoteUpdate
+from .stop_order_side import StopOrderSide
+from .top_of_book import TopOfBook
 
 __all__ = [
     'AggregateOrder',
     'AggregateOrderSide',
+    'Conflator',
+    'DepthArrays',
     'ExchangeOrderBook',
     'Fill',
+    'LadderAggregateOrderSide',
+    'LazyAggregateOrderSide',
+    'LevelConflator',
+    'LevelUpdate',
     'Order',
     'OrderBook',
+    'OrderEvent',
+    'OrderEventKind',
+    'OrderEventListener',
+    'OrderRequest',
+    'QuoteResult',
+    'QuoteUpdate',
     'Side',
-    'Style'
+    'StopOrderSide',
+    'Style',
+    'TopOfBook',
+    'TopOfBookConflator'
 ]
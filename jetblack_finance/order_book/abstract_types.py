@@ -4,12 +4,18 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from decimal import Decimal
-from typing import Callable, List, Sequence
+from typing import Callable, Iterable, List, Sequence
 
 from .aggregate_order import AggregateOrder
 from .aggregate_order_side import AggregateOrderSide
+from .depth_arrays import DepthArrays
 from .fill import Fill
-from .order import Order, Side, Style
+from .level_update import LevelUpdate
+from .order import Order, Price, Side, Style
+from .order_request import OrderRequest
+from .quote import QuoteResult
+from .tick_size import TickSize
+from .top_of_book import TopOfBook
 
 
 class AbstractOrderBook(metaclass=ABCMeta):
@@ -35,6 +41,11 @@ class AbstractOrderBook(metaclass=ABCMeta):
     def stop_offers(self) -> AggregateOrderSide:
         """The stop offers"""
 
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """A number which increases whenever the book changes"""
+
     @abstractmethod
     def depth(
             self,
@@ -50,13 +61,125 @@ class AbstractOrderBook(metaclass=ABCMeta):
                 bids and offers.
         """
 
+    @abstractmethod
+    def depth_arrays(
+            self,
+            levels: int,
+            out: DepthArrays | None = None
+    ) -> DepthArrays:
+        """The best bids and offers as NumPy arrays of prices, sizes and
+        order counts, with the best level of each side first.
+
+        The arrays are filled in one pass over the levels. Passing the arrays
+        of an earlier call as `out` reuses them, so sampling the depth
+        allocates no arrays.
+
+        Args:
+            levels (int): The book depth.
+            out (DepthArrays | None, optional): The arrays to fill. Defaults
+                to None, when new arrays are allocated.
+
+        Raises:
+            ValueError: If the arrays have fewer than `levels` columns.
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            DepthArrays: The filled arrays.
+        """
+
+    @abstractmethod
+    def bbo(self) -> tuple[TopOfBook | None, TopOfBook | None]:
+        """The best bid and offer.
+
+        Unlike `depth` this does not build the levels of the book, and the
+        result is cached until the book changes.
+
+        Returns:
+            tuple[TopOfBook | None, TopOfBook | None]: The best bid and offer,
+                or None for an empty side.
+        """
+
+    @abstractmethod
+    def level_updates(self) -> List[LevelUpdate]:
+        """Take the changes to the bid and offer levels since the last call.
+
+        The prices of the levels which change are recorded as the book is
+        changed, and the size and order count of each level are read when the
+        updates are taken, so a level which changed many times is reported
+        once, and the cost depends on the number of levels which changed
+        rather than the depth of the book. A level which has been removed is
+        reported with a size and order count of 0. The updates are numbered
+        with a sequence which increases across calls.
+
+        Returns:
+            List[LevelUpdate]: The changed bid levels, then the changed offer
+                levels, each in ascending price order.
+        """
+
+    @abstractmethod
+    def size_to_price(self, side: Side, price: Decimal) -> int:
+        """The size an order could fill up to a limit price.
+
+        Args:
+            side (Side): The side of the order, so a buy is filled from the
+                offers.
+            price (Decimal): The limit price.
+
+        Raises:
+            ValueError: If the price is not a multiple of the tick size.
+
+        Returns:
+            int: The total size of the opposite levels at the price or better.
+        """
+
+    @abstractmethod
+    def cost_to_fill(self, side: Side, size: int) -> Decimal | None:
+        """The cost of filling an order of a size by sweeping the opposite
+        side, in logarithmic time in the number of levels.
+
+        Args:
+            side (Side): The side of the order, so a buy is filled from the
+                offers.
+            size (int): The size of the order.
+
+        Raises:
+            ValueError: If the size is not greater than zero.
+
+        Returns:
+            Decimal | None: The sum of the size times the price filled at each
+                level, or None if the opposite side holds less than the size.
+        """
+
+    @abstractmethod
+    def price_for_size(self, side: Side, size: int) -> Decimal | None:
+        """The worst price reached when filling an order of a size by
+        sweeping the opposite side, in logarithmic time in the number of
+        levels.
+
+        Args:
+            side (Side): The side of the order, so a buy is filled from the
+                offers.
+            size (int): The size of the order.
+
+        Raises:
+            ValueError: If the size is not greater than zero.
+
+        Returns:
+            Decimal | None: The price of the last level needed to fill the
+                size, or None if the opposite side holds less than the size.
+        """
+
     @abstractmethod
     def add_order(
             self,
             side: Side,
             price: Decimal,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Decimal | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> tuple[int | None, List[Fill], List[int]]:
         """Add an order to the order book.
 
@@ -65,21 +188,70 @@ class AbstractOrderBook(metaclass=ABCMeta):
         Any fills generated by the new order will be returned, along with any
         orders that were cancelled.
 
+        A stop order is triggered when the last trade price or the opposite
+        best price reaches its price, and then becomes a limit order at that
+        price. A stop-limit order is triggered at its stop price, and becomes
+        a limit order at its price.
+
+        An iceberg order displays its peak size, and holds the rest of its size
+        in reserve. Each time the displayed size is filled it is replenished
+        from the reserve, and moves to the back of the price level.
+
         Args:
             side (Side): Buy or sell.
             price (Decimal): The price at which the order should be executed.
             size (int): The size of the order.
+            style (Style): The order style.
+            stop_price (Decimal | None, optional): The price at which a
+                stop-limit order is triggered. Defaults to None.
+            owner (str | None, optional): The owner or session placing the
+                order, by which its orders can be cancelled together. Defaults
+                to None.
+            expiry (float | None, optional): The time at which the order is
+                removed by `expire`, or None for an order which is good until
+                cancelled. Defaults to None.
+            peak (int | None, optional): The displayed size of an iceberg
+                order. Defaults to None.
 
         Returns:
             tuple[int | None, List[Fill], List[int]]: The order id, any fills that were
             generated, and any orders that were cancelled.
+
+        Raises:
+            ValueError: If the style is not supported, or a stop price is given
+                for other than a stop-limit order, or not given for one, or
+                likewise for the peak of an iceberg order.
+        """
+
+    @abstractmethod
+    def add_orders(
+            self,
+            orders: Iterable[OrderRequest]
+    ) -> tuple[List[tuple[int | None, List[Fill], List[int]]], List[Fill], List[int]]:
+        """Add a batch of orders to the order book, in sequence.
+
+        The results are the same as adding each order with `add_order`, but
+        the orders are all validated before any are added, so an invalid
+        order leaves the book unchanged.
+
+        Args:
+            orders (Iterable[OrderRequest]): The orders.
+
+        Returns:
+            tuple[List[tuple[int | None, List[Fill], List[int]]], List[Fill], List[int]]:
+            The result of `add_order` for each order, and all the fills and
+            cancelled order ids of the batch.
+
+        Raises:
+            ValueError: If any order is invalid.
         """
 
     @abstractmethod
     def amend_order(self, order_id: int, size: int) -> None:
         """Amend the size of an order.
 
-        The size must be greater than zero.
+        The size must be greater than zero. The size of an iceberg order is
+        its total size, including its reserve.
 
         Args:
             order_id (int): The order id.
@@ -89,6 +261,76 @@ class AbstractOrderBook(metaclass=ABCMeta):
             ValueError: When the size is less than or equal to 0.
         """
 
+    @abstractmethod
+    def replace_order(
+            self,
+            order_id: int,
+            price: Decimal,
+            size: int
+    ) -> tuple[int | None, List[Fill], List[int]]:
+        """Change the price and size of an order in a single operation.
+
+        A reduction in size at the same price is an amend, and the order keeps
+        its id and its place in the queue. Otherwise the order is cancelled and
+        added as a new order, with a new id, at the back of the queue for its
+        price, and matched like an order from `add_order`. The new order keeps
+        the side, style and owner of the order, and the stop price of a
+        stop-limit order.
+
+        Args:
+            order_id (int): The order id.
+            price (Decimal): The new price.
+            size (int): The new size.
+
+        Returns:
+            tuple[int | None, List[Fill], List[int]]: The order id, any fills
+            that were generated, and any orders that were cancelled. If the new
+            order is rejected the id is None, and the replaced order is in the
+            cancelled orders.
+
+        Raises:
+            ValueError: When the size is less than or equal to 0, or the price
+                is not a multiple of the tick size.
+        """
+
+    @abstractmethod
+    def update_quote(
+            self,
+            owner: str,
+            bid_price: Decimal | None,
+            bid_size: int,
+            offer_price: Decimal | None,
+            offer_size: int
+    ) -> QuoteResult:
+        """Replace the bid and offer of an owner's quote.
+
+        A quote is a bid and an offer limit order for an owner, which are
+        replaced by each update. A side whose order is in the book with the
+        same price and size is left alone. A reduction in size at the same
+        price keeps the place of the order in the queue. Other changes replace
+        the order with a new order, and a side with no price or a size of zero
+        is withdrawn. The orders being replaced are cancelled before the new
+        orders are added and matched.
+
+        Args:
+            owner (str): The owner of the quote.
+            bid_price (Decimal | None): The bid price, or None for no bid.
+            bid_size (int): The bid size.
+            offer_price (Decimal | None): The offer price, or None for no
+                offer.
+            offer_size (int): The offer size.
+
+        Returns:
+            QuoteResult: The ids of the bid and offer orders, which are None for
+            a withdrawn side, and any fills and cancelled order ids generated by
+            the new orders.
+
+        Raises:
+            ValueError: When a size is less than 0, a price is not a multiple
+                of the tick size, or the bid price is not below the offer
+                price.
+        """
+
     @abstractmethod
     def cancel_order(self, order_id: int) -> None:
         """Cancel an order.
@@ -100,6 +342,53 @@ class AbstractOrderBook(metaclass=ABCMeta):
             ValueError: If the order cannot be found.
         """
 
+    @abstractmethod
+    def cancel_orders(
+            self,
+            side: Side | None = None,
+            owner: str | None = None,
+            style: Style | None = None,
+            min_price: Decimal | None = None,
+            max_price: Decimal | None = None
+    ) -> List[int]:
+        """Cancel all the orders which match a filter.
+
+        Only the orders which match every filter given are cancelled. Without a
+        filter every order is cancelled. Where only a side and prices are
+        given, whole price levels are removed together.
+
+        Args:
+            side (Side | None, optional): The side of the orders. Defaults to
+                None.
+            owner (str | None, optional): The owner of the orders. Defaults to
+                None.
+            style (Style | None, optional): The style of the orders. Defaults
+                to None.
+            min_price (Decimal | None, optional): The lowest price of the
+                orders. Defaults to None.
+            max_price (Decimal | None, optional): The highest price of the
+                orders. Defaults to None.
+
+        Returns:
+            List[int]: The ids of the cancelled orders, in ascending order.
+        """
+
+    @abstractmethod
+    def expire(self, now: float) -> List[int]:
+        """Cancel the orders which have expired.
+
+        The orders are held in buckets by their expiry time, so the cost is
+        proportional to the number of orders expiring, rather than the size of
+        the book.
+
+        Args:
+            now (float): The current time, on the clock of the order expiry
+                times.
+
+        Returns:
+            List[int]: The ids of the expired orders, in ascending order.
+        """
+
 
 class AbstractOrderBookManager(AbstractOrderBook):
     """An order book manager"""
@@ -108,9 +397,13 @@ class AbstractOrderBookManager(AbstractOrderBook):
     def create(
             self,
             side: Side,
-            price: Decimal,
+            price: Price,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Price | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> tuple[Order | None, List[Order]]:
         """Create aa order.
 
@@ -122,9 +415,17 @@ class AbstractOrderBookManager(AbstractOrderBook):
 
         Args:
             side (Side): The side.
-            price (Decimal): The price.
+            price (Price): The price, or count of ticks.
             size (int): The size.
             style (Style): The style.
+            stop_price (Price | None, optional): The stop price, or count of
+                ticks, of a stop order. Defaults to None.
+            owner (str | None, optional): The owner of the order. Defaults to
+                None.
+            expiry (float | None, optional): The time at which the order
+                expires. Defaults to None.
+            peak (int | None, optional): The displayed size of an iceberg
+                order. Defaults to None.
 
         Returns:
             tuple[Order | None, List[Order]]: An order or None
@@ -151,9 +452,38 @@ class AbstractOrderBookManager(AbstractOrderBook):
             order (Order): The order to delete.
         """
 
+    @abstractmethod
+    def style_count(self, side: Side, style: Style) -> int:
+        """The number of live orders of a style on a side.
+
+        Args:
+            side (Side): The side.
+            style (Style): The order style.
+
+        Returns:
+            int: The number of orders.
+        """
+
+    @abstractmethod
+    def reserve(self, order: Order) -> int:
+        """The size of an order held back from the book by a plugin.
+
+        Args:
+            order (Order): The order.
+
+        Returns:
+            int: The size which is not displayed, or 0.
+        """
+
 
 class Plugin(metaclass=ABCMeta):
-    """An abstract plugin for order book managers"""
+    """An abstract plugin for order book managers
+
+    The manager only calls the hooks a plugin overrides, and only when an order
+    of one of the plugin's `valid_styles` is being created or deleted, or is
+    live in the book. The pre-fill hook is only called when one of the orders
+    to be filled has a valid style.
+    """
 
     @property
     @abstractmethod
@@ -169,7 +499,7 @@ class Plugin(metaclass=ABCMeta):
             self,
             manager: AbstractOrderBookManager,
             side: Side,
-            price: Decimal,
+            price: Price,
             style: Style
     ) -> bool:
         """A hook called before order creation.
@@ -181,7 +511,7 @@ class Plugin(metaclass=ABCMeta):
         Args:
             manager (AbstractOrderBookManager): The manager.
             side (Side): The side.
-            price (Decimal): The price.
+            price (Price): The price, or count of ticks.
             style (Style): The style.
 
         Returns:
@@ -236,6 +566,9 @@ class Plugin(metaclass=ABCMeta):
         If the hook returns orders, these orders will be cancelled and the fill
         will be aborted.
 
+        The hook is only called when the first order of the best bid or offer
+        has one of the plugin's valid styles.
+
         Args:
             manager (AbstractOrderBookManager): The manager.
             bids (AggregateOrderSide): The bids to consider.
@@ -262,5 +595,76 @@ class Plugin(metaclass=ABCMeta):
         """
         return []
 
+    def replenish(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order
+    ) -> int:
+        """A hook called when an order has been completely filled.
+
+        If the hook returns a size greater than zero, the order is given that
+        size and moved to the back of its price level, rather than deleted.
+
+        The hook is only called when the order has one of the plugin's valid
+        styles.
+
+        Args:
+            manager (AbstractOrderBookManager): The manager.
+            order (Order): The filled order.
+
+        Returns:
+            int: The size with which to replenish the order, or 0.
+        """
+        return 0
+
+    def amend(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order,
+            size: int
+    ) -> int:
+        """A hook called before the size of an order is amended.
+
+        The size is the new total size of the order, and the hook returns the
+        part of it to display, holding back the rest.
+
+        The hook is only called when the order has one of the plugin's valid
+        styles.
+
+        Args:
+            manager (AbstractOrderBookManager): The manager.
+            order (Order): The order to amend.
+            size (int): The new total size.
+
+        Returns:
+            int: The size to display.
+        """
+        return size
+
+    def reserve(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order
+    ) -> int:
+        """A hook to find the size of an order held back from the book.
+
+        The hook is only called when the order has one of the plugin's valid
+        styles.
+
+        Args:
+            manager (AbstractOrderBookManager): The manager.
+            order (Order): The order.
+
+        Returns:
+            int: The size which is not displayed, or 0.
+        """
+        return 0
+
 
 PluginFactory = Callable[[], Plugin]
+
+SideFactory = Callable[[bool, TickSize | None], AggregateOrderSide]
+"""A factory for the limit sides of an order book.
+
+The factory is called with the `low_is_best` flag and the tick size.
+"""
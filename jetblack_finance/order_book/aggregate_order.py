@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Callable, List
+from typing import Callable, List, cast
 
-from .utils import index_of
-from .order import Order
+from .order import Order, Price
 
 
 class AggregateOrder:
@@ -18,17 +17,64 @@ class AggregateOrder:
 
     Orders at the beginning were placed before later orders, and should be
     executed first.
+
+    The orders are held in an ordered dictionary keyed by order id. This is a
+    doubly linked list indexed by the order id, so orders can be appended,
+    found, amended and removed from anywhere in the queue in constant time,
+    while iteration remains in time priority.
+
+    The aggregate size is maintained as orders are added, filled, amended and
+    cancelled, so the size of a level can be read in constant time. For this
+    reason the size of an order in an aggregate order should only be changed
+    through the aggregate order.
     """
 
-    def __init__(self, order: Order) -> None:
+    def __init__(
+            self,
+            order: Order,
+            price: Price | None = None,
+            key: Price | None = None
+    ) -> None:
         """Initialise an aggregate order with the first order.
 
         Args:
             order (Order): The order with which to start the
                 aggregate order.
+            price (Price | None, optional): The decimal price of the level
+                when the order price is held in ticks. Defaults to None.
+            key (Price | None, optional): The price with which the level is
+                compared, if not the order price. Defaults to None.
         """
-        self._price = order.price
-        self._orders = deque([order])
+        self._key = order.price if key is None else key
+        # Without a tick size the order price is the decimal price.
+        self._price = cast(Decimal, order.price if price is None else price)
+        self._orders: OrderedDict[int, Order] = OrderedDict(
+            ((order.order_id, order),)
+        )
+        self._size = order.size
+
+    def reset(
+            self,
+            order: Order,
+            price: Price | None = None,
+            key: Price | None = None
+    ) -> None:
+        """Reinitialise a removed aggregate order with a new first order,
+        reusing its order queue.
+
+        Args:
+            order (Order): The order with which to start the
+                aggregate order.
+            price (Price | None, optional): The decimal price of the level
+                when the order price is held in ticks. Defaults to None.
+            key (Price | None, optional): The price with which the level is
+                compared, if not the order price. Defaults to None.
+        """
+        self._key = order.price if key is None else key
+        self._price = cast(Decimal, order.price if price is None else price)
+        self._orders.clear()
+        self._orders[order.order_id] = order
+        self._size = order.size
 
     @property
     def price(self) -> Decimal:
@@ -39,15 +85,32 @@ class AggregateOrder:
         """
         return self._price
 
+    @property
+    def key(self) -> Price:
+        """The price with which the orders in the level are compared.
+
+        This is the price of the orders, which is the count of ticks when the
+        order book has a tick size.
+
+        Returns:
+            Price: The price or count of ticks.
+        """
+        return self._key
+
     @property
     def size(self) -> int:
         """The aggregate size of the order."""
-        return sum(order.size for order in self._orders)
+        return self._size
+
+    @property
+    def count(self) -> int:
+        """The number of orders at the price level."""
+        return len(self._orders)
 
     @property
     def first(self) -> Order:
         """The first order to process."""
-        return self._orders[0]
+        return next(iter(self._orders.values()))
 
     @property
     def orders(self) -> List[Order]:
@@ -56,11 +119,30 @@ class AggregateOrder:
         Returns:
             List[Order]: A list of the orders.
         """
-        return list(self._orders)
+        return list(self._orders.values())
 
     def delete_first(self) -> None:
         """Delete the first order"""
-        del self._orders[0]
+        _, order = self._orders.popitem(last=False)
+        self._size -= order.size
+
+    def fill_first(self, size: int) -> Order:
+        """Reduce the size of the first order by a filled size.
+
+        If the first order is completely filled it is removed.
+
+        Args:
+            size (int): The filled size.
+
+        Returns:
+            Order: The first order.
+        """
+        order = next(iter(self._orders.values()))
+        order.size -= size
+        self._size -= size
+        if order.size == 0:
+            del self._orders[order.order_id]
+        return order
 
     def append(self, order: Order) -> None:
         """Add a new order at the price level of this aggregate order.
@@ -68,8 +150,10 @@ class AggregateOrder:
         Args:
             order (Order): The new order.
         """
-        assert order.price == self.price, "aggregate orders must be the same price"
-        self._orders.append(order)
+        assert self.key in (order.price, order.stop_price), \
+            "aggregate orders must be the same price"
+        self._orders[order.order_id] = order
+        self._size += order.size
 
     def change_size(self, order_id: int, size: int) -> None:
         """Change the size of an order in the aggregate order.
@@ -92,11 +176,12 @@ class AggregateOrder:
         """
         if size <= 0:
             raise ValueError("changes is size must be >= 0")
-        index = index_of(self._orders, lambda x: x.order_id == order_id)
-        if index == -1:
+        order = self._orders.get(order_id)
+        if order is None:
             raise KeyError("order not found")
 
-        self._orders[index].size = size
+        self._size += size - order.size
+        order.size = size
 
     def cancel(self, order_id: int) -> None:
         """Cancel and order.
@@ -107,11 +192,11 @@ class AggregateOrder:
         Raises:
             KeyError: If the order is not in the aggregate order.
         """
-        index = index_of(self._orders, lambda x: x.order_id == order_id)
-        if index == -1:
+        order = self._orders.pop(order_id, None)
+        if order is None:
             raise KeyError("order not found")
 
-        del self._orders[index]
+        self._size -= order.size
 
     def find_all(self, predicate: Callable[[Order], bool]) -> List[Order]:
         """Find orders which match a predicate.
@@ -124,7 +209,7 @@ class AggregateOrder:
         """
         return [
             order
-            for order in self._orders
+            for order in self._orders.values()
             if predicate(order)
         ]
 
@@ -142,10 +227,10 @@ class AggregateOrder:
         return len(self._orders)
 
     def __contains__(self, order_id: int) -> bool:
-        return any(x.order_id == order_id for x in self._orders)
+        return order_id in self._orders
 
     def __repr__(self) -> str:
-        return f"AggregateOrder({self._orders})"
+        return f"AggregateOrder({list(self._orders.values())})"
 
     def __str__(self) -> str:
         return f"{self.price}x{self.size}"
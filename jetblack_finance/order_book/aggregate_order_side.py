@@ -1,12 +1,16 @@
 """Aggregate order side"""
 
-from collections import deque
-from itertools import islice
-from typing import Deque, Sequence
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, cast
 
 from .aggregate_order import AggregateOrder
-from .order import Order
-from .utils import index_of
+from .level_tree import LevelTree
+from .object_pool import ObjectPool
+from .order import Order, Price
+from .tick_size import TickSize
 
 
 class AggregateOrderSide:
@@ -14,49 +18,106 @@ class AggregateOrderSide:
 
     This class handles side specific logic, in particular which orders are
     "best"; higher for bids, lower for offers.
+
+    The price levels are held in a list sorted from the worst to the best
+    price, with a parallel list of sort keys which can be searched with
+    `bisect`. Where low prices are best the key is the negated price, so the
+    best price level is always at the end of the list, and can be added or
+    removed without moving the other levels. A dictionary maps each price to
+    its level, so existing levels are found without a search.
+
+    When the side has a tick size the order prices are counts of ticks, and
+    the decimal price of a level is calculated once when the level is created.
+
+    If the side is given an object pool, levels are created from and released
+    to the pool.
+
+    The cumulative size to a price is answered from a `LevelTree` of the
+    levels other than the best, which is built when it is first needed and
+    then kept up to date in logarithmic time as levels are added, removed or
+    resized. Fills only change the size of the best level, which is read
+    directly, so matching never updates the tree. The tree also totals the
+    notionals of the levels, the size times the price, so the cost and the
+    price reached by sweeping a size are found by descending the tree.
     """
 
-    def __init__(self, low_is_best: bool) -> None:
+    def __init__(
+            self,
+            low_is_best: bool,
+            tick_size: TickSize | None = None
+    ) -> None:
         """Initialise an aggregate order side.
 
         Args:
-            side (Side): The side.
+            low_is_best (bool): If True lower prices are better (offers);
+                otherwise higher prices are better (bids).
+            tick_size (TickSize | None, optional): The tick size if order
+                prices are held in ticks. Defaults to None.
         """
         self._low_is_best = low_is_best
-        self._orders: Deque[AggregateOrder] = deque()
+        self._tick_size = tick_size
+        self._keys: List[Any] = []
+        self._levels: List[AggregateOrder] = []
+        self._index: Dict[Price, AggregateOrder] = {}
+        self.pool: ObjectPool | None = None
+        # The tree of the levels below the best level, or None until it is
+        # first needed.
+        self._tree: LevelTree | None = None
+
+    def _sort_key(self, price: Price) -> Any:
+        return -price if self._low_is_best else price
 
     def depth(self, levels: int | None) -> Sequence[AggregateOrder]:
         """Return the orders for the side.
 
+        The orders are returned in ascending price order.
+
         Args:
             levels (int | None): The market depth to return.
 
         Returns:
             Sequence[AggregateOrder]: The orders.
         """
-        if levels is None:
-            return self._orders
-        levels = min(levels, len(self._orders))
-        if self._low_is_best:
-            return tuple(islice(self._orders, 0, levels))
-        else:
-            return tuple(islice(
-                self._orders,
-                len(self._orders) - levels,
-                len(self._orders)
-            ))
+        orders = (
+            self._levels if levels is None
+            else self._levels[len(self._levels) - min(levels, len(self._levels)):]
+        )
+        return tuple(reversed(orders)) if self._low_is_best else tuple(orders)
+
+    def iter_levels(self) -> Iterator[AggregateOrder]:
+        """Iterate over the price levels from the best to the worst, without
+        copying them.
+
+        Returns:
+            Iterator[AggregateOrder]: The price levels.
+        """
+        return reversed(self._levels)
 
     @property
     def best(self) -> AggregateOrder:
         """Get the order at the best price level."""
-        return self._orders[0] if self._low_is_best else self._orders[-1]
+        return self._levels[-1]
+
+    def level(self, price: Price) -> AggregateOrder | None:
+        """Find the price level for a price.
+
+        Args:
+            price (Price): The price, or count of ticks.
+
+        Returns:
+            AggregateOrder | None: The price level, or None if there are no
+                orders at the price.
+        """
+        return self._index.get(price)
 
     def delete_best(self) -> None:
         """Delete the order at the best price level."""
-        if self._low_is_best:
-            del self._orders[0]
-        else:
-            del self._orders[-1]
+        self._keys.pop()
+        aggregate_order = self._levels.pop()
+        self._promote_level()
+        del self._index[aggregate_order.key]
+        if self.pool is not None:
+            self.pool.release(aggregate_order)
 
     def add_order(self, order: Order) -> None:
         """Add an order.
@@ -64,21 +125,44 @@ class AggregateOrderSide:
         Args:
             order (Order): The order.
         """
-        # Find where the order should go.
-        index = index_of(
-            self._orders,
-            lambda x: x.price >= order.price
-        )
-        if index == -1:
-            # Add new highest price level.
-            self._orders.append(AggregateOrder(order))
-        elif self._orders[index].price == order.price:
+        aggregate_order = self._index.get(order.price)
+        if aggregate_order is not None:
             # Add the order to an existing price level. Adding to the end
-            # means newer orders are executed first (time weighted).
-            self._orders[index].append(order)
+            # means older orders are executed first (time weighted).
+            aggregate_order.append(order)
+            if self._tree is not None:
+                self._update_size(aggregate_order, order.size)
+            return
+
+        # Insert a new price level.
+        self._insert_level(self._create_level(order))
+
+    def _create_level(self, order: Order) -> AggregateOrder:
+        price = (
+            None if self._tick_size is None
+            else self._tick_size.to_price(cast(int, order.price))
+        )
+        return (
+            AggregateOrder(order, price) if self.pool is None
+            else self.pool.create_level(order, price)
+        )
+
+    def _insert_level(self, aggregate_order: AggregateOrder) -> None:
+        self._index[aggregate_order.key] = aggregate_order
+        key = self._sort_key(aggregate_order.key)
+        if not self._keys or key > self._keys[-1]:
+            # The new level is the best level, and the old best level joins the
+            # tree.
+            if self._tree is not None and self._levels:
+                self._tree.insert(self._keys[-1], self._levels[-1])
+            self._keys.append(key)
+            self._levels.append(aggregate_order)
         else:
-            # Insert a new lowest price level
-            self._orders.insert(index, AggregateOrder(order))
+            index = bisect_left(self._keys, key)
+            self._keys.insert(index, key)
+            self._levels.insert(index, aggregate_order)
+            if self._tree is not None:
+                self._tree.insert(key, aggregate_order)
 
     def amend_order(self, order: Order, size: int) -> None:
         """Amend an order.
@@ -90,16 +174,14 @@ class AggregateOrderSide:
         Raises:
             ValueError: If there are no orders at the price.
         """
-        # Find the position of the order in the aggregate orders.
-        index = index_of(
-            self._orders,
-            lambda x: x.price == order.price
-        )
-        if index == -1:
+        aggregate_order = self._index.get(order.price)
+        if aggregate_order is None:
             raise ValueError("no order at this price")
 
         # Change the size.
-        self._orders[index].change_size(order.order_id, size)
+        if self._tree is not None:
+            self._update_size(aggregate_order, size - order.size)
+        aggregate_order.change_size(order.order_id, size)
 
     def cancel_order(self, order: Order) -> None:
         """Cancel an order.
@@ -110,29 +192,222 @@ class AggregateOrderSide:
         Raises:
             KeyError: If the order is not in this side.
         """
-        index = index_of(
-            self._orders,
-            lambda x: x.price == order.price
-        )
-        if index == -1:
+        aggregate_order = self._index.get(order.price)
+        if aggregate_order is None:
             raise KeyError("The aggregate order could not be found")
 
-        aggregate_order = self._orders[index]
         aggregate_order.cancel(order.order_id)
         if len(aggregate_order) == 0:
             # If there are no orders left at this price level, delete the
             # aggregate order.
-            del self._orders[index]
+            self._delete_level(aggregate_order)
+            if self.pool is not None:
+                self.pool.release(aggregate_order)
+        elif self._tree is not None:
+            self._update_size(aggregate_order, -order.size)
+
+    def _delete_level(self, aggregate_order: AggregateOrder) -> None:
+        if aggregate_order is self._levels[-1]:
+            index = len(self._levels) - 1
+            del self._keys[index]
+            del self._levels[index]
+            self._promote_level()
+        else:
+            key = self._sort_key(aggregate_order.key)
+            index = bisect_left(self._keys, key)
+            del self._keys[index]
+            del self._levels[index]
+            if self._tree is not None:
+                self._tree.remove(key)
+        del self._index[aggregate_order.key]
+
+    def _promote_level(self) -> None:
+        # The best level has been removed, so the level below it, which is the
+        # new best level, leaves the tree.
+        if self._tree is not None and self._levels:
+            self._tree.remove(self._keys[-1])
+
+    def cancel_levels(
+            self,
+            low: Price | None,
+            high: Price | None
+    ) -> List[Order]:
+        """Remove the price levels in a range of prices.
+
+        As the levels are sorted, the levels in the range are removed together
+        with a single slice.
+
+        Args:
+            low (Price | None): The lowest price, or count of ticks, or None
+                for no lower limit.
+            high (Price | None): The highest price, or count of ticks, or None
+                for no upper limit.
+
+        Returns:
+            List[Order]: The orders of the removed levels.
+        """
+        # The worst price is the first sort key.
+        worst, best = (high, low) if self._low_is_best else (low, high)
+        start = (
+            0 if worst is None
+            else bisect_left(self._keys, self._sort_key(worst))
+        )
+        end = (
+            len(self._keys) if best is None
+            else bisect_right(self._keys, self._sort_key(best))
+        )
+        return self._remove_levels(start, end)
+
+    def _remove_levels(self, start: int, end: int) -> List[Order]:
+        # Remove a slice of the levels, returning their orders from the best
+        # level.
+        if start >= end:
+            return []
+
+        levels = self._levels[start:end]
+        keys = self._keys[start:end]
+        best_removed = end == len(self._levels)
+        del self._keys[start:end]
+        del self._levels[start:end]
+        if self._tree is not None:
+            # The best level is not in the tree.
+            for key in keys[:-1] if best_removed else keys:
+                self._tree.remove(key)
+            if best_removed:
+                self._promote_level()
+
+        orders: List[Order] = []
+        for aggregate_order in reversed(levels):
+            del self._index[aggregate_order.key]
+            orders += aggregate_order.orders
+            if self.pool is not None:
+                self.pool.release(aggregate_order)
+        return orders
+
+    def size_to_price(self, price: Price) -> int:
+        """The total size of the orders at a price or better.
+
+        This is the size available to an order at the price on the other side.
+
+        Args:
+            price (Price): The price, or count of ticks.
+
+        Returns:
+            int: The total size of the levels at the price or better.
+        """
+        key = self._sort_key(price)
+        if not self._keys or self._keys[-1] < key:
+            return 0
+        return self._levels[-1].size + self._level_tree().size_from(key)
+
+    def cost_to_fill(self, size: int) -> Decimal | None:
+        """The cost of filling a size from the best levels.
+
+        This is the notional an order on the other side would trade if it
+        swept the side for the size.
+
+        Args:
+            size (int): The size.
+
+        Raises:
+            ValueError: If the size is not greater than zero.
+
+        Returns:
+            Decimal | None: The sum of the size times the price taken from each
+                level, or None if the side holds less than the size.
+        """
+        notional, _, unfilled = self._sweep(size)
+        if unfilled:
+            return None
+        return (
+            cast(Decimal, notional) if self._tick_size is None
+            else notional * self._tick_size.tick_size
+        )
+
+    def price_for_size(self, size: int) -> Decimal | None:
+        """The worst price reached when filling a size from the best levels.
+
+        Args:
+            size (int): The size.
+
+        Raises:
+            ValueError: If the size is not greater than zero.
+
+        Returns:
+            Decimal | None: The price of the last level needed to fill the size,
+                or None if the side holds less than the size.
+        """
+        _, last, unfilled = self._sweep(size)
+        if unfilled:
+            return None
+        return cast(AggregateOrder, last).price
+
+    def _sweep(self, size: int) -> tuple[Price, AggregateOrder | None, int]:
+        # Take a size from the levels, best first, returning the notional
+        # taken, the last level reached, and the size which was not filled.
+        if size <= 0:
+            raise ValueError("the size must be greater than 0")
+        if not self._levels:
+            return 0, None, size
+        best = self._levels[-1]
+        if size <= best.size:
+            return size * best.key, best, 0
+
+        notional, last, unfilled = self._level_tree().sweep(size - best.size)
+        return (
+            best.size * best.key + notional,
+            best if last is None else last,
+            unfilled
+        )
+
+    @classmethod
+    def _walk(
+            cls,
+            levels: Iterable[AggregateOrder],
+            size: int,
+            notional: Price = 0,
+            last: AggregateOrder | None = None
+    ) -> tuple[Price, AggregateOrder | None, int]:
+        # Take a size from levels ordered from the best, as `_sweep`.
+        for aggregate_order in levels:
+            last = aggregate_order
+            if size <= aggregate_order.size:
+                return notional + size * aggregate_order.key, last, 0
+            size -= aggregate_order.size
+            notional += aggregate_order.size * aggregate_order.key
+        return notional, last, size
+
+    def _level_tree(self) -> LevelTree:
+        # The tree of the levels below the best, built in linear time when it
+        # is first needed.
+        if self._tree is None:
+            self._tree = LevelTree(
+                zip(self._keys[:-1], self._levels[:-1])
+            )
+        return self._tree
+
+    def _update_size(self, aggregate_order: AggregateOrder, delta: int) -> None:
+        # The size of the best level is read directly.
+        if aggregate_order is self._levels[-1]:
+            return
+        cast(LevelTree, self._tree).update(
+            self._sort_key(aggregate_order.key),
+            delta,
+            delta * aggregate_order.key
+        )
 
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, AggregateOrderSide) and
-            self._orders == other._orders
+            self.depth(None) == other.depth(None)
         )
 
     def __bool__(self) -> bool:
         """A side is True if it has orders; otherwise False."""
-        return bool(self._orders)
+        return bool(self._levels)
+
+    def __len__(self) -> int:
+        return len(self._levels)
 
     def __repr__(self) -> str:
         return f"OrderBook({self._low_is_best}) {{{str(self)}}}"
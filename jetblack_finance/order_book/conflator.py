@@ -0,0 +1,160 @@
+"""Conflation of market data for slow consumers"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Dict, Generic, List, Mapping, Sequence, TypeVar
+
+from .level_update import LevelUpdate
+from .order import Side
+from .top_of_book import TopOfBook
+
+T = TypeVar('T')
+
+BestBidOffer = tuple[TopOfBook | None, TopOfBook | None]
+
+
+class Conflator(ABC, Generic[T]):
+    """The base class for conflators.
+
+    A conflator keeps the latest state of each key it is given, and releases
+    one merged update per key when it is flushed, so a slow consumer receives
+    the state of the book rather than every change to it. The updates are
+    released by calling `flush` on demand, or by calling `poll` with the
+    current time, which flushes once every interval.
+    """
+
+    def __init__(self, interval: float | None = None) -> None:
+        """Initialise the conflator.
+
+        Args:
+            interval (float | None, optional): The time between flushes by
+                `poll`, on the clock of the times passed to it. Defaults to
+                None, when `poll` never flushes.
+
+        Raises:
+            ValueError: If the interval is not greater than zero.
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError("the interval must be greater than 0")
+        self._interval = interval
+        self._next_flush: float | None = None
+
+    @property
+    def interval(self) -> float | None:
+        """The time between flushes by `poll`.
+
+        Returns:
+            float | None: The interval, or None if `poll` never flushes.
+        """
+        return self._interval
+
+    def poll(self, now: float) -> Dict[str, T]:
+        """Flush the conflated updates if the interval has passed since the
+        last flush by `poll`.
+
+        The first call flushes.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            Dict[str, T]: The updates of each ticker, or an empty dict if the
+                interval has not passed.
+        """
+        if self._interval is None or (
+                self._next_flush is not None and now < self._next_flush
+        ):
+            return {}
+        self._next_flush = now + self._interval
+        return self.flush()
+
+    @abstractmethod
+    def flush(self) -> Dict[str, T]:
+        """Take the conflated updates.
+
+        Returns:
+            Dict[str, T]: The updates of each ticker with updates.
+        """
+
+
+class LevelConflator(Conflator[List[LevelUpdate]]):
+    """A conflator which keeps the latest update of each price level.
+
+    The level updates of an `ExchangeOrderBook` are passed to `update` after
+    every change, and a flush returns the latest update of each (ticker, side,
+    price) in the order of `level_updates`. An update keeps the sequence
+    number it was given, so a consumer sees the gaps where updates were
+    conflated. A level added and removed between flushes is reported as
+    removed.
+    """
+
+    def __init__(self, interval: float | None = None) -> None:
+        """Initialise the level conflator.
+
+        Args:
+            interval (float | None, optional): The time between flushes by
+                `poll`, on the clock of the times passed to it. Defaults to
+                None, when `poll` never flushes.
+        """
+        super().__init__(interval)
+        self._levels: Dict[str, Dict[tuple[Side, Decimal], LevelUpdate]] = {}
+
+    def update(self, updates: Mapping[str, Sequence[LevelUpdate]]) -> None:
+        """Add level updates, replacing the earlier updates of their levels.
+
+        Args:
+            updates (Mapping[str, Sequence[LevelUpdate]]): The level updates of
+                each ticker, as returned by `ExchangeOrderBook.level_updates`.
+        """
+        for ticker, ticker_updates in updates.items():
+            levels = self._levels.get(ticker)
+            if levels is None:
+                levels = self._levels[ticker] = {}
+            for update in ticker_updates:
+                levels[(update.side, update.price)] = update
+
+    def flush(self) -> Dict[str, List[LevelUpdate]]:
+        levels, self._levels = self._levels, {}
+        return {
+            ticker: sorted(
+                ticker_levels.values(),
+                key=lambda update: (update.side != Side.BUY, update.price)
+            )
+            for ticker, ticker_levels in levels.items()
+        }
+
+
+class TopOfBookConflator(Conflator[BestBidOffer]):
+    """A conflator which keeps the latest best bid and offer of each ticker.
+
+    The best bid and offer of a book are passed to `update` after every
+    change, and a flush returns the latest of each ticker which was updated
+    since the last flush, whether or not it differs from the last flushed.
+    """
+
+    def __init__(self, interval: float | None = None) -> None:
+        """Initialise the top of book conflator.
+
+        Args:
+            interval (float | None, optional): The time between flushes by
+                `poll`, on the clock of the times passed to it. Defaults to
+                None, when `poll` never flushes.
+        """
+        super().__init__(interval)
+        self._bbos: Dict[str, BestBidOffer] = {}
+
+    def update(self, ticker: str, bbo: BestBidOffer) -> None:
+        """Set the best bid and offer of a ticker.
+
+        Args:
+            ticker (str): The ticker.
+            bbo (BestBidOffer): The best bid and offer, as returned by
+                `OrderBook.bbo`.
+        """
+        self._bbos[ticker] = bbo
+
+    def flush(self) -> Dict[str, BestBidOffer]:
+        bbos, self._bbos = self._bbos, {}
+        return bbos
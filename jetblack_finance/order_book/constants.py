@@ -5,6 +5,7 @@ from typing import Sequence
 from .plugins import (
     BookOrCancelPlugin,
     FillOrKillPlugin,
+    IcebergPlugin,
     ImmediateOrCancelPlugin
 )
 
@@ -13,5 +14,6 @@ from .abstract_types import PluginFactory
 ALL_PLUGINS: Sequence[PluginFactory] = (
     BookOrCancelPlugin,
     FillOrKillPlugin,
+    IcebergPlugin,
     ImmediateOrCancelPlugin
 )
@@ -0,0 +1,104 @@
+"""Depth arrays"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+
+from .aggregate_order import AggregateOrder
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+class DepthArrays(NamedTuple):
+    """The depth of a book as NumPy arrays.
+
+    Row 0 of each array holds the bids and row 1 the offers, with the best
+    level in column 0. The number of levels of each side which were filled
+    is held in `lengths`, and the columns beyond them have a price of NaN and
+    a size and count of 0.
+
+    NumPy is an optional dependency, which is only required to create the
+    arrays.
+    """
+
+    prices: Any
+    sizes: Any
+    counts: Any
+    lengths: Any
+
+    @classmethod
+    def empty(cls, levels: int) -> DepthArrays:
+        """Allocate arrays for the depth of a book.
+
+        Args:
+            levels (int): The number of levels of each side.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            DepthArrays: The arrays.
+        """
+        if np is None:
+            raise ImportError("depth arrays require numpy")
+        return cls(
+            np.full((2, levels), np.nan),
+            np.zeros((2, levels), dtype=np.int64),
+            np.zeros((2, levels), dtype=np.int64),
+            np.zeros(2, dtype=np.int64)
+        )
+
+    @property
+    def levels(self) -> int:
+        """The number of levels of each side the arrays can hold.
+
+        Returns:
+            int: The number of levels.
+        """
+        return self.prices.shape[1]
+
+    def fill(
+            self,
+            bids: Iterable[AggregateOrder],
+            offers: Iterable[AggregateOrder],
+            ticks_per_unit: int | None = None
+    ) -> None:
+        """Fill the arrays from the levels of a book in a single pass.
+
+        Args:
+            bids (Iterable[AggregateOrder]): The bids, best first.
+            offers (Iterable[AggregateOrder]): The offers, best first.
+            ticks_per_unit (int | None, optional): The whole number of ticks
+                in a unit of price, if the levels are keyed by ticks, when the
+                prices are calculated from the keys. Defaults to None.
+        """
+        lengths = memoryview(self.lengths)
+        for row, levels in enumerate((bids, offers)):
+            # The values are written through memory views of the rows, which
+            # is faster than assigning to the elements of the arrays.
+            prices: Any = memoryview(self.prices[row])
+            sizes = memoryview(self.sizes[row])
+            counts = memoryview(self.counts[row])
+            length = 0
+            if ticks_per_unit is None:
+                for level in levels:
+                    prices[length] = float(level.price)
+                    sizes[length] = level.size
+                    counts[length] = level.count
+                    length += 1
+            else:
+                for level in levels:
+                    prices[length] = level.key / ticks_per_unit
+                    sizes[length] = level.size
+                    counts[length] = level.count
+                    length += 1
+            # Only the columns filled by the last call need clearing.
+            last_length = lengths[row]
+            if length < last_length:
+                self.prices[row, length:last_length] = np.nan
+                self.sizes[row, length:last_length] = 0
+                self.counts[row, length:last_length] = 0
+            lengths[row] = length
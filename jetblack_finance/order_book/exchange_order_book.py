@@ -1,13 +1,20 @@
 """Exchange Order Book"""
 
 from decimal import Decimal
-from typing import Dict, Iterable, List, Sequence
+from functools import partial
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence
 
-from .abstract_types import PluginFactory
+from .abstract_types import PluginFactory, SideFactory
+from .aggregate_order_side import AggregateOrderSide
 from .constants import ALL_PLUGINS
 from .fill import Fill
+from .level_update import LevelUpdate
 from .order import Side, Style
 from .order_book import OrderBook
+from .order_event import OrderEvent
+from .order_request import OrderRequest
+from .quote import QuoteResult, QuoteUpdate
 
 
 class ExchangeOrderBook:
@@ -19,17 +26,50 @@ class ExchangeOrderBook:
     def __init__(
             self,
             tickers: Iterable[str],
-            plugins: Sequence[PluginFactory] = ALL_PLUGINS
+            plugins: Sequence[PluginFactory] = ALL_PLUGINS,
+            tick_sizes: Mapping[str, Decimal] | None = None,
+            side_factories: Mapping[str, SideFactory] | None = None,
+            pooling: bool = False,
+            ticker_plugins: Mapping[str, Sequence[PluginFactory]] | None = None,
+            listener: Callable[[str, List[OrderEvent]], None] | None = None
     ) -> None:
         """Initialise the exchange order book.
 
+        The order events of all the tickers are numbered from a single
+        sequence, so they can be merged into one stream.
+
         Args:
             tickers (Iterable[str]): The tickers for which order books are kept.
             plugins (Sequence[PluginFactory], Optional): The plugins. Defaults
                 to `ALL_PLUGINS`.
+            tick_sizes (Mapping[str, Decimal] | None, optional): The tick sizes
+                of tickers which should hold prices as integer ticks. Defaults
+                to None.
+            side_factories (Mapping[str, SideFactory] | None, optional): The
+                factories for the bid and offer sides of tickers which should
+                not use `AggregateOrderSide`. Defaults to None.
+            pooling (bool, optional): If True the order books reuse orders and
+                price levels. Defaults to False.
+            ticker_plugins (Mapping[str, Sequence[PluginFactory]] | None,
+                optional): The plugins of tickers which should not use
+                `plugins`. Defaults to None.
+            listener (Callable[[str, List[OrderEvent]], None] | None,
+                optional): The listener for the order events of each ticker.
+                Defaults to None.
         """
+        tick_sizes = tick_sizes or {}
+        side_factories = side_factories or {}
+        ticker_plugins = ticker_plugins or {}
+        sequence = count(1)
         self.books: Dict[str, OrderBook] = {
-            ticker: OrderBook(plugins)
+            ticker: OrderBook(
+                ticker_plugins.get(ticker, plugins),
+                tick_sizes.get(ticker),
+                side_factories.get(ticker, AggregateOrderSide),
+                pooling,
+                None if listener is None else partial(listener, ticker),
+                sequence
+            )
             for ticker in tickers
         }
 
@@ -39,7 +79,11 @@ class ExchangeOrderBook:
             side: Side,
             price: Decimal,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Decimal | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> tuple[int | None, List[Fill], List[int]]:
         """Add an order for a ticker.
 
@@ -49,6 +93,14 @@ class ExchangeOrderBook:
             price (Decimal): The price at which the order should be executed.
             size (int): The size of the order.
             style (Style): The order style.
+            stop_price (Decimal | None, optional): The price at which a
+                stop-limit order is triggered. Defaults to None.
+            owner (str | None, optional): The owner or session placing the
+                order. Defaults to None.
+            expiry (float | None, optional): The time at which the order
+                expires. Defaults to None.
+            peak (int | None, optional): The displayed size of an iceberg
+                order. Defaults to None.
 
         Returns:
             tuple[int | None, List[Fill], List[int]]: The id of the order (if
@@ -56,7 +108,38 @@ class ExchangeOrderBook:
             list of cancelled order ids.
         """
         order_book = self.books[ticker]
-        return order_book.add_order(side, price, size, style)
+        return order_book.add_order(
+            side,
+            price,
+            size,
+            style,
+            stop_price,
+            owner,
+            expiry,
+            peak
+        )
+
+    def add_orders(
+            self,
+            ticker: str,
+            orders: Iterable[OrderRequest]
+    ) -> tuple[List[tuple[int | None, List[Fill], List[int]]], List[Fill], List[int]]:
+        """Add a batch of orders for a ticker, in sequence.
+
+        The results are the same as adding each order with `add_order`, but
+        the orders are all validated before any are added.
+
+        Args:
+            ticker (str): The ticker.
+            orders (Iterable[OrderRequest]): The orders.
+
+        Returns:
+            tuple[List[tuple[int | None, List[Fill], List[int]]], List[Fill], List[int]]:
+            The result of `add_order` for each order, and all the fills and
+            cancelled order ids of the batch.
+        """
+        order_book = self.books[ticker]
+        return order_book.add_orders(orders)
 
     def amend_order(self, ticker: str, order_id: int, size: int) -> None:
         """Amend aa order.
@@ -69,6 +152,57 @@ class ExchangeOrderBook:
         order_book = self.books[ticker]
         order_book.amend_order(order_id, size)
 
+    def replace_order(
+            self,
+            ticker: str,
+            order_id: int,
+            price: Decimal,
+            size: int
+    ) -> tuple[int | None, List[Fill], List[int]]:
+        """Change the price and size of an order.
+
+        Args:
+            ticker (str): The ticker.
+            order_id (int): The id of the order.
+            price (Decimal): The new price.
+            size (int): The new size.
+
+        Returns:
+            tuple[int | None, List[Fill], List[int]]: The id of the order,
+            which is new unless the order was reduced at the same price, any
+            fills that were generated, and a list of cancelled order ids.
+        """
+        order_book = self.books[ticker]
+        return order_book.replace_order(order_id, price, size)
+
+    def update_quotes(
+            self,
+            updates: Iterable[QuoteUpdate]
+    ) -> List[QuoteResult]:
+        """Apply a batch of quote updates, across tickers, in sequence.
+
+        Each update replaces the bid and offer of an owner's quote for a
+        ticker, as `OrderBook.update_quote`. Sides which are unchanged are
+        skipped.
+
+        Args:
+            updates (Iterable[QuoteUpdate]): The quote updates.
+
+        Returns:
+            List[QuoteResult]: The order ids, fills and cancels of each update.
+        """
+        books = self.books
+        return [
+            books[ticker].update_quote(
+                owner,
+                bid_price,
+                bid_size,
+                offer_price,
+                offer_size
+            )
+            for ticker, owner, bid_price, bid_size, offer_price, offer_size in updates
+        ]
+
     def cancel_order(self, ticker: str, order_id: int) -> None:
         """Cancel an order.
 
@@ -78,3 +212,82 @@ class ExchangeOrderBook:
         """
         order_book = self.books[ticker]
         order_book.cancel_order(order_id)
+
+    def cancel_orders(
+            self,
+            tickers: Iterable[str] | None = None,
+            side: Side | None = None,
+            owner: str | None = None,
+            style: Style | None = None,
+            min_price: Decimal | None = None,
+            max_price: Decimal | None = None
+    ) -> Dict[str, List[int]]:
+        """Cancel all the orders which match a filter, for example all the
+        orders of an owner which has disconnected.
+
+        Args:
+            tickers (Iterable[str] | None, optional): The tickers, or None for
+                all tickers. Defaults to None.
+            side (Side | None, optional): The side of the orders. Defaults to
+                None.
+            owner (str | None, optional): The owner of the orders. Defaults to
+                None.
+            style (Style | None, optional): The style of the orders. Defaults
+                to None.
+            min_price (Decimal | None, optional): The lowest price of the
+                orders. Defaults to None.
+            max_price (Decimal | None, optional): The highest price of the
+                orders. Defaults to None.
+
+        Returns:
+            Dict[str, List[int]]: The ids of the cancelled orders of each ticker
+                with cancelled orders.
+        """
+        cancels: Dict[str, List[int]] = {}
+        for ticker in self.books if tickers is None else tickers:
+            order_ids = self.books[ticker].cancel_orders(
+                side,
+                owner,
+                style,
+                min_price,
+                max_price
+            )
+            if order_ids:
+                cancels[ticker] = order_ids
+        return cancels
+
+    def expire(self, now: float) -> Dict[str, List[int]]:
+        """Cancel the orders which have expired, for every ticker.
+
+        Args:
+            now (float): The current time, on the clock of the order expiry
+                times.
+
+        Returns:
+            Dict[str, List[int]]: The ids of the expired orders of each ticker
+                with expired orders.
+        """
+        expired: Dict[str, List[int]] = {}
+        for ticker, order_book in self.books.items():
+            order_ids = order_book.expire(now)
+            if order_ids:
+                expired[ticker] = order_ids
+        return expired
+
+    def level_updates(self) -> Dict[str, List[LevelUpdate]]:
+        """Take the changes to the bid and offer levels of every ticker since
+        the last call.
+
+        A publisher can take the updates after each change to the books, and
+        send only the levels which changed, rather than diffing the depth.
+
+        Returns:
+            Dict[str, List[LevelUpdate]]: The level updates of each ticker with
+                changed levels.
+        """
+        updates: Dict[str, List[LevelUpdate]] = {}
+        for ticker, order_book in self.books.items():
+            ticker_updates = order_book.level_updates()
+            if ticker_updates:
+                updates[ticker] = ticker_updates
+        return updates
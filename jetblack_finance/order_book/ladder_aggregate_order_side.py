@@ -0,0 +1,344 @@
+"""Ladder aggregate order side"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from itertools import islice
+from typing import Iterator, List, Sequence, cast
+
+from .aggregate_order import AggregateOrder
+from .aggregate_order_side import AggregateOrderSide
+from .order import Order, Price
+from .tick_size import TickSize
+
+
+class LadderAggregateOrderSide(AggregateOrderSide):
+    """The aggregate orders for a side, held in a dense price ladder.
+
+    For instruments whose prices stay within a known band the price levels can
+    be held in a list with a slot for every tick in the band, so a level is
+    found by indexing with `(price - floor) / tick`. A pointer to the best slot
+    is moved as the best level changes.
+
+    Prices outside the band overflow to the sorted levels of the base class,
+    so the side remains correct if the market leaves the band, at the cost of
+    the sorted performance for those levels.
+
+    The cumulative size to a price, and the cost of a size, are answered from
+    Fenwick trees of the sizes and notionals of the slots other than the best,
+    indexed from the best price, which are built when they are first needed
+    and updated as the slots change. As with the sorted levels the size of the
+    best slot is read directly, so fills never update the trees. If the best
+    price has left the band a sweep walks the levels instead.
+
+    As the slots are indexed by ticks the order book must have a tick size.
+    """
+
+    def __init__(
+            self,
+            low_is_best: bool,
+            tick_size: TickSize | None,
+            floor: Decimal,
+            ceiling: Decimal
+    ) -> None:
+        """Initialise a ladder aggregate order side.
+
+        Args:
+            low_is_best (bool): If True lower prices are better (offers);
+                otherwise higher prices are better (bids).
+            tick_size (TickSize | None): The tick size.
+            floor (Decimal): The lowest price in the ladder.
+            ceiling (Decimal): The highest price in the ladder.
+
+        Raises:
+            ValueError: If there is no tick size, or the band is empty.
+        """
+        if tick_size is None:
+            raise ValueError("a price ladder requires a tick size")
+        super().__init__(low_is_best, tick_size)
+        self._floor = tick_size.to_ticks(floor)
+        slot_count = tick_size.to_ticks(ceiling) - self._floor + 1
+        if slot_count <= 0:
+            raise ValueError("the ceiling must not be less than the floor")
+        self._slots: List[AggregateOrder | None] = [None] * slot_count
+        self._slot_count = slot_count
+        self._level_count = 0
+        # The index of the best occupied slot, or -1 if there are none.
+        self._best = -1
+        # The Fenwick trees of the slot sizes and notionals other than the
+        # best, indexed from 1 at the best price, or None until first needed.
+        self._sizes: List[int] | None = None
+        self._notionals: List[int] | None = None
+
+    def _slot(self, price: Price) -> int:
+        # The index of the slot for the price, or -1 if it is outside the band.
+        index = cast(int, price) - self._floor
+        return index if 0 <= index < self._slot_count else -1
+
+    def _iter_ladder(self) -> Iterator[AggregateOrder]:
+        # Iterate over the ladder levels from the best to the worst.
+        if self._best == -1:
+            return
+        step, end = (1, self._slot_count) if self._low_is_best else (-1, -1)
+        for index in range(self._best, end, step):
+            aggregate_order = self._slots[index]
+            if aggregate_order is not None:
+                yield aggregate_order
+
+    def _position(self, index: int) -> int:
+        # The position in the trees of a slot, counting from 1 at the best.
+        return index + 1 if self._low_is_best else self._slot_count - index
+
+    def _is_beyond_band(self, aggregate_order: AggregateOrder) -> bool:
+        # Whether an overflow level is better than every ladder level.
+        return (cast(int, aggregate_order.key) < self._floor) == self._low_is_best
+
+    def iter_levels(self) -> Iterator[AggregateOrder]:
+        # Overflow levels are either better or worse than every ladder level,
+        # and the better levels are at the end of the sorted levels.
+        levels = self._levels
+        index = len(levels)
+        while index and self._is_beyond_band(levels[index - 1]):
+            index -= 1
+            yield levels[index]
+        yield from self._iter_ladder()
+        while index:
+            index -= 1
+            yield levels[index]
+
+    def depth(self, levels: int | None) -> Sequence[AggregateOrder]:
+        orders = tuple(islice(self.iter_levels(), levels))
+        return orders if self._low_is_best else orders[::-1]
+
+    def size_to_price(self, price: Price) -> int:
+        size = super().size_to_price(price)
+        if self._best == -1:
+            return size
+
+        # The number of positions at the price or better.
+        count = min(
+            max(self._position(cast(int, price) - self._floor), 0),
+            self._slot_count
+        )
+        if self._position(self._best) > count:
+            return size
+        sizes, _ = self._slot_trees()
+        return (
+            size +
+            cast(AggregateOrder, self._slots[self._best]).size +
+            self._prefix(sizes, count)
+        )
+
+    def _sweep(self, size: int) -> tuple[Price, AggregateOrder | None, int]:
+        if size <= 0:
+            raise ValueError("the size must be greater than 0")
+        if self._levels and self._is_beyond_band(self._levels[-1]):
+            # The market has left the band.
+            return self._walk(self.iter_levels(), size)
+
+        notional, last, unfilled = self._sweep_slots(size)
+        if not unfilled or not self._levels:
+            return notional, last, unfilled
+
+        # The rest is taken from the overflow levels, which are all worse.
+        overflow, overflow_last, unfilled = super()._sweep(unfilled)
+        return notional + overflow, overflow_last, unfilled
+
+    def _sweep_slots(self, size: int) -> tuple[Price, AggregateOrder | None, int]:
+        # Take a size from the slots, as `_sweep`.
+        if self._best == -1:
+            return 0, None, size
+        best = cast(AggregateOrder, self._slots[self._best])
+        if size <= best.size:
+            return size * best.key, best, 0
+
+        sizes, notionals = self._slot_trees()
+        remaining = size - best.size
+        target = min(remaining, self._prefix(sizes, self._slot_count))
+        if target == 0:
+            return best.size * best.key, best, remaining
+
+        # Descend the trees to the last position before the target is reached,
+        # so the target is reached in the next.
+        position = 0
+        notional = best.size * best.key
+        rest = target
+        step = 1 << (self._slot_count.bit_length() - 1)
+        while step:
+            if position + step <= self._slot_count and sizes[position + step] < rest:
+                position += step
+                rest -= sizes[position]
+                notional += notionals[position]
+            step >>= 1
+        index = position if self._low_is_best else self._slot_count - 1 - position
+        last = cast(AggregateOrder, self._slots[index])
+        return notional + rest * last.key, last, remaining - target
+
+    def _slot_trees(self) -> tuple[List[int], List[int]]:
+        # The trees of the slots other than the best, built in linear time when
+        # they are first needed.
+        if self._sizes is None or self._notionals is None:
+            sizes = [0] * (self._slot_count + 1)
+            notionals = [0] * (self._slot_count + 1)
+            for index, aggregate_order in enumerate(self._slots):
+                if aggregate_order is not None and index != self._best:
+                    position = self._position(index)
+                    sizes[position] = aggregate_order.size
+                    notionals[position] = aggregate_order.size * (self._floor + index)
+            for position in range(1, self._slot_count + 1):
+                parent = position + (position & -position)
+                if parent <= self._slot_count:
+                    sizes[parent] += sizes[position]
+                    notionals[parent] += notionals[position]
+            self._sizes, self._notionals = sizes, notionals
+        return self._sizes, self._notionals
+
+    @classmethod
+    def _prefix(cls, fenwick: List[int], count: int) -> int:
+        # The total of the first count positions.
+        total = 0
+        while count > 0:
+            total += fenwick[count]
+            count -= count & -count
+        return total
+
+    def _add_size(self, index: int, delta: int) -> None:
+        # The size of the best slot is read directly.
+        if self._sizes is None or self._notionals is None or index == self._best:
+            return
+        sizes, notionals = self._sizes, self._notionals
+        notional = delta * (self._floor + index)
+        position = self._position(index)
+        while position <= self._slot_count:
+            sizes[position] += delta
+            notionals[position] += notional
+            position += position & -position
+
+    @property
+    def best(self) -> AggregateOrder:
+        if self._levels and (
+            self._best == -1 or
+            (
+                self._sort_key(self._levels[-1].key) >
+                self._sort_key(self._floor + self._best)
+            )
+        ):
+            return self._levels[-1]
+        if self._best == -1:
+            raise IndexError("the side is empty")
+        return cast(AggregateOrder, self._slots[self._best])
+
+    def level(self, price: Price) -> AggregateOrder | None:
+        index = self._slot(price)
+        return super().level(price) if index == -1 else self._slots[index]
+
+    def delete_best(self) -> None:
+        index = self._slot(self.best.key)
+        if index == -1:
+            super().delete_best()
+        else:
+            self._delete_slot(index)
+
+    def _delete_slot(self, index: int) -> None:
+        aggregate_order = cast(AggregateOrder, self._slots[index])
+        self._add_size(index, -aggregate_order.size)
+        if self.pool is not None:
+            self.pool.release(aggregate_order)
+        self._slots[index] = None
+        self._level_count -= 1
+        if index != self._best:
+            return
+
+        # Move the best pointer to the next occupied slot.
+        if self._level_count == 0:
+            self._best = -1
+            return
+        step = 1 if self._low_is_best else -1
+        index += step
+        while self._slots[index] is None:
+            index += step
+        # The new best slot leaves the trees.
+        self._add_size(index, -cast(AggregateOrder, self._slots[index]).size)
+        self._best = index
+
+    def add_order(self, order: Order) -> None:
+        index = self._slot(order.price)
+        if index == -1:
+            super().add_order(order)
+            return
+
+        aggregate_order = self._slots[index]
+        if aggregate_order is not None:
+            aggregate_order.append(order)
+            self._add_size(index, order.size)
+            return
+
+        self._slots[index] = aggregate_order = self._create_level(order)
+        self._level_count += 1
+        if (
+            self._best == -1 or
+            (index < self._best if self._low_is_best else index > self._best)
+        ):
+            # The old best slot joins the trees.
+            best, self._best = self._best, index
+            if best != -1:
+                self._add_size(best, cast(AggregateOrder, self._slots[best]).size)
+        else:
+            self._add_size(index, aggregate_order.size)
+
+    def amend_order(self, order: Order, size: int) -> None:
+        index = self._slot(order.price)
+        if index == -1:
+            super().amend_order(order, size)
+            return
+
+        aggregate_order = self._slots[index]
+        if aggregate_order is None:
+            raise ValueError("no order at this price")
+
+        self._add_size(index, size - order.size)
+        aggregate_order.change_size(order.order_id, size)
+
+    def cancel_order(self, order: Order) -> None:
+        index = self._slot(order.price)
+        if index == -1:
+            super().cancel_order(order)
+            return
+
+        aggregate_order = self._slots[index]
+        if aggregate_order is None:
+            raise KeyError("The aggregate order could not be found")
+
+        aggregate_order.cancel(order.order_id)
+        self._add_size(index, -order.size)
+        if len(aggregate_order) == 0:
+            self._delete_slot(index)
+
+    def cancel_levels(
+            self,
+            low: Price | None,
+            high: Price | None
+    ) -> List[Order]:
+        orders = super().cancel_levels(low, high)
+
+        # Clear the slots in the band which are in the range.
+        first = 0 if low is None else max(cast(int, low) - self._floor, 0)
+        last = (
+            self._slot_count - 1 if high is None
+            else min(cast(int, high) - self._floor, self._slot_count - 1)
+        )
+        for index in range(first, last + 1):
+            aggregate_order = self._slots[index]
+            if aggregate_order is not None:
+                orders += aggregate_order.orders
+                self._delete_slot(index)
+        return orders
+
+    def __bool__(self) -> bool:
+        return self._level_count != 0 or bool(self._levels)
+
+    def __len__(self) -> int:
+        return self._level_count + len(self._levels)
+
+    def __repr__(self) -> str:
+        return f"LadderOrderBook({self._low_is_best}) {{{str(self)}}}"
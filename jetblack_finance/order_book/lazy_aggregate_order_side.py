@@ -0,0 +1,306 @@
+"""Lazy aggregate order side"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from decimal import Decimal
+from itertools import islice
+from typing import Dict, Iterator, List, Sequence
+
+from .aggregate_order import AggregateOrder
+from .aggregate_order_side import AggregateOrderSide
+from .order import Order, Price
+from .tick_size import TickSize
+
+
+class LazyAggregateOrderSide(AggregateOrderSide):
+    """The aggregate orders for a side, sorted only near the touch.
+
+    Most orders rest far from the best price, and are cancelled without
+    trading. This side keeps the levels near the best price sorted, using the
+    base class, while levels further than a given distance from the best price
+    are held in coarse price buckets which are not sorted. Adding or cancelling
+    an order in a bucket is a dictionary operation.
+
+    Levels in buckets worse than the "frontier" bucket are held unsorted. As
+    the best price moves towards the buckets they are promoted to the sorted
+    levels, and as the best price moves away the worst sorted levels are
+    demoted to the buckets. The depth sorts the buckets on demand.
+    """
+
+    def __init__(
+            self,
+            low_is_best: bool,
+            tick_size: TickSize | None,
+            distance: Decimal,
+            bucket_size: Decimal
+    ) -> None:
+        """Initialise a lazy aggregate order side.
+
+        Args:
+            low_is_best (bool): If True lower prices are better (offers);
+                otherwise higher prices are better (bids).
+            tick_size (TickSize | None): The tick size, if any.
+            distance (Decimal): The distance from the best price beyond which
+                levels are held in buckets.
+            bucket_size (Decimal): The price range of a bucket.
+
+        Raises:
+            ValueError: If the distance is negative or the bucket size is not
+                positive.
+        """
+        if distance < 0 or bucket_size <= 0:
+            raise ValueError(
+                "the distance must not be negative and the bucket size must be positive"
+            )
+        super().__init__(low_is_best, tick_size)
+        self._distance: Price = (
+            distance if tick_size is None else tick_size.to_ticks(distance)
+        )
+        self._bucket_size: Price = (
+            bucket_size if tick_size is None else tick_size.to_ticks(bucket_size)
+        )
+        # The buckets are keyed by bucket number. As with the price levels the
+        # bucket sort keys are kept with the best bucket last.
+        self._buckets: Dict[int, Dict[Price, AggregateOrder]] = {}
+        self._bucket_keys: List[int] = []
+        self._bucket_level_count = 0
+        self._frontier: int | None = None
+
+    def _bucket(self, price: Price) -> int:
+        return int(price // self._bucket_size)
+
+    def _bucket_sort_key(self, bucket: int) -> int:
+        # The sort key is a negation, so it also converts a key to a bucket.
+        return -bucket if self._low_is_best else bucket
+
+    def _target_frontier(self, price: Price) -> int:
+        # The sort key of the bucket at the distance from the price.
+        return self._bucket_sort_key(
+            self._bucket(
+                price + self._distance if self._low_is_best
+                else price - self._distance
+            )
+        )
+
+    def _is_deep(self, price: Price) -> bool:
+        return (
+            self._frontier is not None and
+            self._bucket_sort_key(self._bucket(price)) < self._frontier
+        )
+
+    def _iter_buckets(self) -> Iterator[AggregateOrder]:
+        # Iterate over the bucket levels from the best to the worst, sorting
+        # each bucket as it is reached.
+        for key in reversed(self._bucket_keys):
+            yield from sorted(
+                self._buckets[self._bucket_sort_key(key)].values(),
+                key=lambda x: self._sort_key(x.key),
+                reverse=True
+            )
+
+    def iter_levels(self) -> Iterator[AggregateOrder]:
+        yield from reversed(self._levels)
+        yield from self._iter_buckets()
+
+    def depth(self, levels: int | None) -> Sequence[AggregateOrder]:
+        count = len(self._levels)
+        if levels is not None and levels <= count:
+            orders = tuple(self._levels[count - levels:][::-1])
+        else:
+            orders = tuple(self._levels[::-1]) + tuple(islice(
+                self._iter_buckets(),
+                None if levels is None else levels - count
+            ))
+        return orders if self._low_is_best else orders[::-1]
+
+    def size_to_price(self, price: Price) -> int:
+        size = super().size_to_price(price)
+        if not self._is_deep(price):
+            return size
+
+        # The price is beyond the sorted levels, so the buckets from the price
+        # to the frontier are added unsorted.
+        key = self._sort_key(price)
+        start = bisect_left(
+            self._bucket_keys,
+            self._bucket_sort_key(self._bucket(price))
+        )
+        for bucket_key in self._bucket_keys[start:]:
+            for aggregate_order in self._buckets[
+                    self._bucket_sort_key(bucket_key)
+            ].values():
+                if self._sort_key(aggregate_order.key) >= key:
+                    size += aggregate_order.size
+        return size
+
+    def _sweep(self, size: int) -> tuple[Price, AggregateOrder | None, int]:
+        notional, last, unfilled = super()._sweep(size)
+        if not unfilled:
+            return notional, last, 0
+
+        # The size is beyond the sorted levels, so the buckets are sorted as
+        # they are reached.
+        return self._walk(self._iter_buckets(), unfilled, notional, last)
+
+    def level(self, price: Price) -> AggregateOrder | None:
+        if not self._is_deep(price):
+            return super().level(price)
+        return self._buckets.get(self._bucket(price), {}).get(price)
+
+    def delete_best(self) -> None:
+        super().delete_best()
+        self._promote()
+
+    def add_order(self, order: Order) -> None:
+        if not self:
+            self._frontier = self._target_frontier(order.price)
+        elif self._sort_key(order.price) > self._sort_key(self._levels[-1].key):
+            # The order is at a new best price, so the frontier may advance.
+            self._demote(order.price)
+
+        if not self._is_deep(order.price):
+            super().add_order(order)
+            return
+
+        bucket = self._buckets.get(self._bucket(order.price))
+        aggregate_order = None if bucket is None else bucket.get(order.price)
+        if aggregate_order is not None:
+            aggregate_order.append(order)
+        else:
+            self._add_to_bucket(self._create_level(order))
+
+    def amend_order(self, order: Order, size: int) -> None:
+        if not self._is_deep(order.price):
+            super().amend_order(order, size)
+            return
+
+        aggregate_order = self._buckets.get(
+            self._bucket(order.price), {}
+        ).get(order.price)
+        if aggregate_order is None:
+            raise ValueError("no order at this price")
+
+        aggregate_order.change_size(order.order_id, size)
+
+    def cancel_order(self, order: Order) -> None:
+        if not self._is_deep(order.price):
+            super().cancel_order(order)
+            self._promote()
+            return
+
+        bucket_number = self._bucket(order.price)
+        bucket = self._buckets.get(bucket_number, {})
+        aggregate_order = bucket.get(order.price)
+        if aggregate_order is None:
+            raise KeyError("The aggregate order could not be found")
+
+        aggregate_order.cancel(order.order_id)
+        if len(aggregate_order) != 0:
+            return
+
+        del bucket[order.price]
+        self._bucket_level_count -= 1
+        if self.pool is not None:
+            self.pool.release(aggregate_order)
+        if not bucket:
+            del self._buckets[bucket_number]
+            del self._bucket_keys[
+                bisect_left(
+                    self._bucket_keys,
+                    self._bucket_sort_key(bucket_number)
+                )
+            ]
+
+    def cancel_levels(
+            self,
+            low: Price | None,
+            high: Price | None
+    ) -> List[Order]:
+        orders = super().cancel_levels(low, high)
+
+        # Remove the levels in the range from the buckets which overlap it.
+        first = None if low is None else self._bucket(low)
+        last = None if high is None else self._bucket(high)
+        for key in list(self._bucket_keys):
+            bucket_number = self._bucket_sort_key(key)
+            if (
+                    (first is not None and bucket_number < first) or
+                    (last is not None and bucket_number > last)
+            ):
+                continue
+
+            bucket = self._buckets[bucket_number]
+            for price in [
+                    price
+                    for price in bucket
+                    if (low is None or price >= low) and
+                    (high is None or price <= high)
+            ]:
+                aggregate_order = bucket.pop(price)
+                self._bucket_level_count -= 1
+                orders += aggregate_order.orders
+                if self.pool is not None:
+                    self.pool.release(aggregate_order)
+            if not bucket:
+                del self._buckets[bucket_number]
+                self._bucket_keys.remove(key)
+
+        self._promote()
+        return orders
+
+    def _add_to_bucket(self, aggregate_order: AggregateOrder) -> None:
+        bucket_number = self._bucket(aggregate_order.key)
+        bucket = self._buckets.get(bucket_number)
+        if bucket is None:
+            bucket = self._buckets[bucket_number] = {}
+            key = self._bucket_sort_key(bucket_number)
+            self._bucket_keys.insert(bisect_left(self._bucket_keys, key), key)
+        bucket[aggregate_order.key] = aggregate_order
+        self._bucket_level_count += 1
+
+    def _promote(self) -> None:
+        # Move the frontier towards the worse prices as the best price
+        # approaches it, promoting the buckets it passes.
+        while True:
+            if not self._levels:
+                if not self._bucket_keys:
+                    self._frontier = None
+                    return
+                # Promote the best bucket, then check the new best price.
+                self._frontier = self._bucket_keys[-1]
+            else:
+                target = self._target_frontier(self._levels[-1].key)
+                if self._frontier is not None and self._frontier <= target:
+                    return
+                self._frontier = target
+
+            while self._bucket_keys and self._bucket_keys[-1] >= self._frontier:
+                key = self._bucket_keys.pop()
+                for aggregate_order in self._buckets.pop(
+                        self._bucket_sort_key(key)
+                ).values():
+                    self._bucket_level_count -= 1
+                    self._insert_level(aggregate_order)
+
+    def _demote(self, price: Price) -> None:
+        # Move the frontier towards the new best price, demoting the sorted
+        # levels it passes.
+        target = self._target_frontier(price)
+        if self._frontier is not None and target <= self._frontier:
+            return
+
+        self._frontier = target
+        while self._levels and self._is_deep(self._levels[0].key):
+            aggregate_order = self._levels[0]
+            self._delete_level(aggregate_order)
+            self._add_to_bucket(aggregate_order)
+
+    def __bool__(self) -> bool:
+        return bool(self._levels) or self._bucket_level_count != 0
+
+    def __len__(self) -> int:
+        return len(self._levels) + self._bucket_level_count
+
+    def __repr__(self) -> str:
+        return f"LazyOrderBook({self._low_is_best}) {{{str(self)}}}"
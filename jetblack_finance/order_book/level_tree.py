@@ -0,0 +1,245 @@
+"""A tree of price levels with running totals"""
+
+from __future__ import annotations
+
+from random import random
+from typing import Any, Iterable, List
+
+from .aggregate_order import AggregateOrder
+from .order import Price
+
+
+class _Node:
+    # A node holds its own size and notional, as the size of a level may be
+    # changed before the tree is told, and the totals of its subtree.
+
+    __slots__ = (
+        'key',
+        'level',
+        'priority',
+        'size',
+        'notional',
+        'sizes',
+        'notionals',
+        'left',
+        'right'
+    )
+
+    def __init__(self, key: Any, level: AggregateOrder) -> None:
+        self.key = key
+        self.level = level
+        self.priority = random()
+        self.size = level.size
+        self.notional: Price = level.size * level.key
+        self.sizes = self.size
+        self.notionals = self.notional
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+
+    def total(self) -> None:
+        """Recalculate the totals of the subtree from the children."""
+        sizes, notionals = self.size, self.notional
+        if self.left is not None:
+            sizes += self.left.sizes
+            notionals += self.left.notionals
+        if self.right is not None:
+            sizes += self.right.sizes
+            notionals += self.right.notionals
+        self.sizes, self.notionals = sizes, notionals
+
+
+class LevelTree:
+    """A tree of price levels ordered by their sort keys, which keeps the total
+    size and notional of each subtree.
+
+    The tree is a treap: a binary search tree on the keys, and a heap on random
+    priorities, which keeps it balanced with high probability. Adding, removing
+    and resizing a level, finding the size of the levels at or above a key, and
+    sweeping a size from the highest keys, take logarithmic time.
+    """
+
+    def __init__(self, items: Iterable[tuple[Any, AggregateOrder]] = ()) -> None:
+        """Initialise the tree.
+
+        Args:
+            items (Iterable[tuple[Any, AggregateOrder]], optional): The sort key
+                and level of the initial levels, in ascending order of key.
+                Defaults to no levels.
+        """
+        # Build the tree in linear time. The stack holds the right spine, and
+        # a node is totalled when it leaves the spine.
+        spine: List[_Node] = []
+        for key, level in items:
+            node = _Node(key, level)
+            left: _Node | None = None
+            while spine and spine[-1].priority < node.priority:
+                left = spine.pop()
+                left.total()
+            node.left = left
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        for node in reversed(spine):
+            node.total()
+        self._root: _Node | None = spine[0] if spine else None
+
+    @property
+    def size(self) -> int:
+        """The total size of the levels.
+
+        Returns:
+            int: The total size.
+        """
+        return 0 if self._root is None else self._root.sizes
+
+    def insert(self, key: Any, level: AggregateOrder) -> None:
+        """Add a level.
+
+        Args:
+            key (Any): The sort key of the level, which is not in the tree.
+            level (AggregateOrder): The level.
+        """
+        node = _Node(key, level)
+        parent: _Node | None = None
+        child = self._root
+        # The nodes above the new node gain its size.
+        while child is not None and child.priority > node.priority:
+            child.sizes += node.size
+            child.notionals += node.notional
+            parent = child
+            child = child.left if key < child.key else child.right
+        node.left, node.right = self._split(child, key)
+        node.total()
+        if parent is None:
+            self._root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+
+    def remove(self, key: Any) -> None:
+        """Remove a level.
+
+        Args:
+            key (Any): The sort key of the level, which is in the tree.
+        """
+        path: List[_Node] = []
+        node = self._root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            raise KeyError(key)
+
+        # The nodes above the removed node lose its size.
+        for parent in path:
+            parent.sizes -= node.size
+            parent.notionals -= node.notional
+        child = self._merge(node.left, node.right)
+        if not path:
+            self._root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+    def update(self, key: Any, delta: int, notional: Price) -> None:
+        """Change the size of a level.
+
+        Args:
+            key (Any): The sort key of the level, which is in the tree.
+            delta (int): The change in size.
+            notional (Price): The change in notional.
+        """
+        node = self._root
+        while node is not None:
+            node.sizes += delta
+            node.notionals += notional
+            if node.key == key:
+                node.size += delta
+                node.notional += notional
+                return
+            node = node.left if key < node.key else node.right
+        raise KeyError(key)
+
+    def size_from(self, key: Any) -> int:
+        """The total size of the levels with a sort key at or above a key.
+
+        Args:
+            key (Any): The sort key.
+
+        Returns:
+            int: The total size.
+        """
+        size = 0
+        node = self._root
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            else:
+                size += node.size
+                if node.right is not None:
+                    size += node.right.sizes
+                node = node.left
+        return size
+
+    def sweep(self, size: int) -> tuple[Price, AggregateOrder | None, int]:
+        """Take a size from the levels with the highest keys.
+
+        Args:
+            size (int): The size.
+
+        Returns:
+            tuple[Price, AggregateOrder | None, int]: The notional taken, the
+                last level reached, and the size which was not filled.
+        """
+        notional: Price = 0
+        last: AggregateOrder | None = None
+        node = self._root
+        while node is not None:
+            right = node.right
+            if right is not None:
+                if size <= right.sizes:
+                    node = right
+                    continue
+                size -= right.sizes
+                notional += right.notionals
+            last = node.level
+            if size <= node.size:
+                return notional + size * last.key, last, 0
+            size -= node.size
+            notional += node.notional
+            node = node.left
+        return notional, last, size
+
+    @classmethod
+    def _split(
+            cls,
+            node: _Node | None,
+            key: Any
+    ) -> tuple[_Node | None, _Node | None]:
+        # Split a subtree into the nodes below the key and the nodes above it.
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, right = cls._split(node.right, key)
+            node.total()
+            return node, right
+        left, node.left = cls._split(node.left, key)
+        node.total()
+        return left, node
+
+    @classmethod
+    def _merge(cls, left: _Node | None, right: _Node | None) -> _Node | None:
+        # Join two subtrees, where the keys of the left are below the right.
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = cls._merge(left.right, right)
+            left.total()
+            return left
+        right.left = cls._merge(left, right.left)
+        right.total()
+        return right
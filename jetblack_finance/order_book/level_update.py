@@ -0,0 +1,22 @@
+"""Level update"""
+
+from decimal import Decimal
+from typing import NamedTuple
+
+from .order import Side
+
+
+class LevelUpdate(NamedTuple):
+    """A change to a price level of the bids or offers.
+
+    A level which has been removed has a size and order count of 0.
+    """
+
+    sequence: int
+    side: Side
+    price: Decimal
+    size: int
+    order_count: int
+
+    def __str__(self) -> str:
+        return f"{self.side.name} {self.price}x{self.size}"
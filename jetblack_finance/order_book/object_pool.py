@@ -0,0 +1,159 @@
+"""Object Pool"""
+
+from __future__ import annotations
+
+import sys
+from typing import List, Sequence
+
+from .aggregate_order import AggregateOrder
+from .order import Order, Price, Side, Style
+
+
+def _reference_counts(objects: Sequence[object]) -> List[int]:
+    return [sys.getrefcount(obj) for obj in objects]
+
+
+class ObjectPool:
+    """A pool of orders and price levels for reuse.
+
+    An order book allocates an order for every new order, and a price level for
+    every new price, and discards them when they are filled or cancelled. The
+    pool keeps discarded objects to be reinitialised, rather than allocated.
+
+    The rules for reuse are:
+
+    * Objects are released by the order book when it has removed them, and are
+      only eligible for reuse from the start of the next call to the order
+      book, when nothing in the order book can still be using them.
+    * An object is only reused if the pool holds the only reference to it. If
+      a caller or a plugin has kept a reference, for example to a level from
+      `depth` or an order from `find`, the object is left to the garbage
+      collector, so a caller never sees an object change identity.
+
+    The second rule relies on CPython reference counts.
+    """
+
+    def __init__(self) -> None:
+        self._released: List[Order | AggregateOrder] = []
+        self._orders: List[Order] = []
+        self._levels: List[AggregateOrder] = []
+        self.created = 0
+        self.reused = 0
+        # The reference count of an object which is only held by the released
+        # list.
+        self._unreferenced_count = _reference_counts([object()])[0]
+
+    def create_order(
+            self,
+            order_id: int,
+            side: Side,
+            price: Price,
+            size: int,
+            style: Style,
+            stop_price: Price | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
+    ) -> Order:
+        """Create an order, reusing a released order if possible.
+
+        Args:
+            order_id (int): The order id.
+            side (Side): Buy or sell.
+            price (Price): The price, or count of ticks.
+            size (int): The order size.
+            style (Style): The order style.
+            stop_price (Price | None, optional): The stop price, or count of
+                ticks. Defaults to None.
+            owner (str | None, optional): The owner of the order. Defaults to
+                None.
+            expiry (float | None, optional): The time at which the order
+                expires. Defaults to None.
+            peak (int | None, optional): The displayed size of an iceberg
+                order. Defaults to None.
+
+        Returns:
+            Order: The order.
+        """
+        if not self._orders:
+            self.created += 1
+            return Order(
+                order_id,
+                side,
+                price,
+                size,
+                style,
+                stop_price,
+                owner,
+                expiry,
+                peak
+            )
+
+        self.reused += 1
+        order = self._orders.pop()
+        order.__init__(  # type: ignore[misc] # pylint: disable=unnecessary-dunder-call
+            order_id,
+            side,
+            price,
+            size,
+            style,
+            stop_price,
+            owner,
+            expiry,
+            peak
+        )
+        return order
+
+    def create_level(
+            self,
+            order: Order,
+            price: Price | None,
+            key: Price | None = None
+    ) -> AggregateOrder:
+        """Create a price level, reusing a released level if possible.
+
+        Args:
+            order (Order): The first order of the level.
+            price (Price | None): The decimal price of the level when the
+                order price is held in ticks.
+            key (Price | None, optional): The price with which the level is
+                compared, if not the order price. Defaults to None.
+
+        Returns:
+            AggregateOrder: The price level.
+        """
+        if not self._levels:
+            self.created += 1
+            return AggregateOrder(order, price, key)
+
+        self.reused += 1
+        aggregate_order = self._levels.pop()
+        aggregate_order.reset(order, price, key)
+        return aggregate_order
+
+    def release(self, obj: Order | AggregateOrder) -> None:
+        """Release an order or price level which has been removed from the
+        order book.
+
+        Args:
+            obj (Order | AggregateOrder): The order or level.
+        """
+        self._released.append(obj)
+
+    def recycle(self) -> None:
+        """Make the released objects which are not referenced elsewhere
+        available for reuse.
+
+        This must be called at the start of a call to the order book.
+        """
+        if not self._released:
+            return
+
+        released, self._released = self._released, []
+        for obj, count in zip(released, _reference_counts(released)):
+            if count > self._unreferenced_count:
+                continue
+            if isinstance(obj, Order):
+                self._orders.append(obj)
+            else:
+                self._levels.append(obj)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from decimal import Decimal
 from enum import Enum, auto
 
+Price = Decimal | int
+
 
 class Side(Enum):
     """The order side"""
@@ -12,6 +14,10 @@ class Side(Enum):
     BUY = auto()
     SELL = auto()
 
+    # Members are singletons, so the identity hash is consistent with
+    # equality, and much faster than the default `Enum` hash.
+    __hash__ = object.__hash__
+
 
 class Style(Enum):
     """The order style"""
@@ -21,36 +27,75 @@ class Style(Enum):
     FILL_OR_KILL = auto()
     IMMEDIATE_OR_CANCEL = auto()
     BOOK_OR_CANCEL = auto()
+    STOP_LIMIT = auto()
+    ICEBERG = auto()
+
+    __hash__ = object.__hash__
 
 
 class Order:
-    """Aa order is an order which gets executed at a given price"""
+    """Aa order is an order which gets executed at a given price.
+
+    As an order book may hold millions of resting orders the attributes are
+    declared as slots, so an order does not carry an instance dictionary.
+    """
+
+    __slots__ = (
+        '_order_id',
+        '_side',
+        '_price',
+        'size',
+        '_style',
+        '_stop_price',
+        '_owner',
+        '_expiry',
+        '_peak'
+    )
 
     def __init__(
             self,
             order_id: int,
             side: Side,
-            price: Decimal,
+            price: Price,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Price | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> None:
         """Initialise aa order.
 
         The order_id is an ordinal integer which represents the order in which
         orders are placed.
 
+        When the order book has a tick size the prices are held as integer
+        counts of ticks.
+
         Args:
             order_id (int): The order id.
             side (Side): Buy or sell.
-            price (Decimal): The price.
+            price (Price): The price, or count of ticks.
             size (int): The order size.
             style (Style): The order style.
+            stop_price (Price | None, optional): The price at which a stop
+                order is triggered. Defaults to None.
+            owner (str | None, optional): The owner or session which placed
+                the order. Defaults to None.
+            expiry (float | None, optional): The time at which the order
+                expires. Defaults to None.
+            peak (int | None, optional): The displayed size of an iceberg
+                order. Defaults to None.
         """
         self._order_id = order_id
         self._side = side
         self._price = price
-        self.size = size  # The size is mutable.
+        self.size = size  # The size is mutable through the price level.
         self._style = style
+        self._stop_price = stop_price
+        self._owner = owner
+        self._expiry = expiry
+        self._peak = peak
 
     @property
     def order_id(self) -> int:
@@ -71,11 +116,11 @@ class Order:
         return self._side
 
     @property
-    def price(self) -> Decimal:
+    def price(self) -> Price:
         """The price at which the order can be filled.
 
         Returns:
-            Decimal: The order price.
+            Price: The order price, or count of ticks.
         """
         return self._price
 
@@ -88,6 +133,49 @@ class Order:
         """
         return self._style
 
+    @property
+    def stop_price(self) -> Price | None:
+        """The price at which a stop order is triggered.
+
+        Returns:
+            Price | None: The stop price, or None if the order is not an
+                untriggered stop.
+        """
+        return self._stop_price
+
+    @property
+    def owner(self) -> str | None:
+        """The owner or session which placed the order.
+
+        Returns:
+            str | None: The owner, or None if the order has no owner.
+        """
+        return self._owner
+
+    @property
+    def expiry(self) -> float | None:
+        """The time at which the order expires.
+
+        Returns:
+            float | None: The expiry time, or None if the order is good until
+                cancelled.
+        """
+        return self._expiry
+
+    @property
+    def peak(self) -> int | None:
+        """The size displayed by an iceberg order.
+
+        Returns:
+            int | None: The peak size, or None if the order is not an iceberg.
+        """
+        return self._peak
+
+    def trigger(self) -> None:
+        """Convert a triggered stop order into a limit order at its price."""
+        self._style = Style.LIMIT
+        self._stop_price = None
+
     def __repr__(self) -> str:
         return f"Order({self._order_id}, {self._side}, {self._price}, {self.size})"
 
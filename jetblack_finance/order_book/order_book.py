@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import List, Sequence
+from typing import Iterable, Iterator, List, Sequence
 
-from .abstract_types import AbstractOrderBook, PluginFactory
+from .abstract_types import AbstractOrderBook, PluginFactory, SideFactory
 from .aggregate_order import AggregateOrder
 from .aggregate_order_side import AggregateOrderSide
+from .depth_arrays import DepthArrays
 from .constants import ALL_PLUGINS
 from .fill import Fill
+from .level_update import LevelUpdate
 from .order import Side, Style
 from .order_book_manager import OrderBookManager
+from .order_event import OrderEventListener
+from .order_request import OrderRequest
+from .quote import QuoteResult
+from .stop_order_side import StopOrderSide
+from .top_of_book import TopOfBook
 
 
 class OrderBook(AbstractOrderBook):
@@ -23,15 +30,44 @@ class OrderBook(AbstractOrderBook):
 
     def __init__(
             self,
-            plugins: Sequence[PluginFactory] = ALL_PLUGINS
+            plugins: Sequence[PluginFactory] = ALL_PLUGINS,
+            tick_size: Decimal | None = None,
+            side_factory: SideFactory = AggregateOrderSide,
+            pooling: bool = False,
+            listener: OrderEventListener | None = None,
+            sequence: Iterator[int] | None = None
     ) -> None:
         """Initialise the order book.
 
+        When a tick size is given prices are held internally as integer counts
+        of ticks, which are faster to compare than decimals. Prices must then
+        be a multiple of the tick size.
+
+        When a listener is given it is called at the end of each call which
+        changed orders, with the events of those orders.
+
         Args:
             plugins (Sequence[PluginFactory], optional): Plugins to use to
                 handle order styles. Defaults to `ALL_PLUGINS`.
+            tick_size (Decimal | None, optional): The tick size. Defaults to
+                None.
+            side_factory (SideFactory, optional): The factory for the bid and
+                offer sides. Defaults to `AggregateOrderSide`.
+            pooling (bool, optional): If True reuse orders and price levels.
+                Defaults to False.
+            listener (OrderEventListener | None, optional): The listener for
+                order events. Defaults to None.
+            sequence (Iterator[int] | None, optional): The sequence of event
+                numbers. Defaults to a sequence from 1.
         """
-        self._manager = OrderBookManager(plugins)
+        self._manager = OrderBookManager(
+            plugins,
+            tick_size,
+            side_factory,
+            pooling,
+            listener,
+            sequence
+        )
 
     @property
     def bids(self) -> AggregateOrderSide:
@@ -42,34 +78,122 @@ class OrderBook(AbstractOrderBook):
         return self._manager.offers
 
     @property
-    def stop_bids(self) -> AggregateOrderSide:
+    def stop_bids(self) -> StopOrderSide:
         return self._manager.stop_bids
 
     @property
-    def stop_offers(self) -> AggregateOrderSide:
+    def stop_offers(self) -> StopOrderSide:
         return self._manager.stop_offers
 
+    @property
+    def version(self) -> int:
+        return self._manager.version
+
     def depth(
             self,
             levels: int | None
     ) -> tuple[Sequence[AggregateOrder], Sequence[AggregateOrder]]:
         return self._manager.depth(levels)
 
+    def depth_arrays(
+            self,
+            levels: int,
+            out: DepthArrays | None = None
+    ) -> DepthArrays:
+        return self._manager.depth_arrays(levels, out)
+
+    def size_to_price(self, side: Side, price: Decimal) -> int:
+        return self._manager.size_to_price(side, price)
+
+    def cost_to_fill(self, side: Side, size: int) -> Decimal | None:
+        return self._manager.cost_to_fill(side, size)
+
+    def price_for_size(self, side: Side, size: int) -> Decimal | None:
+        return self._manager.price_for_size(side, size)
+
+    def bbo(self) -> tuple[TopOfBook | None, TopOfBook | None]:
+        return self._manager.bbo()
+
+    def level_updates(self) -> List[LevelUpdate]:
+        return self._manager.level_updates()
+
     def add_order(
             self,
             side: Side,
             price: Decimal,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Decimal | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> tuple[int | None, List[Fill], List[int]]:
-        return self._manager.add_order(side, price, size, style)
+        return self._manager.add_order(
+            side,
+            price,
+            size,
+            style,
+            stop_price,
+            owner,
+            expiry,
+            peak
+        )
+
+    def add_orders(
+            self,
+            orders: Iterable[OrderRequest]
+    ) -> tuple[List[tuple[int | None, List[Fill], List[int]]], List[Fill], List[int]]:
+        return self._manager.add_orders(orders)
 
     def amend_order(self, order_id: int, size: int) -> None:
         self._manager.amend_order(order_id, size)
 
+    def replace_order(
+            self,
+            order_id: int,
+            price: Decimal,
+            size: int
+    ) -> tuple[int | None, List[Fill], List[int]]:
+        return self._manager.replace_order(order_id, price, size)
+
+    def update_quote(
+            self,
+            owner: str,
+            bid_price: Decimal | None,
+            bid_size: int,
+            offer_price: Decimal | None,
+            offer_size: int
+    ) -> QuoteResult:
+        return self._manager.update_quote(
+            owner,
+            bid_price,
+            bid_size,
+            offer_price,
+            offer_size
+        )
+
     def cancel_order(self, order_id: int) -> None:
         self._manager.cancel_order(order_id)
 
+    def cancel_orders(
+            self,
+            side: Side | None = None,
+            owner: str | None = None,
+            style: Style | None = None,
+            min_price: Decimal | None = None,
+            max_price: Decimal | None = None
+    ) -> List[int]:
+        return self._manager.cancel_orders(
+            side,
+            owner,
+            style,
+            min_price,
+            max_price
+        )
+
+    def expire(self, now: float) -> List[int]:
+        return self._manager.expire(now)
+
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, OrderBook) and
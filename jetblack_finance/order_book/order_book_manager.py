@@ -1,29 +1,107 @@
 """Order Book Manager"""
+# pylint: disable=too-many-lines
 
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, List, Sequence
+import heapq
+from itertools import count, islice
+import math
+import time
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    cast
+)
 
 from .abstract_types import (
     AbstractOrderBookManager,
-    PluginFactory
+    Plugin,
+    PluginFactory,
+    SideFactory
 )
 from .aggregate_order import AggregateOrder
 from .aggregate_order_side import AggregateOrderSide
+from .depth_arrays import DepthArrays
 from .fill import Fill
-from .order import Order, Side, Style
+from .level_update import LevelUpdate
+from .object_pool import ObjectPool
+from .order import Order, Price, Side, Style
+from .order_event import OrderEvent, OrderEventKind, OrderEventListener
+from .order_request import OrderRequest
+from .quote import QuoteResult
+from .stop_order_side import StopOrderSide
+from .tick_size import TickSize
+from .top_of_book import TopOfBook
+
+
+Hook = tuple[AbstractSet[Style], Callable[..., Any]]
+# A validated order to add: side, price, size, style, stop price, owner, expiry
+# and peak.
+Request = tuple[
+    Side,
+    Price,
+    int,
+    Style,
+    Price | None,
+    str | None,
+    float | None,
+    int | None
+]
 
 
 class OrderBookManager(AbstractOrderBookManager):
     """An order book manager"""
 
-    def __init__(self, plugin_factories: Sequence[PluginFactory]) -> None:
+    def __init__(
+            self,
+            plugin_factories: Sequence[PluginFactory],
+            tick_size: Decimal | None = None,
+            side_factory: SideFactory = AggregateOrderSide,
+            pooling: bool = False,
+            listener: OrderEventListener | None = None,
+            sequence: Iterator[int] | None = None
+    ) -> None:
         """Initialise the order book manager.
 
+        If a tick size is given prices are held and compared as integer counts
+        of ticks, and converted back to decimal prices for fills and depth.
+        Prices which are not a multiple of the tick size are rejected.
+
+        Only the hooks which a plugin overrides are called, and only when an
+        order of a style handled by the plugin is involved, or is live in the
+        book. A book which never sees the plugin styles pays nothing for the
+        plugins.
+
+        If pooling is enabled, orders and price levels which have been removed
+        from the book are reused. See `ObjectPool` for the rules which prevent
+        reused objects escaping to callers.
+
+        If a listener is given, the events of the orders changed by each call
+        are recorded, and passed to the listener as a batch at the end of the
+        call. The events are numbered from a sequence, which may be shared
+        with other order books to order their events.
+
         Args:
             plugins (Sequence[PluginFactory]): Plugins used to managed order
                 styles.
+            tick_size (Decimal | None, optional): The tick size. Defaults to
+                None.
+            side_factory (SideFactory, optional): The factory for the bid and
+                offer sides. Defaults to `AggregateOrderSide`.
+            pooling (bool, optional): If True reuse orders and price levels.
+                Defaults to False.
+            listener (OrderEventListener | None, optional): The listener for
+                order events. Defaults to None.
+            sequence (Iterator[int] | None, optional): The sequence of event
+                numbers. Defaults to a sequence from 1.
         """
         self._plugins = [
             factory() for factory in plugin_factories
@@ -36,21 +114,101 @@ class OrderBookManager(AbstractOrderBookManager):
         )
         self._supported_styles.add(Style.LIMIT)
         self._supported_styles.add(Style.STOP)
+        self._supported_styles.add(Style.STOP_LIMIT)
+
+        self._pre_create_hooks = self._bind_hooks('pre_create')
+        self._post_create_hooks = self._bind_hooks('post_create')
+        self._post_delete_hooks = self._bind_hooks('post_delete')
+        self._pre_fill_hooks = self._bind_hooks('pre_fill')
+        self._post_match_hooks = self._bind_hooks('post_match')
+        self._replenish_hooks = self._bind_hooks('replenish')
+        self._amend_hooks = self._bind_hooks('amend')
+        self._reserve_hooks = self._bind_hooks('reserve')
+        self._replenish_styles = set(
+            style
+            for styles, _ in self._replenish_hooks
+            for style in styles
+        )
+        self._pre_fill_styles = set(
+            style
+            for styles, _ in self._pre_fill_hooks
+            for style in styles
+        )
+        # The number of live orders of each style on each side, and in total.
+        self._style_counts: Dict[Side, Dict[Style, int]] = {
+            side: {style: 0 for style in Style}
+            for side in Side
+        }
+        self._live_counts: Dict[Style, int] = {style: 0 for style in Style}
 
         self._orders: Dict[int, Order] = {}
+        # The live orders of each owner.
+        self._owners: Dict[str, Dict[int, Order]] = {}
+        # The order ids of the sides of each owner's quote.
+        self._quotes: Dict[str, Dict[Side, int]] = {}
+        # The live orders with an expiry, bucketed by expiry time, and a heap
+        # of the expiry times. A bucket is removed when it is emptied, leaving
+        # its time in the heap to be skipped.
+        self._expiries: Dict[float, Dict[int, Order]] = {}
+        self._expiry_times: List[float] = []
         self._next_order_id = 1
+        self._tick_size = None if tick_size is None else TickSize(tick_size)
+        self._ticks_per_unit = (
+            None if self._tick_size is None else self._tick_size.ticks_per_unit
+        )
         self._limit_sides = {
-            Side.BUY: AggregateOrderSide(False),
-            Side.SELL: AggregateOrderSide(True)
+            Side.BUY: side_factory(False, self._tick_size),
+            Side.SELL: side_factory(True, self._tick_size)
         }
         self._stop_sides = {
-            Side.BUY: AggregateOrderSide(True),
-            Side.SELL: AggregateOrderSide(False)
+            Side.BUY: StopOrderSide(True, self._tick_size),
+            Side.SELL: StopOrderSide(False, self._tick_size)
         }
+        self._last_price: Price | None = None
+        self._pool = ObjectPool() if pooling else None
+        for side in (*self._limit_sides.values(), *self._stop_sides.values()):
+            side.pool = self._pool
+        self._version = 0
+        self._bbo: tuple[TopOfBook | None, TopOfBook | None] = (None, None)
+        self._bbo_version = 0
+        # The prices of the bid and offer levels which have changed since the
+        # level updates were last taken.
+        self._changed_levels: Dict[Side, Set[Price]] = {
+            side: set() for side in Side
+        }
+        self._level_sequence = 0
+        # The events of the current call, or None without a listener.
+        self._listener = listener
+        self._events: List[OrderEvent] | None = None if listener is None else []
+        self._sequence = count(1) if sequence is None else sequence
+
+    def _bind_hooks(self, name: str) -> List[Hook]:
+        # Bind the hooks the plugins override, with the styles they handle.
+        return [
+            (frozenset(plugin.valid_styles), getattr(plugin, name))
+            for plugin in self._plugins
+            if getattr(type(plugin), name) is not getattr(Plugin, name)
+        ]
+
+    def _has_orders(self, styles: AbstractSet[Style]) -> bool:
+        live_counts = self._live_counts
+        for style in styles:
+            if live_counts[style]:
+                return True
+        return False
+
+    def style_count(self, side: Side, style: Style) -> int:
+        return self._style_counts[side][style]
+
+    def reserve(self, order: Order) -> int:
+        for styles, hook in self._reserve_hooks:
+            if order.style in styles:
+                return hook(self, order)
+        return 0
 
     def _side(self, order: Order) -> AggregateOrderSide:
         return (
-            self._limit_sides[order.side] if order.style != Style.STOP
+            self._limit_sides[order.side] if order.stop_price is None
             else self._stop_sides[order.side]
         )
 
@@ -63,84 +221,663 @@ class OrderBookManager(AbstractOrderBookManager):
         return self._limit_sides[Side.SELL]
 
     @property
-    def stop_bids(self) -> AggregateOrderSide:
+    def stop_bids(self) -> StopOrderSide:
         return self._stop_sides[Side.BUY]
 
     @property
-    def stop_offers(self) -> AggregateOrderSide:
+    def stop_offers(self) -> StopOrderSide:
         return self._stop_sides[Side.SELL]
 
+    @property
+    def version(self) -> int:
+        return self._version
+
     def depth(
             self,
             levels: int | None
     ) -> tuple[Sequence[AggregateOrder], Sequence[AggregateOrder]]:
         return self.bids.depth(levels), self.offers.depth(levels)
 
+    def depth_arrays(
+            self,
+            levels: int,
+            out: DepthArrays | None = None
+    ) -> DepthArrays:
+        if out is None:
+            out = DepthArrays.empty(levels)
+        elif out.levels < levels:
+            raise ValueError(f"the arrays hold fewer than {levels} levels")
+        out.fill(
+            islice(self.bids.iter_levels(), levels),
+            islice(self.offers.iter_levels(), levels),
+            self._ticks_per_unit
+        )
+        return out
+
+    def size_to_price(self, side: Side, price: Decimal) -> int:
+        return self._opposite(side).size_to_price(
+            price if self._tick_size is None else self._tick_size.to_ticks(price)
+        )
+
+    def cost_to_fill(self, side: Side, size: int) -> Decimal | None:
+        return self._opposite(side).cost_to_fill(size)
+
+    def price_for_size(self, side: Side, size: int) -> Decimal | None:
+        return self._opposite(side).price_for_size(size)
+
+    def _opposite(self, side: Side) -> AggregateOrderSide:
+        return self.offers if side == Side.BUY else self.bids
+
+    def bbo(self) -> tuple[TopOfBook | None, TopOfBook | None]:
+        if self._bbo_version != self._version:
+            self._bbo = self._top_of_book(self.bids), self._top_of_book(self.offers)
+            self._bbo_version = self._version
+        return self._bbo
+
+    @classmethod
+    def _top_of_book(cls, side: AggregateOrderSide) -> TopOfBook | None:
+        if not side:
+            return None
+        best = side.best
+        return TopOfBook(best.price, best.size, best.count)
+
+    def level_updates(self) -> List[LevelUpdate]:
+        updates: List[LevelUpdate] = []
+        for side, prices in self._changed_levels.items():
+            if not prices:
+                continue
+            limit_side = self._limit_sides[side]
+            for price in sorted(prices):
+                level = limit_side.level(price)
+                self._level_sequence += 1
+                updates.append(
+                    LevelUpdate(
+                        self._level_sequence,
+                        side,
+                        self._to_price(price),
+                        0 if level is None else level.size,
+                        0 if level is None else level.count
+                    )
+                )
+            prices.clear()
+        return updates
+
+    def _to_price(self, price: Price) -> Decimal:
+        return (
+            cast(Decimal, price) if self._tick_size is None
+            else self._tick_size.to_price(cast(int, price))
+        )
+
+    def _record(
+            self,
+            kind: OrderEventKind,
+            order: Order,
+            price: Decimal,
+            size: int
+    ) -> None:
+        cast(List[OrderEvent], self._events).append(
+            OrderEvent(
+                next(self._sequence),
+                time.monotonic_ns(),
+                kind,
+                order.order_id,
+                order.side,
+                price,
+                size
+            )
+        )
+
+    def _publish(self) -> None:
+        # Pass the events of a call to the listener.
+        if self._events:
+            events, self._events = self._events, []
+            cast(OrderEventListener, self._listener)(events)
+
     def add_order(
             self,
             side: Side,
             price: Decimal,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Decimal | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> tuple[int | None, List[Fill], List[int]]:
-        if style not in self._supported_styles:
-            raise ValueError('unsupported style')
-
-        order, cancels = self.create(
-            side,
+        checked_price, checked_stop_price = self._check_order(
             price,
-            size,
-            style
+            style,
+            stop_price,
+            peak
         )
 
-        if order is None:
-            return None, [], []
+        if self._pool is not None:
+            self._pool.recycle()
+
+        result = self._add_orders(
+            [(side, checked_price, size, style, checked_stop_price, owner, expiry, peak)]
+        )[0]
+        self._publish()
+        return result
+
+    def add_orders(
+            self,
+            orders: Iterable[OrderRequest]
+    ) -> tuple[List[tuple[int | None, List[Fill], List[int]]], List[Fill], List[int]]:
+        # Validate all the orders before any are added.
+        check_order = self._check_order
+        requests: List[Request] = []
+        for side, price, size, style, stop_price, owner, expiry, peak in orders:
+            checked_price, checked_stop_price = check_order(
+                price,
+                style,
+                stop_price,
+                peak
+            )
+            requests.append(
+                (
+                    side,
+                    checked_price,
+                    size,
+                    style,
+                    checked_stop_price,
+                    owner,
+                    expiry,
+                    peak
+                )
+            )
+
+        if self._pool is not None:
+            self._pool.recycle()
 
-        self._side(order).add_order(order)
+        results = self._add_orders(requests)
 
-        # Try to match the new order with the book. The id of the order that
-        # instigated the changes is supplied. The match may generated fills and
-        # cancellations.
-        fills, cancels = self._match(order, cancels)
+        fills: List[Fill] = []
+        cancels: List[int] = []
+        for _, order_fills, order_cancels in results:
+            if order_fills:
+                fills += order_fills
+            if order_cancels:
+                cancels += order_cancels
+
+        self._publish()
+        return results, fills, cancels
 
-        # Return the order id and any fills and cancels that were generated.
-        return order.order_id, fills, list(map(lambda x: x.order_id, cancels))
+    def _check_order(
+            self,
+            price: Decimal,
+            style: Style,
+            stop_price: Decimal | None,
+            peak: int | None
+    ) -> tuple[Price, Price | None]:
+        # Validate an order, and return its price and the price at which it
+        # is triggered, in ticks if the book has a tick size.
+        if style not in self._supported_styles:
+            raise ValueError('unsupported style')
+        if (stop_price is None) == (style == Style.STOP_LIMIT):
+            raise ValueError('a stop price is required for stop-limit orders only')
+        if (peak is None) == (style == Style.ICEBERG):
+            raise ValueError('a peak is required for iceberg orders only')
+        if peak is not None and peak <= 0:
+            raise ValueError('peak must be greater than 0')
+
+        if self._tick_size is None:
+            return price, price if style == Style.STOP else stop_price
+
+        ticks = self._tick_size.to_ticks(price)
+        if style == Style.STOP:
+            return ticks, ticks
+        return ticks, None if stop_price is None else self._tick_size.to_ticks(stop_price)
+
+    def _add_orders(
+            self,
+            requests: Sequence[Request]
+    ) -> List[tuple[int | None, List[Fill], List[int]]]:
+        # Add validated orders in sequence. The sides and methods are looked
+        # up once for the batch.
+        create, match = self.create, self._match
+        limit_sides, stop_sides = self._limit_sides, self._stop_sides
+        changed_levels = self._changed_levels
+        bids, offers = limit_sides[Side.BUY], limit_sides[Side.SELL]
+        stop_bids, stop_offers = stop_sides[Side.BUY], stop_sides[Side.SELL]
+
+        results: List[tuple[int | None, List[Fill], List[int]]] = []
+        for side, price, size, style, stop_price, owner, expiry, peak in requests:
+            order, cancels = create(
+                side,
+                price,
+                size,
+                style,
+                stop_price,
+                owner,
+                expiry,
+                peak
+            )
+
+            if order is None:
+                results.append((None, [], []))
+                continue
+
+            self._version += 1
+            if stop_price is None:
+                limit_sides[side].add_order(order)
+                changed_levels[side].add(price)
+            else:
+                stop_sides[side].add_order(order)
+
+            # Try to match the new order with the book. The id of the order
+            # that instigated the changes is supplied. The match may generated
+            # fills and cancellations. As the book was not crossed before the
+            # order was added, a limit order which does not reach the opposite
+            # best price cannot match unless there are stops to trigger.
+            fills: List[Fill] = []
+            if (
+                    stop_bids or
+                    stop_offers or
+                    (
+                        offers and price >= offers.best.key if side == Side.BUY
+                        else bids and price <= bids.best.key
+                    )
+            ):
+                fills, cancels = match(order, cancels)
+
+            # Record the order id and any fills and cancels that were
+            # generated.
+            results.append((
+                order.order_id,
+                fills,
+                [cancel.order_id for cancel in cancels]
+            ))
+
+        return results
 
     def amend_order(self, order_id: int, size: int) -> None:
         if size <= 0:
             raise ValueError("size must be greater than 0")
 
         order = self.find(order_id)
+        self._amend(order, size)
+        self._version += 1
+        self._publish()
+
+    def _amend(self, order: Order, size: int) -> None:
+        # The size is the total size of the order, of which a plugin may hold
+        # back a reserve.
+        for styles, hook in self._amend_hooks:
+            if order.style in styles:
+                size = hook(self, order, size)
+                break
         self._side(order).amend_order(order, size)
+        if order.stop_price is None:
+            self._changed_levels[order.side].add(order.price)
+        if self._events is not None:
+            self._record(
+                OrderEventKind.AMENDED,
+                order,
+                self._to_price(order.price),
+                size
+            )
+
+    def replace_order(
+            self,
+            order_id: int,
+            price: Decimal,
+            size: int
+    ) -> tuple[int | None, List[Fill], List[int]]:
+        if size <= 0:
+            raise ValueError("size must be greater than 0")
 
-    def cancel_order(self, order_id: int) -> None:
         order = self.find(order_id)
+        key = price if self._tick_size is None else self._tick_size.to_ticks(price)
+
+        if key == order.price and size <= order.size + self.reserve(order):
+            # A reduction in size keeps the place of the order in the queue.
+            self._amend(order, size)
+            self._version += 1
+            self._publish()
+            return order_id, [], []
+
+        request: Request = (
+            order.side,
+            key,
+            size,
+            order.style,
+            key if order.style == Style.STOP else order.stop_price,
+            order.owner,
+            order.expiry,
+            order.peak
+        )
+
+        if self._pool is not None:
+            self._pool.recycle()
+
+        self._cancel(order)
+        self._version += 1
+
+        new_order_id, fills, cancels = self._add_orders([request])[0]
+        if new_order_id is None:
+            # The new order was rejected, so the order has been cancelled.
+            cancels = [order_id]
+        self._publish()
+        return new_order_id, fills, cancels
+
+    def update_quote(
+            self,
+            owner: str,
+            bid_price: Decimal | None,
+            bid_size: int,
+            offer_price: Decimal | None,
+            offer_size: int
+    ) -> QuoteResult:
+        if bid_size < 0 or offer_size < 0:
+            raise ValueError("size must not be less than 0")
+
+        # Validate both sides before changing either.
+        requests: List[tuple[Side, Price | None, int]] = [
+            (
+                side,
+                None if price is None or size == 0
+                else price if self._tick_size is None
+                else self._tick_size.to_ticks(price),
+                size
+            )
+            for side, price, size in (
+                (Side.BUY, bid_price, bid_size),
+                (Side.SELL, offer_price, offer_size)
+            )
+        ]
+        (_, bid, _), (_, offer, _) = requests
+        if bid is not None and offer is not None and bid >= offer:
+            # The sides of a quote would trade with each other.
+            raise ValueError("the quote is crossed or locked")
+
+        if self._pool is not None:
+            self._pool.recycle()
+
+        quote = self._quotes.get(owner)
+        if quote is None:
+            quote = self._quotes[owner] = {}
+
+        # Remove the sides which are withdrawn or replaced before adding any,
+        # so a new bid cannot trade with the offer it replaces.
+        order_ids: Dict[Side, int | None] = {}
+        adds: List[Request] = []
+        changed = False
+        for side, price, size in requests:
+            order_id = quote.get(side)
+            order = None if order_id is None else self._orders.get(order_id)
+            if order is None and price is None:
+                # There is nothing to withdraw.
+                quote.pop(side, None)
+                order_ids[side] = None
+                continue
+            if order is not None and order.price == price and order.size == size:
+                # The side is unchanged.
+                order_ids[side] = order.order_id
+                continue
+
+            changed = True
+            if order is not None and price == order.price and size <= order.size:
+                # A reduction in size keeps the place of the order in the
+                # queue.
+                self._amend(order, size)
+                order_ids[side] = order.order_id
+                continue
+
+            if order is not None:
+                self._cancel(order)
+            quote.pop(side, None)
+            order_ids[side] = None
+            if price is not None:
+                adds.append(
+                    (side, price, size, Style.LIMIT, None, owner, None, None)
+                )
+
+        if changed:
+            self._version += 1
+
+        fills: List[Fill] = []
+        cancels: List[int] = []
+        for request, (order_id, order_fills, order_cancels) in zip(
+                adds,
+                self._add_orders(adds)
+        ):
+            side = request[0]
+            order_ids[side] = order_id
+            if order_id is not None and order_id in self._orders:
+                quote[side] = order_id
+            fills += order_fills
+            cancels += order_cancels
+
+        if not quote:
+            del self._quotes[owner]
+
+        self._publish()
+        return QuoteResult(
+            order_ids[Side.BUY],
+            order_ids[Side.SELL],
+            fills,
+            cancels
+        )
+
+    def cancel_order(self, order_id: int) -> None:
+        if self._pool is not None:
+            self._pool.recycle()
+
+        self._cancel(self.find(order_id))
+        self._version += 1
+        self._publish()
+
+    def _cancel(self, order: Order) -> None:
         self._side(order).cancel_order(order)
+        if order.stop_price is None:
+            self._changed_levels[order.side].add(order.price)
+        if self._events is not None:
+            self._record(
+                OrderEventKind.CANCELLED,
+                order,
+                self._to_price(order.price),
+                order.size
+            )
         self.delete(order)
 
+    def cancel_orders(
+            self,
+            side: Side | None = None,
+            owner: str | None = None,
+            style: Style | None = None,
+            min_price: Decimal | None = None,
+            max_price: Decimal | None = None
+    ) -> List[int]:
+        if self._pool is not None:
+            self._pool.recycle()
+
+        low, high = self._price_range(min_price, max_price)
+
+        def is_selected(order: Order) -> bool:
+            return (
+                (side is None or order.side == side) and
+                (style is None or order.style == style) and
+                (low is None or order.price >= low) and
+                (high is None or order.price <= high)
+            )
+
+        cancels: List[Order] = []
+        if owner is not None:
+            # The orders of an owner are found from its index.
+            cancels = [
+                order
+                for order in self._owners.get(owner, {}).values()
+                if is_selected(order)
+            ]
+            for order in cancels:
+                self._side(order).cancel_order(order)
+        else:
+            for order_side in Side if side is None else (side,):
+                if style is not None and not self._style_counts[order_side][style]:
+                    continue
+
+                stops = [
+                    order
+                    for level in self._stop_sides[order_side].depth(None)
+                    for order in level.orders
+                    if is_selected(order)
+                ]
+                for order in stops:
+                    self._stop_sides[order_side].cancel_order(order)
+                cancels += stops
+
+                limit_side = self._limit_sides[order_side]
+                if style is None:
+                    # The levels in the price range are removed together.
+                    orders = limit_side.cancel_levels(low, high)
+                else:
+                    orders = [
+                        order
+                        for level in limit_side.depth(None)
+                        if (low is None or level.key >= low) and
+                        (high is None or level.key <= high)
+                        for order in level.orders
+                        if order.style == style
+                    ]
+                    for order in orders:
+                        limit_side.cancel_order(order)
+                cancels += orders
+
+        self._delete_orders(cancels, OrderEventKind.CANCELLED)
+        if cancels:
+            self._version += 1
+        self._publish()
+        return sorted(order.order_id for order in cancels)
+
+    def expire(self, now: float) -> List[int]:
+        if self._pool is not None:
+            self._pool.recycle()
+
+        expiries, expiry_times = self._expiries, self._expiry_times
+        expired: List[Order] = []
+        while expiry_times and expiry_times[0] <= now:
+            bucket = expiries.get(heapq.heappop(expiry_times))
+            if bucket is None:
+                continue
+            orders = list(bucket.values())
+            for order in orders:
+                self._side(order).cancel_order(order)
+            self._delete_orders(orders, OrderEventKind.EXPIRED)
+            expired += orders
+
+        if expired:
+            self._version += 1
+        self._publish()
+        return sorted(order.order_id for order in expired)
+
+    def _schedule(self, order: Order, expiry: float) -> None:
+        bucket = self._expiries.get(expiry)
+        if bucket is None:
+            bucket = self._expiries[expiry] = {}
+            expiry_times = self._expiry_times
+            if len(expiry_times) > 2 * len(self._expiries) + 64:
+                # Discard the times of the buckets which have been emptied.
+                expiry_times[:] = self._expiries
+                heapq.heapify(expiry_times)
+            else:
+                heapq.heappush(expiry_times, expiry)
+        bucket[order.order_id] = order
+
+    def _unschedule(self, order: Order) -> None:
+        bucket = self._expiries[cast(float, order.expiry)]
+        del bucket[order.order_id]
+        if not bucket:
+            del self._expiries[cast(float, order.expiry)]
+
+    def _price_range(
+            self,
+            min_price: Decimal | None,
+            max_price: Decimal | None
+    ) -> tuple[Price | None, Price | None]:
+        # The range of prices in ticks contains the ticks within the decimal
+        # range, which need not be multiples of the tick size.
+        if self._tick_size is None:
+            return min_price, max_price
+
+        tick_size = self._tick_size.tick_size
+        return (
+            None if min_price is None else math.ceil(min_price / tick_size),
+            None if max_price is None else math.floor(max_price / tick_size)
+        )
+
     def create(
             self,
             side: Side,
-            price: Decimal,
+            price: Price,
             size: int,
-            style: Style
+            style: Style,
+            stop_price: Price | None = None,
+            owner: str | None = None,
+            expiry: float | None = None,
+            peak: int | None = None
     ) -> tuple[Order | None, List[Order]]:
         if not self._pre_create(side, price, style):
             return None, []
 
-        order = Order(self._next_order_id, side, price, size, style)
+        order = (
+            Order(
+                self._next_order_id,
+                side,
+                price,
+                size,
+                style,
+                stop_price,
+                owner,
+                expiry,
+                peak
+            )
+            if self._pool is None
+            else self._pool.create_order(
+                self._next_order_id,
+                side,
+                price,
+                size,
+                style,
+                stop_price,
+                owner,
+                expiry,
+                peak
+            )
+        )
         self._orders[order.order_id] = order
+        if owner is not None:
+            owned = self._owners.get(owner)
+            if owned is None:
+                owned = self._owners[owner] = {}
+            owned[order.order_id] = order
+        if expiry is not None:
+            self._schedule(order, expiry)
+        self._style_counts[side][style] += 1
+        self._live_counts[style] += 1
         self._next_order_id += 1
 
         cancels = self._post_create(order)
+        if self._events is not None:
+            # The size is recorded after the hooks, which may hold back a
+            # reserve, so the events give the displayed sizes.
+            self._record(
+                OrderEventKind.ACCEPTED,
+                order,
+                self._to_price(price),
+                order.size
+            )
         for cancel in cancels:
-            self.cancel_order(cancel.order_id)
+            self._cancel(cancel)
 
         return order, cancels
 
-    def _pre_create(self, side: Side, price: Decimal, style: Style) -> bool:
-        for plugin in self._plugins:
-            if not plugin.pre_create(self, side, price, style):
+    def _pre_create(self, side: Side, price: Price, style: Style) -> bool:
+        for styles, hook in self._pre_create_hooks:
+            if (
+                    (style in styles or self._has_orders(styles)) and
+                    not hook(self, side, price, style)
+            ):
                 return False
 
         return True
@@ -148,8 +885,10 @@ class OrderBookManager(AbstractOrderBookManager):
     def _post_create(self, order: Order) -> List[Order]:
         cancels: List[Order] = []
 
-        for plugin in self._plugins:
-            cancels += plugin.post_create(self, order)
+        # The new order is live, so it is included in the style counts.
+        for styles, hook in self._post_create_hooks:
+            if self._has_orders(styles):
+                cancels += hook(self, order)
 
         return cancels
 
@@ -158,11 +897,56 @@ class OrderBookManager(AbstractOrderBookManager):
 
     def delete(self, order: Order) -> None:
         del self._orders[order.order_id]
+        if order.owner is not None:
+            owned = self._owners[order.owner]
+            del owned[order.order_id]
+            if not owned:
+                del self._owners[order.owner]
+        if order.expiry is not None:
+            self._unschedule(order)
         self._post_delete(order)
+        self._style_counts[order.side][order.style] -= 1
+        self._live_counts[order.style] -= 1
+        if self._pool is not None:
+            self._pool.release(order)
+
+    def _delete_orders(self, orders: List[Order], kind: OrderEventKind) -> None:
+        # Delete many orders which have been removed from the sides, recording
+        # events of the kind given. The post-delete hooks of the plugins with
+        # live orders are found once.
+        hooks = [
+            hook
+            for styles, hook in self._post_delete_hooks
+            if self._has_orders(styles)
+        ]
+        live_orders, owners = self._orders, self._owners
+        style_counts, live_counts = self._style_counts, self._live_counts
+        changed_levels = self._changed_levels
+        for order in orders:
+            del live_orders[order.order_id]
+            if order.stop_price is None:
+                changed_levels[order.side].add(order.price)
+            if self._events is not None:
+                self._record(kind, order, self._to_price(order.price), order.size)
+            if order.owner is not None:
+                owned = owners[order.owner]
+                del owned[order.order_id]
+                if not owned:
+                    del owners[order.owner]
+            if order.expiry is not None:
+                self._unschedule(order)
+            for hook in hooks:
+                hook(self, order)
+            style_counts[order.side][order.style] -= 1
+            live_counts[order.style] -= 1
+        if self._pool is not None:
+            for order in orders:
+                self._pool.release(order)
 
     def _post_delete(self, order: Order) -> None:
-        for plugin in self._plugins:
-            plugin.post_delete(self, order)
+        for styles, hook in self._post_delete_hooks:
+            if self._has_orders(styles):
+                hook(self, order)
 
     def _match(
             self,
@@ -171,6 +955,10 @@ class OrderBookManager(AbstractOrderBookManager):
     ) -> tuple[List[Fill], List[Order]]:
         """Match bids against offers generating fills.
 
+        After the aggressor has been matched any stops triggered by the trades
+        or the quotes are released as limit orders in time priority, and
+        matched in turn. These may trigger further stops.
+
         Args:
             aggressor (Order): The order that instigated the match.
             cancels (List[Order]): A list of already cancelled orders.
@@ -179,152 +967,225 @@ class OrderBookManager(AbstractOrderBookManager):
             tuple[List[Order], List[Order]: The fills and cancels.
         """
         fills: List[Fill] = []
+        self._match_limits(aggressor, fills, cancels)
+
+        while self.stop_bids or self.stop_offers:
+            triggered = self._trigger_stops()
+            if not triggered:
+                break
+
+            for order in triggered:
+                self._release(order)
+                self._match_limits(order, fills, cancels)
+
+        return fills, cancels
+
+    def _match_limits(
+            self,
+            aggressor: Order,
+            fills: List[Fill],
+            cancels: List[Order]
+    ) -> None:
+        # The orders at the front of the best bid and offer levels are filled
+        # against each other until one of the levels is exhausted. The
+        # post-match hooks are then called, and the next levels are matched.
+        # A pre-fill hook is only called when one of the orders to be filled
+        # has a style handled by its plugin.
+        bids, offers = self.bids, self.offers
+        pre_fill_styles = self._pre_fill_styles
+        changed_bids = self._changed_levels[Side.BUY]
+        changed_offers = self._changed_levels[Side.SELL]
         while self._can_match:
-            bids, offers = self._fillable_sides(aggressor)
+            bid_level, offer_level = bids.best, offers.best
+            changed_bids.add(bid_level.key)
+            changed_offers.add(offer_level.key)
 
-            while bids.best and offers.best:
+            while bid_level and offer_level:
+                bid, offer = bid_level.first, offer_level.first
 
                 # Check if any orders require cancellation.
-                cancel_orders = self._pre_fill(bids, offers, aggressor)
-                if cancel_orders:
-                    for order in cancel_orders:
-                        cancels.append(order)
-                        self._side(order).cancel_order(order)
-                    break
+                if bid.style in pre_fill_styles or offer.style in pre_fill_styles:
+                    cancel_orders = self._pre_fill(
+                        bids,
+                        offers,
+                        bid,
+                        offer,
+                        aggressor
+                    )
+                    if cancel_orders:
+                        for order in cancel_orders:
+                            cancels.append(order)
+                            self._cancel(order)
+                        break
 
                 fills.append(
-                    self._fill_best(bids, offers, aggressor)
+                    self._fill(bid_level, bid, offer_level, offer, aggressor)
                 )
 
             # Check if any orders require cancellation.
             cancel_orders = self._post_match()
             for order in cancel_orders:
                 cancels.append(order)
-                self._side(order).cancel_order(order)
-
-            # if all orders have been executed at this price level remove the
-            # price level.
-            if self.bids and not self.bids.best:
-                self.bids.delete_best()
-            if self.offers and not self.offers.best:
-                self.offers.delete_best()
-            if self.stop_bids and not self.stop_bids.best:
-                self.stop_bids.delete_best()
-            if self.stop_offers and not self.stop_offers.best:
-                self.stop_offers.delete_best()
-
-        return fills, cancels
+                self._cancel(order)
+
+            # Only an exhausted best level remains, as cancelling an order
+            # removes an empty level.
+            if bids and not bids.best:
+                bids.delete_best()
+            if offers and not offers.best:
+                offers.delete_best()
+
+    def _trigger_stops(self) -> List[Order]:
+        # Buy stops are triggered by the last trade or the best offer rising
+        # to the stop price, and sell stops by the last trade or the best bid
+        # falling to it.
+        orders: List[Order] = []
+
+        if self.stop_bids:
+            prices = [
+                price
+                for price in (
+                    self._last_price,
+                    self.offers.best.key if self.offers else None
+                )
+                if price is not None
+            ]
+            if prices:
+                orders += self.stop_bids.trigger(max(prices))
+
+        if self.stop_offers:
+            prices = [
+                price
+                for price in (
+                    self._last_price,
+                    self.bids.best.key if self.bids else None
+                )
+                if price is not None
+            ]
+            if prices:
+                orders += self.stop_offers.trigger(min(prices))
+
+        orders.sort(key=lambda x: x.order_id)
+        return orders
+
+    def _release(self, order: Order) -> None:
+        # Convert a triggered stop into a limit order and add it to the book.
+        self._style_counts[order.side][order.style] -= 1
+        self._live_counts[order.style] -= 1
+        order.trigger()
+        self._style_counts[order.side][order.style] += 1
+        self._live_counts[order.style] += 1
+        self._limit_sides[order.side].add_order(order)
+        self._changed_levels[order.side].add(order.price)
+        if self._events is not None:
+            self._record(
+                OrderEventKind.TRIGGERED,
+                order,
+                self._to_price(order.price),
+                order.size
+            )
 
     @property
     def _can_match(self) -> bool:
-        if (
-                self.bids and
-                self.offers and
-                self.bids.best.price >= self.offers.best.price
-        ):
-            return True
-
-        # Sell stop
-        # The buy price drops to at or below the sell stop
-        if (
-            self.bids and
-            self.stop_offers and
-            self.bids.best.price <= self.stop_offers.best.price
-        ):
-            return True
-
-        # Buy stop
-        # The sell price rises to at or above the buy stop
-        if (
-            self.stop_bids and
-            self.offers and
-            self.stop_bids.best.price <= self.offers.best.price
-        ):
-            return True
-
-        return False
+        return (
+            bool(self.bids) and
+            bool(self.offers) and
+            self.bids.best.key >= self.offers.best.key
+        )
 
-    def _fill_best(
+    def _fill(
             self,
-            bids: AggregateOrderSide,
-            offers: AggregateOrderSide,
+            bid_level: AggregateOrder,
+            bid: Order,
+            offer_level: AggregateOrder,
+            offer: Order,
             aggressor: Order
     ) -> Fill:
         # The price is that of the newest order in case of a cross;
         # where the newest order price exceeds (rather than matched)
         # the best opposing price.
-        fill_size = min(
-            bids.best.first.size,
-            offers.best.first.size
-        )
+        fill_size = min(bid.size, offer.size)
         fill_price = (
-            bids.best.first.price
-            if bids.best.first.order_id == aggressor.order_id
-            else offers.best.first.price
+            bid.price
+            if bid.order_id == aggressor.order_id
+            else offer.price
         )
 
+        self._last_price = fill_price
         fill = Fill(
-            bids.best.first.order_id,
-            offers.best.first.order_id,
-            fill_price,
+            bid.order_id,
+            offer.order_id,
+            cast(Decimal, fill_price) if self._tick_size is None
+            else self._tick_size.to_price(cast(int, fill_price)),
             fill_size
         )
+        if self._events is not None:
+            self._record(OrderEventKind.FILLED, bid, fill.price, fill_size)
+            self._record(OrderEventKind.FILLED, offer, fill.price, fill_size)
+
+        # Decrement the orders by the trade size. The price levels remove
+        # orders which have been completely executed, and these are then
+        # deleted, unless they are replenished.
+
+        bid_level.fill_first(fill_size)
+        if bid.size == 0 and not (
+                bid.style in self._replenish_styles and
+                self._replenish(bid_level, bid)
+        ):
+            self.delete(bid)
 
-        # Decrement the orders by the trade size, then check if the
-        # orders have been completely executed; if they have, delete
-        # them.
-
-        bids.best.first.size -= fill_size
-        if bids.best.first.size == 0:
-            self.delete(bids.best.first)
-            bids.best.delete_first()
-
-        offers.best.first.size -= fill_size
-        if offers.best.first.size == 0:
-            self.delete(offers.best.first)
-            offers.best.delete_first()
+        offer_level.fill_first(fill_size)
+        if offer.size == 0 and not (
+                offer.style in self._replenish_styles and
+                self._replenish(offer_level, offer)
+        ):
+            self.delete(offer)
 
         return fill
 
-    def _fillable_sides(self, aggressor: Order) -> tuple[AggregateOrderSide, AggregateOrderSide]:
-        if (
-            aggressor.side == Side.SELL and
-            self.stop_bids and
-            self.offers and
-            self.stop_bids.best.price >= self.offers.best.price and
-            self.stop_bids.best.first.order_id < self.offers.best.first.order_id
-        ):
-            return self.stop_bids, self.offers
-
-        if (
-            aggressor.side == Side.BUY and
-            self.bids and
-            self.stop_offers and
-            self.bids.best.price >= self.stop_offers.best.price and
-            self.bids.best.first.order_id > self.stop_offers.best.first.order_id
-        ):
-            return self.bids, self.stop_offers
-
-        return self.bids, self.offers
+    def _replenish(self, level: AggregateOrder, order: Order) -> bool:
+        # Give a filled order a new size from a plugin, and move it to the
+        # back of its level, without adding it to the book again. The level is
+        # the best of its side, whose size is not held in the side's tree of
+        # level sizes.
+        for styles, hook in self._replenish_hooks:
+            if order.style in styles:
+                size = hook(self, order)
+                if size > 0:
+                    order.size = size
+                    level.append(order)
+                    if self._events is not None:
+                        self._record(
+                            OrderEventKind.AMENDED,
+                            order,
+                            level.price,
+                            size
+                        )
+                    return True
+        return False
 
     def _pre_fill(
             self,
             bids: AggregateOrderSide,
             offers: AggregateOrderSide,
+            bid: Order,
+            offer: Order,
             aggressor: Order
     ) -> List[Order]:
         cancels: List[Order] = []
 
-        for plugin in self._plugins:
-            cancels += plugin.pre_fill(self, bids, offers, aggressor)
+        for styles, hook in self._pre_fill_hooks:
+            if bid.style in styles or offer.style in styles:
+                cancels += hook(self, bids, offers, aggressor)
 
         return cancels
 
     def _post_match(self) -> List[Order]:
         cancels: List[Order] = []
 
-        for plugin in self._plugins:
-            cancels += plugin.post_match(self)
+        for styles, hook in self._post_match_hooks:
+            if self._has_orders(styles):
+                cancels += hook(self)
 
         return cancels
 
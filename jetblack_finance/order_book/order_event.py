@@ -0,0 +1,47 @@
+"""Order events"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from enum import Enum, auto
+from typing import Callable, List, NamedTuple
+
+from .order import Side
+
+
+class OrderEventKind(Enum):
+    """The kind of an order event"""
+
+    ACCEPTED = auto()
+    AMENDED = auto()
+    TRIGGERED = auto()
+    FILLED = auto()
+    CANCELLED = auto()
+    EXPIRED = auto()
+
+    __hash__ = object.__hash__
+
+
+class OrderEvent(NamedTuple):
+    """An event in the life of an order.
+
+    The size is the size of the order when it is accepted, amended or
+    triggered, the size filled when it is filled, and the unfilled size when
+    it is cancelled or expires. The price of a fill is the fill price.
+
+    The sizes are the displayed sizes, so the events rebuild the book. The
+    reserve of an iceberg is not included, and each replenishment of an
+    iceberg is an amend.
+    """
+
+    sequence: int
+    timestamp: int
+    kind: OrderEventKind
+    order_id: int
+    side: Side
+    price: Decimal
+    size: int
+
+
+OrderEventListener = Callable[[List[OrderEvent]], None]
+"""A listener which is called with the events of each call to an order book."""
@@ -0,0 +1,21 @@
+"""Order request"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import NamedTuple
+
+from .order import Side, Style
+
+
+class OrderRequest(NamedTuple):
+    """An order to add, as submitted in a batch."""
+
+    side: Side
+    price: Decimal
+    size: int
+    style: Style
+    stop_price: Decimal | None = None
+    owner: str | None = None
+    expiry: float | None = None
+    peak: int | None = None
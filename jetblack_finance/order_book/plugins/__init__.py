@@ -2,10 +2,12 @@
 
 from .book_or_cancel import BookOrCancelPlugin
 from .fill_or_kill import FillOrKillPlugin
+from .iceberg import IcebergPlugin
 from .immediate_or_cancel import ImmediateOrCancelPlugin
 
 __all__ = [
     'BookOrCancelPlugin',
     'FillOrKillPlugin',
+    'IcebergPlugin',
     'ImmediateOrCancelPlugin',
 ]
@@ -4,6 +4,11 @@ A fill-or-kill order must be completely filled; otherwise it must be cancelled.
 
 The pre_fill hook can be used to catch fill-or-kill orders that cannot be
 completely filled.
+
+An aggressive fill-or-kill order is checked once, before its first fill,
+against the total size of the opposite side to its limit price, including
+the reserves of icebergs, so it may be filled by many orders over many levels.
+A resting fill-or-kill order must be filled by the single order which hits it.
 """
 
 from __future__ import annotations
@@ -14,9 +19,8 @@ from ..abstract_types import (
     AbstractOrderBookManager,
     Plugin
 )
-from ..aggregate_order import AggregateOrder
 from ..aggregate_order_side import AggregateOrderSide
-from ..order import Order, Style
+from ..order import Order, Side, Style
 
 
 class FillOrKillPlugin(Plugin):
@@ -26,6 +30,11 @@ class FillOrKillPlugin(Plugin):
     def valid_styles(self) -> Sequence[Style]:
         return (Style.FILL_OR_KILL,)
 
+    def __init__(self) -> None:
+        # The id of the last aggressor found to be fillable, so it is only
+        # checked before its first fill.
+        self._accepted: int | None = None
+
     def pre_fill(
             self,
             manager: AbstractOrderBookManager,
@@ -33,45 +42,66 @@ class FillOrKillPlugin(Plugin):
             offers: AggregateOrderSide,
             aggressor: Order
     ) -> List[Order]:
-
-        cancels: List[Order] = []
-
-        # Ensure time weighted.
-        order = (
-            self._handle_fill_or_kill(
-                bids.best,
-                offers.best
-            )
-            if bids.best.first.order_id < offers.best.first.order_id
-            else self._handle_fill_or_kill(
-                offers.best,
-                bids.best
-            )
-        )
-
-        if order is not None:
-            cancels.append(order)
-
-        return cancels
+        bid, offer = bids.best.first, offers.best.first
+
+        # Resting orders are older than the aggressor, so are handled first.
+        for order, other in ((bid, offer), (offer, bid)):
+            if (
+                    order is not aggressor and
+                    order.style == Style.FILL_OR_KILL and
+                    order.size > other.size
+            ):
+                return [order]
+
+        if (
+                aggressor.style == Style.FILL_OR_KILL and
+                aggressor.order_id != self._accepted and
+                (aggressor is bid or aggressor is offer)
+        ):
+            if not self._can_fill(manager, aggressor):
+                return [aggressor]
+            self._accepted = aggressor.order_id
+
+        return []
 
     @classmethod
-    def _handle_fill_or_kill(
+    def _can_fill(
             cls,
-            order1: AggregateOrder,
-            order2: AggregateOrder,
-    ) -> Order | None:
-        if cls._should_cancel(order1.first, order2.first):
-            return order1.first
-
-        if cls._should_cancel(order2.first, order1.first):
-            return order2.first
-
-        return None
-
-    @classmethod
-    def _should_cancel(cls, order1: Order, order2: Order) -> bool:
-        # If this is a fill-or-kill order the order must be completely filled.
-        return (
-            order1.style == Style.FILL_OR_KILL and
-            order1.size > order2.size
-        )
+            manager: AbstractOrderBookManager,
+            aggressor: Order
+    ) -> bool:
+        if aggressor.side == Side.BUY:
+            side, opposite = manager.offers, Side.SELL
+        else:
+            side, opposite = manager.bids, Side.BUY
+
+        if (
+                manager.style_count(opposite, Style.FILL_OR_KILL) == 0 and
+                manager.style_count(opposite, Style.ICEBERG) == 0
+        ):
+            return side.size_to_price(aggressor.price) >= aggressor.size
+
+        # Resting fill-or-kill orders larger than the unfilled size will be
+        # cancelled rather than filled, and the reserves of icebergs are not
+        # in the sizes of the levels, so the levels must be walked.
+        levels = side.depth(None)
+        remaining = aggressor.size
+        for level in levels if side is manager.offers else reversed(levels):
+            if (
+                    level.key > aggressor.price if aggressor.side == Side.BUY
+                    else level.key < aggressor.price
+            ):
+                break
+            reserve = 0
+            for order in level.orders:
+                if order.style == Style.FILL_OR_KILL and order.size > remaining:
+                    continue
+                remaining -= min(order.size, remaining)
+                if remaining == 0:
+                    return True
+                reserve += manager.reserve(order)
+            # The reserves are replenished at the back of the level.
+            remaining -= min(reserve, remaining)
+            if remaining == 0:
+                return True
+        return False
@@ -0,0 +1,84 @@
+"""A plugin for iceberg orders.
+
+An iceberg order displays only a part of its size, its peak, and holds the
+rest in a hidden reserve. When the displayed part has been filled it is
+replenished from the reserve, and moves to the back of its price level.
+
+The post_create hook splits the size of a new order into the displayed part
+and the reserve, and the replenish hook refills the displayed part, so the
+order is not added again. An amend gives the order a new total size, which the
+amend hook splits in the same way.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, cast
+
+from ..abstract_types import (
+    AbstractOrderBookManager,
+    Plugin
+)
+from ..order import Order, Style
+
+
+class IcebergPlugin(Plugin):
+    """A plugin which handles iceberg orders"""
+
+    @property
+    def valid_styles(self) -> Sequence[Style]:
+        return (Style.ICEBERG,)
+
+    def __init__(self) -> None:
+        # The hidden reserve of each iceberg order with a reserve.
+        self._reserves: Dict[int, int] = {}
+
+    def post_create(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order
+    ) -> List[Order]:
+        peak = cast(int, order.peak)
+        if order.style == Style.ICEBERG and order.size > peak:
+            # The order is not yet in a price level, so its size can be
+            # changed directly.
+            self._reserves[order.order_id] = order.size - peak
+            order.size = peak
+        return []
+
+    def post_delete(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order
+    ) -> None:
+        self._reserves.pop(order.order_id, None)
+
+    def replenish(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order
+    ) -> int:
+        reserve = self._reserves.pop(order.order_id, 0)
+        size = min(cast(int, order.peak), reserve)
+        if reserve > size:
+            self._reserves[order.order_id] = reserve - size
+        return size
+
+    def amend(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order,
+            size: int
+    ) -> int:
+        displayed = min(cast(int, order.peak), size)
+        if size > displayed:
+            self._reserves[order.order_id] = size - displayed
+        else:
+            self._reserves.pop(order.order_id, None)
+        return displayed
+
+    def reserve(
+            self,
+            manager: AbstractOrderBookManager,
+            order: Order
+    ) -> int:
+        return self._reserves.get(order.order_id, 0)
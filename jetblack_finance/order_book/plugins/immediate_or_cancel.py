@@ -12,19 +12,20 @@ should be cancelled. This can be handled with the post_create hook.
 
 Finally all IOC orders that were at the best price level during a match that
 were not executed must be cancelled. This can be handled by the post_match hook.
+
+The IOC orders are indexed by side and price, so they can be added, removed,
+and found at the best price levels without searching the levels of the book.
 """
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import Dict, List, Sequence
 
 from ..abstract_types import (
     AbstractOrderBookManager,
     Plugin
 )
-from ..aggregate_order import AggregateOrder
-from ..order import Order, Side, Style
+from ..order import Order, Price, Side, Style
 
 
 class ImmediateOrCancelPlugin(Plugin):
@@ -35,13 +36,26 @@ class ImmediateOrCancelPlugin(Plugin):
         return (Style.IMMEDIATE_OR_CANCEL,)
 
     def __init__(self) -> None:
-        self._immediate_or_cancel: Dict[Side, AggregateOrder] = {}
+        # The live immediate-or-cancel orders by side and price, in time
+        # priority.
+        self._immediate_or_cancel: Dict[Side, Dict[Price, Dict[int, Order]]] = {
+            Side.BUY: {},
+            Side.SELL: {}
+        }
+
+    def _best_price(self, side: Side) -> Price | None:
+        # As a better order cancels those at worse prices, there is normally
+        # only one price level.
+        levels = self._immediate_or_cancel[side]
+        if not levels:
+            return None
+        return max(levels) if side == Side.BUY else min(levels)
 
     def pre_create(
             self,
             manager: AbstractOrderBookManager,
             side: Side,
-            price: Decimal,
+            price: Price,
             style: Style
     ) -> bool:
         if style != Style.IMMEDIATE_OR_CANCEL:
@@ -50,15 +64,16 @@ class ImmediateOrCancelPlugin(Plugin):
         # If there are immediate and cancel orders at a better price then this
         # order is invalid.
 
-        if side not in self._immediate_or_cancel:
+        best_price = self._best_price(side)
+        if best_price is None:
             # There are no immediate-or-cancel orders for this side, so the
             # order is valid.
             return True
-        if side == Side.BUY and price >= self._immediate_or_cancel[side].price:
+        if side == Side.BUY and price >= best_price:
             # The order has the same or a greater price than the exiting buy
             # immediate-or-cancel orders, so the order is valid.
             return True
-        if side == Side.SELL and price <= self._immediate_or_cancel[side].price:
+        if side == Side.SELL and price <= best_price:
             # The order has the same or a lesser price than the exiting sell
             # immediate-or-cancel orders, so the order is valid.
             return True
@@ -78,22 +93,23 @@ class ImmediateOrCancelPlugin(Plugin):
             # Only immediate-or-cancel orders are relevant.
             return []
 
-        if order.side not in self._immediate_or_cancel:
-            # If there are no immediate-or-cancel orders for this side just
-            # add it.
-            self._immediate_or_cancel[order.side] = AggregateOrder(order)
-            return []
-
-        if order.price == self._immediate_or_cancel[order.side].price:
+        levels = self._immediate_or_cancel[order.side]
+        level = levels.get(order.price)
+        if level is not None:
             # If this order is at the same price append it.
-            self._immediate_or_cancel[order.side].append(order)
+            level[order.order_id] = order
             return []
 
         # As the pre_create function has already established this order is valid
-        # there must be other immediate-or-cancel orders at a worse price. Those
-        # orders must be cancelled, replaced with the new order.
-        cancels = self._immediate_or_cancel[order.side].orders
-        self._immediate_or_cancel[order.side] = AggregateOrder(order)
+        # any other immediate-or-cancel orders must be at a worse price. Those
+        # orders must be cancelled, replaced with the new order. They are
+        # removed from the index as they are deleted.
+        cancels = [
+            cancel
+            for level in levels.values()
+            for cancel in level.values()
+        ]
+        levels[order.price] = {order.order_id: order}
 
         return cancels
 
@@ -102,32 +118,32 @@ class ImmediateOrCancelPlugin(Plugin):
             manager: AbstractOrderBookManager,
             order: Order
     ) -> None:
-        # Remove the order from the local cache.
-        if (
-                order.side in self._immediate_or_cancel and
-                order.order_id in self._immediate_or_cancel[order.side]
-        ):
-            self._immediate_or_cancel[order.side].cancel(order.order_id)
+        # Remove the order from the index.
+        if order.style != Style.IMMEDIATE_OR_CANCEL:
+            return
+
+        levels = self._immediate_or_cancel[order.side]
+        level = levels.get(order.price)
+        if level is None or level.pop(order.order_id, None) is None:
+            return
+        if not level:
+            del levels[order.price]
 
     def post_match(
             self,
             manager: AbstractOrderBookManager,
     ) -> List[Order]:
         # After a match any immediate-or-cancel orders at the best price level
-        # must be cancelled.
+        # must be cancelled. These are found in the index by the best prices.
 
         cancels: List[Order] = []
 
-        if manager.bids:
-            orders = manager.bids.best.find_all(
-                lambda x: x.style == Style.IMMEDIATE_OR_CANCEL
-            )
-            cancels += orders
-
-        if manager.offers:
-            orders = manager.offers.best.find_all(
-                lambda x: x.style == Style.IMMEDIATE_OR_CANCEL
-            )
-            cancels += orders
+        buys = self._immediate_or_cancel[Side.BUY]
+        if buys and manager.bids:
+            cancels += buys.get(manager.bids.best.key, {}).values()
+
+        sells = self._immediate_or_cancel[Side.SELL]
+        if sells and manager.offers:
+            cancels += sells.get(manager.offers.best.key, {}).values()
 
         return cancels
@@ -0,0 +1,31 @@
+"""Quotes"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import List, NamedTuple
+
+from .fill import Fill
+
+
+class QuoteUpdate(NamedTuple):
+    """A replacement for the bid and offer of an owner's quote for a ticker.
+
+    A side with no price, or a size of zero, is withdrawn.
+    """
+
+    ticker: str
+    owner: str
+    bid_price: Decimal | None
+    bid_size: int
+    offer_price: Decimal | None
+    offer_size: int
+
+
+class QuoteResult(NamedTuple):
+    """The result of updating a quote."""
+
+    bid_order_id: int | None
+    offer_order_id: int | None
+    fills: List[Fill]
+    cancels: List[int]
@@ -0,0 +1,81 @@
+"""Stop order side"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import List, cast
+
+from .aggregate_order import AggregateOrder
+from .aggregate_order_side import AggregateOrderSide
+from .order import Order, Price
+
+
+class StopOrderSide(AggregateOrderSide):
+    """The stop orders for a side, held by their stop price.
+
+    The levels are keyed by the price at which the stops are triggered, which
+    for a stop-limit order is not the price of the order. The "best" level is
+    the level which is triggered first; the lowest stop price for buy stops,
+    and the highest for sell stops. As the levels are sorted with the best
+    level last, the stops triggered by a price are the levels at the end of
+    the list from that price, which are found with a single binary search and
+    removed together.
+    """
+
+    def add_order(self, order: Order) -> None:
+        aggregate_order = self._index.get(cast(Price, order.stop_price))
+        if aggregate_order is not None:
+            aggregate_order.append(order)
+            return
+
+        self._insert_level(self._create_level(order))
+
+    def _create_level(self, order: Order) -> AggregateOrder:
+        stop_price = cast(Price, order.stop_price)
+        price = (
+            stop_price if self._tick_size is None
+            else self._tick_size.to_price(cast(int, stop_price))
+        )
+        return (
+            AggregateOrder(order, price, stop_price) if self.pool is None
+            else self.pool.create_level(order, price, stop_price)
+        )
+
+    def amend_order(self, order: Order, size: int) -> None:
+        aggregate_order = self._index.get(cast(Price, order.stop_price))
+        if aggregate_order is None:
+            raise ValueError("no order at this price")
+
+        aggregate_order.change_size(order.order_id, size)
+
+    def cancel_order(self, order: Order) -> None:
+        aggregate_order = self._index.get(cast(Price, order.stop_price))
+        if aggregate_order is None:
+            raise KeyError("The aggregate order could not be found")
+
+        aggregate_order.cancel(order.order_id)
+        if len(aggregate_order) == 0:
+            self._delete_level(aggregate_order)
+            if self.pool is not None:
+                self.pool.release(aggregate_order)
+
+    def trigger(self, price: Price) -> List[Order]:
+        """Remove the stops triggered by a price.
+
+        Buy stops are triggered by a price at or above their stop price, and
+        sell stops by a price at or below.
+
+        Args:
+            price (Price): The triggering price, or count of ticks.
+
+        Returns:
+            List[Order]: The triggered orders, in the order in which the levels
+                are triggered, and time priority within a level.
+        """
+        return self._remove_levels(
+            bisect_left(self._keys, self._sort_key(price)),
+            len(self._keys)
+        )
+
+    def __repr__(self) -> str:
+        return f"StopOrderSide({self._low_is_best}) {{{str(self)}}}"
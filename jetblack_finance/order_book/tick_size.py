@@ -0,0 +1,80 @@
+"""Tick Size"""
+
+from decimal import Decimal
+
+
+class TickSize:
+    """A tick size converts between decimal prices and integer tick counts.
+
+    Integer comparison is much cheaper than decimal comparison, so an order
+    book with a tick size holds and compares prices as a count of ticks, and
+    converts back to decimal prices at the boundary of the order book.
+    """
+
+    def __init__(self, tick_size: Decimal) -> None:
+        """Initialise the tick size.
+
+        Args:
+            tick_size (Decimal): The minimum price increment.
+
+        Raises:
+            ValueError: If the tick size is not greater than zero.
+        """
+        if tick_size <= 0:
+            raise ValueError("the tick size must be greater than 0")
+        self._tick_size = tick_size
+
+    @property
+    def tick_size(self) -> Decimal:
+        """The minimum price increment.
+
+        Returns:
+            Decimal: The tick size.
+        """
+        return self._tick_size
+
+    def to_ticks(self, price: Decimal) -> int:
+        """Convert a price to a count of ticks.
+
+        Args:
+            price (Decimal): The price.
+
+        Raises:
+            ValueError: If the price is not a multiple of the tick size.
+
+        Returns:
+            int: The number of ticks.
+        """
+        ticks, remainder = divmod(price, self._tick_size)
+        if remainder:
+            raise ValueError(
+                f"price {price} is not a multiple of the tick size {self._tick_size}"
+            )
+        return int(ticks)
+
+    def to_price(self, ticks: int) -> Decimal:
+        """Convert a count of ticks to a price.
+
+        Args:
+            ticks (int): The number of ticks.
+
+        Returns:
+            Decimal: The price.
+        """
+        return ticks * self._tick_size
+
+    @property
+    def ticks_per_unit(self) -> int | None:
+        """The number of ticks in a unit of price, if it is whole.
+
+        When it is whole a count of ticks divided by it is the nearest float
+        to the price, which is much cheaper than converting the decimal price.
+
+        Returns:
+            int | None: The ticks per unit, or None if it is not whole.
+        """
+        ticks_per_unit = 1 / self._tick_size
+        return int(ticks_per_unit) if ticks_per_unit == int(ticks_per_unit) else None
+
+    def __repr__(self) -> str:
+        return f"TickSize({self._tick_size})"
@@ -0,0 +1,15 @@
+"""Top of book"""
+
+from decimal import Decimal
+from typing import NamedTuple
+
+
+class TopOfBook(NamedTuple):
+    """The best price level of a side."""
+
+    price: Decimal
+    size: int
+    order_count: int
+
+    def __str__(self) -> str:
+        return f"{self.price}x{self.size}"
@@ -0,0 +1,109 @@
+"""Tests for adding orders in batches"""
+
+from decimal import Decimal
+import random
+from typing import List
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    Fill,
+    OrderBook,
+    OrderRequest,
+    Side,
+    Style
+)
+
+
+def _random_orders(seed: int, count: int) -> List[OrderRequest]:
+    rnd = random.Random(seed)
+    styles = [Style.LIMIT] * 8 + [
+        Style.FILL_OR_KILL,
+        Style.IMMEDIATE_OR_CANCEL,
+        Style.BOOK_OR_CANCEL,
+        Style.STOP,
+        Style.STOP_LIMIT
+    ]
+    orders: List[OrderRequest] = []
+    for _ in range(count):
+        side = rnd.choice((Side.BUY, Side.SELL))
+        price = Decimal(rnd.randint(190, 210)) / 2
+        style = rnd.choice(styles)
+        stop_price = None
+        if style == Style.STOP_LIMIT:
+            stop_price = price + (
+                Decimal('0.5') if side == Side.BUY else Decimal('-0.5')
+            )
+        orders.append(
+            OrderRequest(side, price, rnd.randint(1, 10), style, stop_price)
+        )
+    return orders
+
+
+def test_add_orders_sequential():
+    """A batch should give the same results as adding orders in turn"""
+    for seed in range(10):
+        for tick_size in (None, Decimal('0.5')):
+            orders = _random_orders(seed, 200)
+
+            order_book = OrderBook(tick_size=tick_size)
+            expected = [order_book.add_order(*order) for order in orders]
+
+            batch_order_book = OrderBook(tick_size=tick_size)
+            results: List[tuple[int | None, List[Fill], List[int]]] = []
+            fills: List[Fill] = []
+            cancels: List[int] = []
+            for start in range(0, len(orders), 64):
+                batch_results, batch_fills, batch_cancels = batch_order_book.add_orders(
+                    orders[start:start + 64]
+                )
+                results += batch_results
+                fills += batch_fills
+                cancels += batch_cancels
+
+            assert results == expected, "results should match"
+            assert fills == [
+                fill for _, order_fills, _ in expected for fill in order_fills
+            ], "fills should be combined in order"
+            assert cancels == [
+                cancel for _, _, order_cancels in expected for cancel in order_cancels
+            ], "cancels should be combined in order"
+            assert str(batch_order_book) == str(order_book)
+            assert batch_order_book.version == order_book.version
+
+
+def test_add_orders_invalid():
+    """An invalid order should leave the book unchanged"""
+    order_book = OrderBook(tick_size=Decimal('0.5'))
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+
+    try:
+        order_book.add_orders([
+            OrderRequest(Side.BUY, Decimal('10.5'), 5, Style.LIMIT),
+            OrderRequest(Side.SELL, Decimal('10.25'), 5, Style.LIMIT),
+        ])
+        assert False, "should reject an off tick price"
+    except ValueError:
+        pass
+
+    assert str(order_book) == '10.0x5 : ', "no orders should be added"
+    assert order_book.version == 1
+
+
+def test_exchange_add_orders():
+    """An exchange order book should add a batch for a ticker"""
+    order_book = ExchangeOrderBook(['AAPL', 'MSFT'])
+
+    results, fills, cancels = order_book.add_orders(
+        'AAPL',
+        [
+            OrderRequest(Side.BUY, Decimal('134.76'), 10, Style.LIMIT),
+            OrderRequest(Side.SELL, Decimal('134.79'), 25, Style.LIMIT),
+            OrderRequest(Side.BUY, Decimal('134.79'), 20, Style.LIMIT),
+        ]
+    )
+
+    assert [order_id for order_id, _, _ in results] == [1, 2, 3]
+    assert fills == [Fill(3, 2, Decimal('134.79'), 20)]
+    assert not cancels
+    assert str(order_book.books['AAPL']) == '134.76x10 : 134.79x5'
+    assert str(order_book.books['MSFT']) == ' : '
@@ -0,0 +1,75 @@
+"""Tests for the aggregate order"""
+
+from decimal import Decimal
+
+from jetblack_finance.order_book import AggregateOrder, Order, Side, Style
+
+
+def test_time_priority_queue():
+    """Orders can be removed from anywhere while keeping time priority"""
+    price = Decimal('10.5')
+    orders = [
+        Order(order_id, Side.BUY, price, 10, Style.LIMIT)
+        for order_id in range(1, 6)
+    ]
+    aggregate_order = AggregateOrder(orders[0])
+    for order in orders[1:]:
+        aggregate_order.append(order)
+
+    assert len(aggregate_order) == 5
+    assert 3 in aggregate_order
+    assert 6 not in aggregate_order
+
+    aggregate_order.cancel(3)
+    assert 3 not in aggregate_order
+    assert [order.order_id for order in aggregate_order.orders] == [1, 2, 4, 5]
+
+    aggregate_order.change_size(4, 3)
+    assert aggregate_order.size == 33
+
+    assert aggregate_order.first.order_id == 1
+    aggregate_order.delete_first()
+    assert aggregate_order.first.order_id == 2
+    assert [order.order_id for order in aggregate_order.orders] == [2, 4, 5]
+
+    try:
+        aggregate_order.cancel(1)
+        assert False, "should not cancel a removed order"
+    except KeyError:
+        pass
+
+    try:
+        aggregate_order.change_size(3, 5)
+        assert False, "should not amend a removed order"
+    except KeyError:
+        pass
+
+
+def test_size_and_count():
+    """The size and count are maintained as the orders change"""
+    price = Decimal('10.5')
+    aggregate_order = AggregateOrder(
+        Order(1, Side.SELL, price, 10, Style.LIMIT)
+    )
+    aggregate_order.append(Order(2, Side.SELL, price, 20, Style.LIMIT))
+    aggregate_order.append(Order(3, Side.SELL, price, 30, Style.LIMIT))
+    assert (aggregate_order.size, aggregate_order.count) == (60, 3)
+
+    order = aggregate_order.fill_first(4)
+    assert order.order_id == 1 and order.size == 6
+    assert (aggregate_order.size, aggregate_order.count) == (56, 3)
+
+    order = aggregate_order.fill_first(6)
+    assert order.order_id == 1 and order.size == 0
+    assert (aggregate_order.size, aggregate_order.count) == (50, 2)
+    assert aggregate_order.first.order_id == 2
+
+    aggregate_order.change_size(3, 5)
+    assert (aggregate_order.size, aggregate_order.count) == (25, 2)
+
+    aggregate_order.cancel(2)
+    assert (aggregate_order.size, aggregate_order.count) == (5, 1)
+
+    aggregate_order.delete_first()
+    assert (aggregate_order.size, aggregate_order.count) == (0, 0)
+    assert str(aggregate_order) == '10.5x0'
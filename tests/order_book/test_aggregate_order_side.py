@@ -0,0 +1,97 @@
+"""Tests for the aggregate order side"""
+
+import random
+from decimal import Decimal
+from typing import List
+
+from jetblack_finance.order_book import AggregateOrderSide, Order, Side, Style
+
+
+def test_price_levels():
+    """Levels should be kept in price order regardless of insertion order"""
+    for low_is_best, side in ((False, Side.BUY), (True, Side.SELL)):
+        order_side = AggregateOrderSide(low_is_best)
+        prices = ['10.3', '10.1', '10.5', '10.2', '10.4', '10.1']
+        orders = [
+            Order(order_id, side, Decimal(price), 5, Style.LIMIT)
+            for order_id, price in enumerate(prices, 1)
+        ]
+        for order in orders:
+            order_side.add_order(order)
+
+        assert len(order_side) == 5, "orders at the same price share a level"
+        assert str(
+            order_side
+        ) == '10.1x10,10.2x5,10.3x5,10.4x5,10.5x5', "levels should ascend"
+
+        best = Decimal('10.1') if low_is_best else Decimal('10.5')
+        assert order_side.best.price == best
+
+        assert [
+            level.price for level in order_side.depth(2)
+        ] == (
+            [Decimal('10.1'), Decimal('10.2')] if low_is_best
+            else [Decimal('10.4'), Decimal('10.5')]
+        ), "depth should return the levels nearest the best price"
+
+        # Cancel a level in the middle, and part of a shared level.
+        order_side.cancel_order(orders[0])
+        order_side.cancel_order(orders[5])
+        assert str(order_side) == '10.1x5,10.2x5,10.4x5,10.5x5'
+
+        order_side.amend_order(orders[3], 3)
+        assert str(order_side) == '10.1x5,10.2x3,10.4x5,10.5x5'
+
+        order_side.delete_best()
+        assert str(order_side) == (
+            '10.2x3,10.4x5,10.5x5' if low_is_best
+            else '10.1x5,10.2x3,10.4x5'
+        )
+
+        # A cancelled level can be recreated.
+        order_side.add_order(orders[0])
+        assert str(order_side) == (
+            '10.2x3,10.3x5,10.4x5,10.5x5' if low_is_best
+            else '10.1x5,10.2x3,10.3x5,10.4x5'
+        )
+
+
+def test_size_to_price():
+    """The size to a price should follow adds, amends, cancels and fills"""
+    rnd = random.Random(7)
+    for low_is_best, side in ((False, Side.BUY), (True, Side.SELL)):
+        order_side = AggregateOrderSide(low_is_best)
+        orders: List[Order] = []
+        for order_id in range(1, 500):
+            action = rnd.random()
+            if action < 0.5 or not orders:
+                order = Order(
+                    order_id,
+                    side,
+                    Decimal(rnd.randint(90, 110)),
+                    rnd.randint(1, 10),
+                    Style.LIMIT
+                )
+                order_side.add_order(order)
+                orders.append(order)
+            elif action < 0.7:
+                order = orders.pop(rnd.randrange(len(orders)))
+                order_side.cancel_order(order)
+            elif action < 0.85:
+                order = rnd.choice(orders)
+                order_side.amend_order(order, rnd.randint(1, 10))
+            else:
+                best = order_side.best
+                order = best.fill_first(1)
+                if order.size == 0:
+                    orders.remove(order)
+                if not best:
+                    order_side.delete_best()
+
+            for price in range(89, 112):
+                expected = sum(
+                    order.size
+                    for order in orders
+                    if (order.price <= price if low_is_best else order.price >= price)
+                )
+                assert order_side.size_to_price(Decimal(price)) == expected
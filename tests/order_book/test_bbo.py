@@ -0,0 +1,92 @@
+"""Tests for the best bid and offer"""
+
+from decimal import Decimal
+
+from jetblack_finance.order_book import OrderBook, Side, Style, TopOfBook
+
+
+def test_bbo():
+    """The best bid and offer reflect the top of each side"""
+    order_book = OrderBook()
+
+    assert order_book.bbo() == (None, None), "an empty book has no bbo"
+
+    order_book.add_order(Side.BUY, Decimal('10.4'), 20, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('10.5'), 10, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('10.5'), 5, Style.LIMIT)
+    sell1, _, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('10.7'),
+        7,
+        Style.LIMIT
+    )
+
+    assert order_book.bbo() == (
+        TopOfBook(Decimal('10.5'), 15, 2),
+        TopOfBook(Decimal('10.7'), 7, 1)
+    )
+
+    assert sell1 is not None
+    order_book.cancel_order(sell1)
+    assert order_book.bbo() == (TopOfBook(Decimal('10.5'), 15, 2), None)
+
+    order_book.add_order(Side.SELL, Decimal('10.5'), 12, Style.LIMIT)
+    assert order_book.bbo() == (TopOfBook(Decimal('10.5'), 3, 1), None)
+
+
+def test_bbo_with_tick_size():
+    """The best prices are decimal when the book has a tick size"""
+    order_book = OrderBook(tick_size=Decimal('0.05'))
+    order_book.add_order(Side.BUY, Decimal('10.45'), 10, Style.LIMIT)
+
+    bid, offer = order_book.bbo()
+    assert bid == TopOfBook(Decimal('10.45'), 10, 1)
+    assert isinstance(bid.price, Decimal)
+    assert bid.order_count == 1
+    assert offer is None
+
+
+def test_version():
+    """The version changes with every change to the book"""
+    order_book = OrderBook()
+    versions = [order_book.version]
+
+    buy1, _, _ = order_book.add_order(Side.BUY, Decimal('10.5'), 10, Style.LIMIT)
+    versions.append(order_book.version)
+
+    assert buy1 is not None
+    order_book.amend_order(buy1, 5)
+    versions.append(order_book.version)
+
+    order_book.add_order(Side.SELL, Decimal('10.5'), 2, Style.LIMIT)
+    versions.append(order_book.version)
+
+    order_book.cancel_order(buy1)
+    versions.append(order_book.version)
+
+    assert versions == sorted(set(versions)), "the version should increase"
+
+    # A rejected order does not change the book.
+    order_book.add_order(Side.BUY, Decimal('10.5'), 5, Style.IMMEDIATE_OR_CANCEL)
+    version = order_book.version
+    order_id, _, _ = order_book.add_order(
+        Side.BUY,
+        Decimal('10.4'),
+        5,
+        Style.IMMEDIATE_OR_CANCEL
+    )
+    assert order_id is None, "the worse immediate-or-cancel should be rejected"
+    assert order_book.version == version
+
+
+def test_bbo_is_cached():
+    """The bbo is only rebuilt when the book changes"""
+    order_book = OrderBook()
+    order_book.add_order(Side.BUY, Decimal('10.5'), 10, Style.LIMIT)
+
+    bbo = order_book.bbo()
+    assert order_book.bbo() is bbo, "the bbo should be cached"
+
+    order_book.add_order(Side.BUY, Decimal('10.4'), 10, Style.LIMIT)
+    assert order_book.bbo() is not bbo, "the bbo should be rebuilt"
+    assert order_book.bbo() == bbo, "a deeper order leaves the bbo unchanged"
@@ -0,0 +1,89 @@
+"""Tests for conflators"""
+
+from decimal import Decimal
+
+import pytest
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    LevelConflator,
+    LevelUpdate,
+    Side,
+    Style,
+    TopOfBook,
+    TopOfBookConflator
+)
+
+
+def test_level_conflator():
+    """Only the latest update of each level should be flushed"""
+    order_book = ExchangeOrderBook(['AAPL', 'MSFT'])
+    conflator = LevelConflator()
+
+    order_book.add_order('AAPL', Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+    order_book.add_order('AAPL', Side.BUY, Decimal('10'), 3, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+    order_book.add_order('AAPL', Side.SELL, Decimal('11'), 4, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+    order_book.add_order('AAPL', Side.BUY, Decimal('9'), 2, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+    order_book.add_order('MSFT', Side.SELL, Decimal('20'), 1, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+
+    assert conflator.flush() == {
+        'AAPL': [
+            LevelUpdate(4, Side.BUY, Decimal('9'), 2, 1),
+            LevelUpdate(2, Side.BUY, Decimal('10'), 8, 2),
+            LevelUpdate(3, Side.SELL, Decimal('11'), 4, 1),
+        ],
+        'MSFT': [
+            LevelUpdate(1, Side.SELL, Decimal('20'), 1, 1),
+        ]
+    }
+    assert conflator.flush() == {}, "the updates have been taken"
+
+    # A level which is removed is reported with a size of 0.
+    order_book.add_order('AAPL', Side.SELL, Decimal('10'), 8, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+    order_book.add_order('AAPL', Side.SELL, Decimal('11'), 1, Style.LIMIT)
+    conflator.update(order_book.level_updates())
+    assert conflator.flush() == {
+        'AAPL': [
+            LevelUpdate(5, Side.BUY, Decimal('10'), 0, 0),
+            LevelUpdate(6, Side.SELL, Decimal('10'), 0, 0),
+            LevelUpdate(7, Side.SELL, Decimal('11'), 5, 2),
+        ]
+    }
+
+
+def test_top_of_book_conflator():
+    """Only the latest best bid and offer should be flushed"""
+    order_book = ExchangeOrderBook(['AAPL'])
+    conflator = TopOfBookConflator()
+    book = order_book.books['AAPL']
+
+    for size in (5, 3, 2):
+        order_book.add_order('AAPL', Side.BUY, Decimal('10'), size, Style.LIMIT)
+        conflator.update('AAPL', book.bbo())
+
+    assert conflator.flush() == {
+        'AAPL': (TopOfBook(Decimal('10'), 10, 3), None)
+    }
+    assert not conflator.flush()
+
+
+def test_poll():
+    """Polling should flush once each interval"""
+    conflator = TopOfBookConflator(interval=1.0)
+    bbo = (TopOfBook(Decimal('10'), 5, 1), None)
+
+    conflator.update('AAPL', bbo)
+    assert conflator.poll(100.0) == {'AAPL': bbo}, "the first poll flushes"
+    conflator.update('AAPL', bbo)
+    assert not conflator.poll(100.5)
+    assert conflator.poll(101.0) == {'AAPL': bbo}
+
+    assert not TopOfBookConflator().poll(100.0), "no interval never flushes"
+    with pytest.raises(ValueError):
+        LevelConflator(interval=0)
@@ -0,0 +1,119 @@
+"""Tests for the cost to fill queries"""
+
+from decimal import Decimal
+from functools import partial
+import random
+from typing import Sequence
+
+import pytest
+
+from jetblack_finance.order_book import (
+    AggregateOrder,
+    AggregateOrderSide,
+    LadderAggregateOrderSide,
+    LazyAggregateOrderSide,
+    OrderBook,
+    Side,
+    Style
+)
+
+
+def test_cost_to_fill():
+    """The cost should sum the levels swept, best first"""
+    order_book = OrderBook(tick_size=Decimal('0.01'))
+    order_book.add_order(Side.SELL, Decimal('10.00'), 5, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('10.01'), 3, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('10.01'), 2, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('10.03'), 10, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('9.99'), 4, Style.LIMIT)
+
+    assert order_book.cost_to_fill(Side.BUY, 3) == Decimal('30.00')
+    assert order_book.cost_to_fill(Side.BUY, 8) == Decimal('80.03')
+    assert order_book.cost_to_fill(Side.BUY, 12) == Decimal('120.11')
+    assert order_book.cost_to_fill(Side.BUY, 21) is None, "not enough offers"
+    assert order_book.cost_to_fill(Side.SELL, 4) == Decimal('39.96')
+
+    assert order_book.price_for_size(Side.BUY, 5) == Decimal('10.00')
+    assert order_book.price_for_size(Side.BUY, 6) == Decimal('10.01')
+    assert order_book.price_for_size(Side.BUY, 20) == Decimal('10.03')
+    assert order_book.price_for_size(Side.SELL, 5) is None
+
+    assert order_book.size_to_price(Side.BUY, Decimal('10.02')) == 10
+    assert order_book.size_to_price(Side.SELL, Decimal('10.00')) == 0
+
+    with pytest.raises(ValueError):
+        order_book.cost_to_fill(Side.BUY, 0)
+
+
+def sweep(levels: Sequence[AggregateOrder], size: int) -> tuple[Decimal, Decimal] | None:
+    """Walk the levels from the best"""
+    cost = Decimal(0)
+    for level in levels:
+        taken = min(size, level.size)
+        cost += taken * level.price
+        size -= taken
+        if size == 0:
+            return cost, level.price
+    return None
+
+
+def test_random_cost_to_fill():
+    """The queries should match a walk over the depth"""
+    factories = [
+        (None, AggregateOrderSide),
+        (Decimal('0.5'), AggregateOrderSide),
+        (
+            Decimal('0.5'),
+            partial(LadderAggregateOrderSide, floor=Decimal('98'), ceiling=Decimal('102'))
+        ),
+        (
+            None,
+            partial(LazyAggregateOrderSide, distance=Decimal('2'), bucket_size=Decimal('1'))
+        ),
+    ]
+    styles = [Style.LIMIT] * 6 + [Style.FILL_OR_KILL, Style.ICEBERG]
+    for seed in range(40):
+        rnd = random.Random(seed)
+        tick_size, side_factory = factories[seed % len(factories)]
+        order_book = OrderBook(tick_size=tick_size, side_factory=side_factory)
+        for _ in range(200):
+            action = rnd.random()
+            order_ids = [
+                order.order_id
+                for side in (order_book.bids, order_book.offers)
+                for level in side.depth(None)
+                for order in level.orders
+            ]
+            if action < 0.15 and order_ids:
+                order_book.cancel_order(rnd.choice(order_ids))
+            elif action < 0.25 and order_ids:
+                order_book.amend_order(rnd.choice(order_ids), rnd.randint(1, 10))
+            elif action < 0.28:
+                low = Decimal(rnd.randint(190, 210)) / 2
+                order_book.cancel_orders(min_price=low, max_price=low + 1)
+            else:
+                style = rnd.choice(styles)
+                order_book.add_order(
+                    rnd.choice((Side.BUY, Side.SELL)),
+                    Decimal(rnd.randint(190, 210)) / 2,
+                    rnd.randint(1, 10),
+                    style,
+                    peak=rnd.randint(1, 3) if style == Style.ICEBERG else None
+                )
+
+            bids, offers = order_book.depth(None)
+            for side, levels in ((Side.BUY, offers), (Side.SELL, bids[::-1])):
+                size = rnd.randint(1, 60)
+                expected = sweep(levels, size)
+                assert order_book.cost_to_fill(side, size) == (
+                    None if expected is None else expected[0]
+                )
+                assert order_book.price_for_size(side, size) == (
+                    None if expected is None else expected[1]
+                )
+                if levels:
+                    price = rnd.choice(levels).price
+                    assert order_book.size_to_price(side, price) == sum(
+                        level.size for level in levels
+                        if (level.price <= price if side == Side.BUY else level.price >= price)
+                    )
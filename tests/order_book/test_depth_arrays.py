@@ -0,0 +1,76 @@
+"""Tests for depth arrays"""
+
+from decimal import Decimal
+from functools import partial
+
+import pytest
+
+from jetblack_finance.order_book import (
+    AggregateOrderSide,
+    LadderAggregateOrderSide,
+    LazyAggregateOrderSide,
+    OrderBook,
+    Side,
+    Style
+)
+
+np = pytest.importorskip('numpy')
+
+
+def test_depth_arrays():
+    """The arrays should hold the best levels first"""
+    for tick_size, side_factory in (
+            (None, AggregateOrderSide),
+            (Decimal('0.5'), AggregateOrderSide),
+            (
+                Decimal('0.5'),
+                partial(LadderAggregateOrderSide, floor=Decimal('90'), ceiling=Decimal('110'))
+            ),
+            (
+                None,
+                partial(LazyAggregateOrderSide, distance=Decimal('1'), bucket_size=Decimal('1'))
+            ),
+    ):
+        order_book = OrderBook(tick_size=tick_size, side_factory=side_factory)
+        order_book.add_order(Side.BUY, Decimal('99'), 5, Style.LIMIT)
+        order_book.add_order(Side.BUY, Decimal('99'), 3, Style.LIMIT)
+        order_book.add_order(Side.BUY, Decimal('98.5'), 4, Style.LIMIT)
+        order_book.add_order(Side.BUY, Decimal('97'), 1, Style.LIMIT)
+        order_book.add_order(Side.SELL, Decimal('100'), 7, Style.LIMIT)
+
+        arrays = order_book.depth_arrays(2)
+        assert arrays.lengths.tolist() == [2, 1]
+        assert arrays.prices[0].tolist() == [99, 98.5]
+        assert arrays.sizes.tolist() == [[8, 4], [7, 0]]
+        assert arrays.counts.tolist() == [[2, 1], [1, 0]]
+        assert np.isnan(arrays.prices[1, 1]), "missing levels have no price"
+
+        arrays = order_book.depth_arrays(4)
+        assert arrays.lengths.tolist() == [3, 1]
+        assert arrays.prices[0, :3].tolist() == [99, 98.5, 97]
+
+
+def test_depth_arrays_prices():
+    """The prices should be the nearest floats to the decimal prices"""
+    for tick_size in (Decimal('0.01'), Decimal('0.3'), None):
+        order_book = OrderBook(tick_size=tick_size)
+        for price in ('100.2', '0.3', '1234567.8'):
+            order_book.add_order(Side.BUY, Decimal(price), 1, Style.LIMIT)
+        arrays = order_book.depth_arrays(3)
+        assert arrays.prices[0].tolist() == [1234567.8, 100.2, 0.3]
+
+
+def test_reuse_depth_arrays():
+    """Arrays passed to depth_arrays should be filled in place"""
+    order_book = OrderBook()
+    order_book.add_order(Side.BUY, Decimal('99'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('98'), 5, Style.LIMIT)
+
+    arrays = order_book.depth_arrays(3)
+    order_book.add_order(Side.SELL, Decimal('99'), 5, Style.LIMIT)
+    assert order_book.depth_arrays(3, arrays) is arrays
+    assert arrays.lengths.tolist() == [1, 0]
+    assert arrays.sizes[0].tolist() == [5, 0, 0], "stale levels are cleared"
+
+    with pytest.raises(ValueError):
+        order_book.depth_arrays(4, arrays)
@@ -0,0 +1,109 @@
+"""Tests for order expiry"""
+
+from decimal import Decimal
+import random
+from typing import Dict
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    OrderBook,
+    OrderRequest,
+    Side,
+    Style
+)
+
+
+def test_expire():
+    """Orders should be cancelled when they expire"""
+    order_book = OrderBook()
+
+    id1, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT, expiry=20)
+    id2, _, _ = order_book.add_order(Side.BUY, Decimal('9'), 5, Style.LIMIT, expiry=10)
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    id4, _, _ = order_book.add_order(Side.SELL, Decimal('11'), 5, Style.LIMIT, expiry=10)
+    id5, _, _ = order_book.add_order(Side.BUY, Decimal('12'), 5, Style.STOP, expiry=15)
+
+    version = order_book.version
+    assert order_book.expire(9.5) == []
+    assert order_book.version == version, "the book is unchanged"
+
+    assert order_book.expire(10) == [id2, id4]
+    assert str(order_book) == '10x10 : '
+
+    assert order_book.expire(30) == [id1, id5]
+    assert str(order_book) == '10x5 : '
+    assert not order_book.stop_bids
+    assert order_book.expire(40) == []
+
+
+def test_expire_filled_or_cancelled():
+    """Orders which have been filled or cancelled should not be expired"""
+    order_book = OrderBook(pooling=True)
+
+    id1, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT, expiry=10)
+    id2, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT, expiry=10)
+    id3, _, _ = order_book.add_order(Side.BUY, Decimal('9'), 5, Style.LIMIT, expiry=10)
+    order_book.add_order(Side.SELL, Decimal('10'), 7, Style.LIMIT)
+    order_book.cancel_order(id3)
+
+    # The order added after the bucket was emptied is expired once.
+    id5, _, _ = order_book.add_order(Side.BUY, Decimal('8'), 5, Style.LIMIT, expiry=10)
+    order_book.cancel_order(id5)
+    id6, _, _ = order_book.add_order(Side.BUY, Decimal('8'), 5, Style.LIMIT, expiry=10)
+
+    assert id1 is not None
+    assert order_book.expire(10) == [id2, id6]
+    assert str(order_book) == ' : '
+
+
+def test_expire_replaced():
+    """A replaced order should keep its expiry"""
+    order_book = OrderBook()
+
+    order_id, _, _ = order_book.add_orders([
+        OrderRequest(Side.BUY, Decimal('10'), 5, Style.LIMIT, expiry=10)
+    ])[0][0]
+    assert order_id is not None
+    new_order_id, _, _ = order_book.replace_order(order_id, Decimal('11'), 5)
+    assert order_book.expire(10) == [new_order_id]
+
+
+def test_exchange_expire():
+    """Orders should be expired across tickers"""
+    order_book = ExchangeOrderBook(['AAPL', 'MSFT', 'IBM'])
+    order_book.add_order('AAPL', Side.BUY, Decimal('134.76'), 10, Style.LIMIT, expiry=5)
+    order_book.add_order('MSFT', Side.SELL, Decimal('239.28'), 15, Style.LIMIT)
+    order_book.add_order('MSFT', Side.BUY, Decimal('239.23'), 5, Style.LIMIT, expiry=5)
+
+    assert order_book.expire(5) == {'AAPL': [1], 'MSFT': [2]}
+    assert str(order_book.books['MSFT']) == ' : 239.28x15'
+
+
+def test_random_expiry():
+    """Only the live orders which are due should be expired"""
+    for seed in range(20):
+        rnd = random.Random(seed)
+        order_book = OrderBook(pooling=True)
+        expiries: Dict[int, int] = {}
+        for now in range(0, 400, 4):
+            for _ in range(rnd.randint(0, 5)):
+                side = rnd.choice((Side.BUY, Side.SELL))
+                price = Decimal(rnd.randint(190, 210)) / 2
+                expiry = rnd.choice((None, now + rnd.randint(1, 40)))
+                order_id, _, _ = order_book.add_order(
+                    side, price, rnd.randint(1, 10), Style.LIMIT, expiry=expiry
+                )
+                if order_id is not None and expiry is not None:
+                    expiries[order_id] = expiry
+            live = {
+                order.order_id
+                for side in (order_book.bids, order_book.offers)
+                for level in side.depth(None)
+                for order in level.orders
+            }
+            expected = sorted(
+                order_id
+                for order_id, expiry in expiries.items()
+                if order_id in live and expiry <= now
+            )
+            assert order_book.expire(now) == expected
@@ -133,3 +133,127 @@ def test_fill_or_kill_cancel_sell_order():
 
     assert not fills, "should not fill"
     assert cancels == [sell_id1, sell_id2], "should cancel in order"
+
+
+def test_fill_or_kill_many_orders():
+    """An aggressive fill-or-kill may be filled by many orders and levels"""
+
+    order_book = OrderBook()
+
+    sell_id1, _, _ = order_book.add_order(Side.SELL, Decimal('10'), 3, Style.LIMIT)
+    sell_id2, _, _ = order_book.add_order(Side.SELL, Decimal('10'), 2, Style.LIMIT)
+    sell_id3, _, _ = order_book.add_order(Side.SELL, Decimal('11'), 4, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('12'), 10, Style.LIMIT)
+
+    buy_id, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('11'),
+        8,
+        Style.FILL_OR_KILL
+    )
+
+    assert buy_id is not None and fills == [
+        Fill(buy_id, sell_id1, Decimal('11'), 3),
+        Fill(buy_id, sell_id2, Decimal('11'), 2),
+        Fill(buy_id, sell_id3, Decimal('11'), 3),
+    ], "should fill across orders and levels"
+    assert not cancels, "should be no cancels"
+    assert str(order_book) == " : 11x1,12x10"
+
+
+def test_fill_or_kill_many_orders_kill():
+    """An aggressive fill-or-kill is killed before any fills"""
+
+    order_book = OrderBook()
+
+    order_book.add_order(Side.BUY, Decimal('12'), 3, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('11'), 4, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('10'), 10, Style.LIMIT)
+
+    sell_id, fills, cancels = order_book.add_order(
+        Side.SELL,
+        Decimal('11'),
+        8,
+        Style.FILL_OR_KILL
+    )
+
+    assert not fills, "should not fill at prices beyond the limit"
+    assert cancels == [sell_id], "should cancel the order"
+    assert str(order_book) == "10x10,11x4,12x3 : "
+
+
+def test_fill_or_kill_resting_fill_or_kill():
+    """Resting fill-or-kill orders which will be killed are not counted"""
+
+    order_book = OrderBook()
+
+    order_book.add_order(Side.SELL, Decimal('10'), 3, Style.LIMIT)
+    resting_id, _, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('10'),
+        6,
+        Style.FILL_OR_KILL
+    )
+
+    # After 3 are filled the resting order is larger than the remainder.
+    buy_id, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        8,
+        Style.FILL_OR_KILL
+    )
+
+    assert not fills, "should not fill"
+    assert cancels == [buy_id], "should cancel the aggressor"
+
+    # After 3 are filled the resting order can be completely filled.
+    buy_id, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        9,
+        Style.FILL_OR_KILL
+    )
+
+    assert buy_id is not None and resting_id is not None and len(fills) == 2
+    assert fills[1] == Fill(buy_id, resting_id, Decimal('10'), 6)
+    assert not cancels, "should be no cancels"
+
+
+def test_fill_or_kill_iceberg():
+    """The reserves of icebergs are counted"""
+
+    order_book = OrderBook()
+
+    iceberg_id, _, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('10'),
+        10,
+        Style.ICEBERG,
+        peak=3
+    )
+
+    buy_id, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        5,
+        Style.FILL_OR_KILL
+    )
+
+    assert buy_id is not None and iceberg_id is not None
+    assert fills == [
+        Fill(buy_id, iceberg_id, Decimal('10'), 3),
+        Fill(buy_id, iceberg_id, Decimal('10'), 2),
+    ]
+    assert not cancels, "should be no cancels"
+
+    # Only 5 remain in the iceberg.
+    buy_id, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        6,
+        Style.FILL_OR_KILL
+    )
+
+    assert not fills, "should not fill"
+    assert cancels == [buy_id], "should cancel the aggressor"
+    assert str(order_book) == " : 10x1"
@@ -0,0 +1,138 @@
+"""Tests for iceberg orders"""
+
+from decimal import Decimal
+
+from jetblack_finance.order_book import (
+    Fill,
+    OrderBook,
+    OrderRequest,
+    Side,
+    Style
+)
+
+
+def test_iceberg_replenish():
+    """The displayed size should be replenished at the back of the level"""
+    order_book = OrderBook()
+
+    iceberg_id, _, _ = order_book.add_order(
+        Side.SELL, Decimal('10'), 10, Style.ICEBERG, peak=4
+    )
+    sell_id, _, _ = order_book.add_order(Side.SELL, Decimal('10'), 3, Style.LIMIT)
+    assert str(order_book) == ' : 10x7', "only the peak should be displayed"
+
+    order_id, fills, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    assert fills == [
+        Fill(order_id, iceberg_id, Decimal('10'), 4),
+        Fill(order_id, sell_id, Decimal('10'), 1),
+    ]
+    assert [
+        (order.order_id, order.size) for order in order_book.offers.best.orders
+    ] == [(sell_id, 2), (iceberg_id, 4)], "the iceberg should lose priority"
+
+    # The last slice is the rest of the reserve.
+    order_id, fills, _ = order_book.add_order(Side.BUY, Decimal('10'), 8, Style.LIMIT)
+    assert fills == [
+        Fill(order_id, sell_id, Decimal('10'), 2),
+        Fill(order_id, iceberg_id, Decimal('10'), 4),
+        Fill(order_id, iceberg_id, Decimal('10'), 2),
+    ]
+    assert str(order_book) == ' : '
+
+
+def test_iceberg_aggressor():
+    """An aggressive iceberg should be replenished while it matches"""
+    order_book = OrderBook()
+
+    sell_id, _, _ = order_book.add_order(Side.SELL, Decimal('11'), 8, Style.LIMIT)
+    iceberg_id, fills, _ = order_book.add_order(
+        Side.BUY, Decimal('11'), 10, Style.ICEBERG, peak=3
+    )
+    assert fills == [
+        Fill(iceberg_id, sell_id, Decimal('11'), 3),
+        Fill(iceberg_id, sell_id, Decimal('11'), 3),
+        Fill(iceberg_id, sell_id, Decimal('11'), 2),
+    ]
+    assert str(order_book) == '11x1 : '
+
+    order_id, fills, _ = order_book.add_order(Side.SELL, Decimal('11'), 5, Style.LIMIT)
+    assert fills == [
+        Fill(iceberg_id, order_id, Decimal('11'), 1),
+        Fill(iceberg_id, order_id, Decimal('11'), 1),
+    ]
+    assert str(order_book) == ' : 11x3'
+
+
+def test_iceberg_cancel():
+    """A cancelled iceberg should not leave a reserve"""
+    order_book = OrderBook(pooling=True)
+
+    iceberg_id, _, _ = order_book.add_order(
+        Side.BUY, Decimal('10'), 10, Style.ICEBERG, peak=4
+    )
+    assert iceberg_id is not None
+    assert order_book.cancel_orders(style=Style.ICEBERG) == [iceberg_id]
+
+    results, fills, _ = order_book.add_orders([
+        OrderRequest(Side.BUY, Decimal('10'), 4, Style.ICEBERG, peak=4),
+        OrderRequest(Side.SELL, Decimal('10'), 6, Style.LIMIT),
+    ])
+    assert [fill.size for fill in fills] == [4]
+    assert str(order_book) == ' : 10x2'
+    assert results[0][0] != iceberg_id
+
+
+def test_iceberg_invalid():
+    """An iceberg requires a peak, and only an iceberg has one"""
+    order_book = OrderBook()
+    for style, peak in (
+            (Style.ICEBERG, None),
+            (Style.ICEBERG, 0),
+            (Style.LIMIT, 5),
+    ):
+        try:
+            order_book.add_order(Side.BUY, Decimal('10'), 10, style, peak=peak)
+            assert False, "should reject the peak"
+        except ValueError:
+            pass
+    assert str(order_book) == ' : '
+
+
+def test_iceberg_amend():
+    """An amend should set the total size of an iceberg"""
+    order_book = OrderBook()
+
+    iceberg_id, _, _ = order_book.add_order(
+        Side.SELL, Decimal('10'), 10, Style.ICEBERG, peak=3
+    )
+    assert iceberg_id is not None
+    order_book.amend_order(iceberg_id, 5)
+    assert str(order_book) == ' : 10x3', "only the peak should be displayed"
+
+    order_id, fills, _ = order_book.add_order(Side.BUY, Decimal('10'), 12, Style.LIMIT)
+    assert fills == [
+        Fill(order_id, iceberg_id, Decimal('10'), 3),
+        Fill(order_id, iceberg_id, Decimal('10'), 2),
+    ]
+    assert str(order_book) == '10x7 : '
+
+
+def test_iceberg_replace():
+    """A reduction at the same price should set the total size of an iceberg"""
+    order_book = OrderBook()
+
+    iceberg_id, _, _ = order_book.add_order(
+        Side.SELL, Decimal('10'), 10, Style.ICEBERG, peak=3
+    )
+    assert iceberg_id is not None
+    assert order_book.replace_order(iceberg_id, Decimal('10'), 5) == (
+        iceberg_id, [], []
+    ), "a reduction of the total size should keep the order id"
+    assert order_book.replace_order(iceberg_id, Decimal('10'), 2) == (
+        iceberg_id, [], []
+    )
+    assert str(order_book) == ' : 10x2'
+
+    order_id, fills, _ = order_book.add_order(Side.BUY, Decimal('10'), 12, Style.LIMIT)
+    assert fills == [Fill(order_id, iceberg_id, Decimal('10'), 2)]
+    assert str(order_book) == '10x10 : '
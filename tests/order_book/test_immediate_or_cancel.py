@@ -129,3 +129,37 @@ def test_immediate_or_cancel_sells():
     assert cancels == [sell_id3], "should cancel the partially unfilled sell"
 
     assert str(order_book) == ' : ', "the order book should be empty"
+
+
+def test_immediate_or_cancel_after_cancel():
+    """Cancelled immediate-or-cancel orders no longer reject worse orders"""
+
+    order_book = OrderBook()
+
+    buy_id1, _, _ = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        10,
+        Style.IMMEDIATE_OR_CANCEL
+    )
+    assert buy_id1 is not None
+    order_book.cancel_order(buy_id1)
+
+    buy_id2, _, _ = order_book.add_order(
+        Side.BUY,
+        Decimal('9'),
+        10,
+        Style.IMMEDIATE_OR_CANCEL
+    )
+    assert buy_id2 is not None, "should generate order"
+
+    sell_id, fills, cancels = order_book.add_order(
+        Side.SELL,
+        Decimal('9'),
+        5,
+        Style.LIMIT
+    )
+    assert sell_id is not None
+    assert fills == [Fill(buy_id2, sell_id, Decimal('9'), 5)]
+    assert cancels == [buy_id2], "should cancel the unfilled remainder"
+    assert str(order_book) == ' : '
@@ -0,0 +1,108 @@
+"""Tests for the ladder aggregate order side"""
+
+from decimal import Decimal
+from functools import partial
+import random
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    LadderAggregateOrderSide,
+    OrderBook,
+    Side,
+    Style
+)
+
+TICK_SIZE = Decimal('0.5')
+
+
+def test_ladder():
+    """A ladder should hold orders in and out of its band"""
+    order_book = ExchangeOrderBook(
+        ['AAPL'],
+        tick_sizes={'AAPL': TICK_SIZE},
+        side_factories={
+            'AAPL': partial(
+                LadderAggregateOrderSide,
+                floor=Decimal('9'),
+                ceiling=Decimal('11')
+            )
+        }
+    )
+
+    for side, price in (
+            (Side.BUY, '10'),
+            (Side.BUY, '9.5'),
+            (Side.BUY, '8'),
+            (Side.SELL, '10.5'),
+            (Side.SELL, '12'),
+    ):
+        order_book.add_order('AAPL', side, Decimal(price), 5, Style.LIMIT)
+    book = order_book.books['AAPL']
+    assert str(book) == '8.0x5,9.5x5,10.0x5 : 10.5x5,12.0x5'
+    assert book.bids.best.price == Decimal('10.0')
+
+    # A bid above the band becomes the best.
+    buy_id, _, _ = order_book.add_order(
+        'AAPL',
+        Side.BUY,
+        Decimal('10.5'),
+        5,
+        Style.IMMEDIATE_OR_CANCEL
+    )
+    assert buy_id is not None
+    assert str(book) == '8.0x5,9.5x5,10.0x5 : 12.0x5'
+    assert format(book, '2') == '9.5x5,10.0x5 : 12.0x5'
+
+    _, fills, _ = order_book.add_order(
+        'AAPL',
+        Side.SELL,
+        Decimal('8'),
+        12,
+        Style.LIMIT
+    )
+    assert [fill.price for fill in fills] == [Decimal('8.0')] * 3
+    assert str(book) == '8.0x3 : 12.0x5'
+
+
+def test_same_as_sorted():
+    """A ladder should behave as the sorted side"""
+    side_factory = partial(
+        LadderAggregateOrderSide,
+        floor=Decimal('95'),
+        ceiling=Decimal('105')
+    )
+    ladder_book = OrderBook(tick_size=TICK_SIZE, side_factory=side_factory)
+    sorted_book = OrderBook(tick_size=TICK_SIZE)
+    rng = random.Random(42)
+    order_ids = []
+
+    for _ in range(3000):
+        action = rng.random()
+        if action < 0.2 and order_ids:
+            order_id = order_ids.pop(rng.randrange(len(order_ids)))
+            try:
+                sorted_book.cancel_order(order_id)
+            except KeyError:
+                continue
+            ladder_book.cancel_order(order_id)
+        elif action < 0.3 and order_ids:
+            order_id = rng.choice(order_ids)
+            size = rng.randint(1, 20)
+            try:
+                sorted_book.amend_order(order_id, size)
+            except KeyError:
+                continue
+            ladder_book.amend_order(order_id, size)
+        else:
+            side = rng.choice([Side.BUY, Side.SELL])
+            price = TICK_SIZE * rng.randint(180, 220)
+            size = rng.randint(1, 20)
+            result = sorted_book.add_order(side, price, size, Style.LIMIT)
+            assert ladder_book.add_order(
+                side, price, size, Style.LIMIT
+            ) == result
+            if result[0] is not None:
+                order_ids.append(result[0])
+
+        assert str(ladder_book) == str(sorted_book)
+        assert format(ladder_book, '3') == format(sorted_book, '3')
@@ -0,0 +1,96 @@
+"""Tests for the lazy aggregate order side"""
+
+from decimal import Decimal
+from functools import partial
+import random
+
+from jetblack_finance.order_book import (
+    LazyAggregateOrderSide,
+    Order,
+    OrderBook,
+    Side,
+    Style
+)
+
+
+def test_buckets():
+    """Orders far from the best price should be held in buckets"""
+    order_side = LazyAggregateOrderSide(
+        False,
+        None,
+        Decimal('1'),
+        Decimal('1')
+    )
+    orders = [
+        Order(order_id, Side.BUY, Decimal(price), 5, Style.LIMIT)
+        for order_id, price in enumerate(
+            ['10.0', '9.5', '7.2', '7.1', '5.5', '7.3'],
+            1
+        )
+    ]
+    for order in orders:
+        order_side.add_order(order)
+
+    assert len(order_side) == 6
+    assert str(order_side) == '5.5x5,7.1x5,7.2x5,7.3x5,9.5x5,10.0x5'
+    assert format(order_side, '3') == '7.3x5,9.5x5,10.0x5'
+
+    # Cancel a deep order.
+    order_side.cancel_order(orders[3])
+    assert str(order_side) == '5.5x5,7.2x5,7.3x5,9.5x5,10.0x5'
+
+    # Remove the near levels, promoting the buckets.
+    order_side.delete_best()
+    order_side.cancel_order(orders[1])
+    assert order_side.best.price == Decimal('7.3')
+    assert str(order_side) == '5.5x5,7.2x5,7.3x5'
+
+    # A new best price demotes the old levels.
+    order_side.add_order(Order(7, Side.BUY, Decimal('12'), 5, Style.LIMIT))
+    assert order_side.best.price == Decimal('12')
+    assert str(order_side) == '5.5x5,7.2x5,7.3x5,12x5'
+
+
+def test_same_as_sorted():
+    """A lazy side should behave as the sorted side"""
+    for tick_size in (None, Decimal('0.5')):
+        side_factory = partial(
+            LazyAggregateOrderSide,
+            distance=Decimal('2'),
+            bucket_size=Decimal('1.5')
+        )
+        lazy_book = OrderBook(tick_size=tick_size, side_factory=side_factory)
+        sorted_book = OrderBook(tick_size=tick_size)
+        rng = random.Random(42)
+        order_ids = []
+
+        for _ in range(3000):
+            action = rng.random()
+            if action < 0.25 and order_ids:
+                order_id = order_ids.pop(rng.randrange(len(order_ids)))
+                try:
+                    sorted_book.cancel_order(order_id)
+                except KeyError:
+                    continue
+                lazy_book.cancel_order(order_id)
+            elif action < 0.3 and order_ids:
+                order_id = rng.choice(order_ids)
+                size = rng.randint(1, 20)
+                try:
+                    sorted_book.amend_order(order_id, size)
+                except KeyError:
+                    continue
+                lazy_book.amend_order(order_id, size)
+            else:
+                side = rng.choice([Side.BUY, Side.SELL])
+                price = Decimal('0.5') * rng.randint(180, 220)
+                size = rng.randint(1, 20)
+                result = sorted_book.add_order(side, price, size, Style.LIMIT)
+                assert lazy_book.add_order(
+                    side, price, size, Style.LIMIT
+                ) == result
+                if result[0] is not None:
+                    order_ids.append(result[0])
+
+            assert str(lazy_book) == str(sorted_book)
+            assert format(lazy_book, '3') == format(sorted_book, '3')
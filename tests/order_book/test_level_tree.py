@@ -0,0 +1,53 @@
+"""Tests for the level tree"""
+
+import random
+from typing import Dict
+
+from jetblack_finance.order_book import AggregateOrder, Order, Side, Style
+from jetblack_finance.order_book.level_tree import LevelTree
+
+
+def test_random_level_tree():
+    """The totals should match the levels after random changes"""
+    rnd = random.Random(42)
+    levels: Dict[int, AggregateOrder] = {
+        price: AggregateOrder(
+            Order(price, Side.SELL, price, rnd.randint(1, 10), Style.LIMIT)
+        )
+        for price in range(0, 200, 2)
+    }
+    tree = LevelTree(sorted(levels.items()))
+
+    for _ in range(1000):
+        action = rnd.random()
+        price = rnd.randrange(200)
+        if price not in levels:
+            levels[price] = AggregateOrder(
+                Order(price, Side.SELL, price, rnd.randint(1, 10), Style.LIMIT)
+            )
+            tree.insert(price, levels[price])
+        elif action < 0.5 and len(levels) > 1:
+            tree.remove(price)
+            del levels[price]
+        else:
+            level = levels[price]
+            size = rnd.randint(1, 10)
+            tree.update(price, size - level.size, (size - level.size) * price)
+            level.change_size(price, size)
+
+        assert tree.size == sum(level.size for level in levels.values())
+        key = rnd.randrange(200)
+        assert tree.size_from(key) == sum(
+            level.size for price, level in levels.items() if price >= key
+        )
+
+        size = rnd.randint(1, tree.size + 10)
+        notional, unfilled, last = 0, size, None
+        for price in sorted(levels, reverse=True):
+            last = levels[price]
+            taken = min(unfilled, last.size)
+            notional += taken * price
+            unfilled -= taken
+            if unfilled == 0:
+                break
+        assert tree.sweep(size) == (notional, last, unfilled)
@@ -0,0 +1,153 @@
+"""Tests for level updates"""
+
+from decimal import Decimal
+from functools import partial
+import random
+from typing import Dict
+
+from jetblack_finance.order_book import (
+    AggregateOrderSide,
+    ExchangeOrderBook,
+    LadderAggregateOrderSide,
+    LazyAggregateOrderSide,
+    LevelUpdate,
+    OrderBook,
+    Side,
+    Style
+)
+
+
+def test_level_updates():
+    """Only the levels which changed should be reported"""
+    order_book = OrderBook()
+
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('10'), 3, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('9'), 5, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('12'), 5, Style.LIMIT)
+    assert order_book.level_updates() == [
+        LevelUpdate(1, Side.BUY, Decimal('9'), 5, 1),
+        LevelUpdate(2, Side.BUY, Decimal('10'), 8, 2),
+        LevelUpdate(3, Side.SELL, Decimal('12'), 5, 1),
+    ]
+    assert not order_book.level_updates(), "the updates have been taken"
+
+    # A sell which sweeps the best bid.
+    order_book.add_order(Side.SELL, Decimal('9'), 10, Style.LIMIT)
+    assert order_book.level_updates() == [
+        LevelUpdate(4, Side.BUY, Decimal('9'), 3, 1),
+        LevelUpdate(5, Side.BUY, Decimal('10'), 0, 0),
+        LevelUpdate(6, Side.SELL, Decimal('9'), 0, 0),
+    ]
+
+    # Stops are not reported until they are triggered.
+    order_book.add_order(Side.BUY, Decimal('13'), 5, Style.STOP)
+    assert not order_book.level_updates()
+
+
+def test_exchange_level_updates():
+    """The updates should be reported for each ticker with changes"""
+    order_book = ExchangeOrderBook(
+        ['AAPL', 'MSFT'],
+        tick_sizes={'AAPL': Decimal('0.01')}
+    )
+    order_book.add_order('AAPL', Side.BUY, Decimal('134.76'), 10, Style.LIMIT)
+
+    assert order_book.level_updates() == {
+        'AAPL': [LevelUpdate(1, Side.BUY, Decimal('134.76'), 10, 1)]
+    }
+    assert not order_book.level_updates()
+
+
+def test_random_level_updates():
+    """A book built from the updates should match the depth"""
+    factories = [
+        (None, AggregateOrderSide),
+        (Decimal('0.5'), AggregateOrderSide),
+        (
+            Decimal('0.5'),
+            partial(LadderAggregateOrderSide, floor=Decimal('98'), ceiling=Decimal('102'))
+        ),
+        (
+            None,
+            partial(LazyAggregateOrderSide, distance=Decimal('2'), bucket_size=Decimal('1'))
+        ),
+    ]
+    styles = [Style.LIMIT] * 6 + [
+        Style.FILL_OR_KILL,
+        Style.IMMEDIATE_OR_CANCEL,
+        Style.BOOK_OR_CANCEL,
+        Style.STOP,
+        Style.ICEBERG
+    ]
+    for seed in range(40):
+        rnd = random.Random(seed)
+        tick_size, side_factory = factories[seed % len(factories)]
+        order_book = OrderBook(
+            tick_size=tick_size,
+            side_factory=side_factory,
+            pooling=True
+        )
+        levels: Dict[tuple[Side, Decimal], tuple[int, int]] = {}
+        sequence = 0
+        for now in range(300):
+            action = rnd.random()
+            order_ids = [
+                order.order_id
+                for side in (order_book.bids, order_book.offers)
+                for level in side.depth(None)
+                for order in level.orders
+            ]
+            if action < 0.1 and order_ids:
+                order_book.cancel_order(rnd.choice(order_ids))
+            elif action < 0.15 and order_ids:
+                order_id = rnd.choice(order_ids)
+                order_book.amend_order(order_id, rnd.randint(1, 10))
+            elif action < 0.2 and order_ids:
+                order_book.replace_order(
+                    rnd.choice(order_ids),
+                    Decimal(rnd.randint(190, 210)) / 2,
+                    rnd.randint(1, 10)
+                )
+            elif action < 0.25:
+                order_book.update_quote(
+                    rnd.choice(('a', 'b')),
+                    Decimal(rnd.randint(190, 199)) / 2,
+                    rnd.randint(0, 10),
+                    Decimal(rnd.randint(200, 210)) / 2,
+                    rnd.randint(0, 10)
+                )
+            elif action < 0.27:
+                order_book.cancel_orders(
+                    side=rnd.choice((Side.BUY, Side.SELL)),
+                    min_price=Decimal(rnd.randint(190, 210)) / 2
+                )
+            elif action < 0.3:
+                order_book.expire(now)
+            else:
+                style = rnd.choice(styles)
+                order_book.add_order(
+                    rnd.choice((Side.BUY, Side.SELL)),
+                    Decimal(rnd.randint(190, 210)) / 2,
+                    rnd.randint(1, 10),
+                    style,
+                    expiry=rnd.choice((None, now + rnd.randint(1, 20))),
+                    peak=rnd.randint(1, 3) if style == Style.ICEBERG else None
+                )
+
+            for update in order_book.level_updates():
+                sequence += 1
+                assert update.sequence == sequence
+                if update.order_count == 0:
+                    levels.pop((update.side, update.price), None)
+                else:
+                    levels[(update.side, update.price)] = (update.size, update.order_count)
+
+            assert levels == {
+                (side, level.price): (level.size, level.count)
+                for side, levels_of_side in zip(
+                    (Side.BUY, Side.SELL),
+                    order_book.depth(None)
+                )
+                for level in levels_of_side
+            }
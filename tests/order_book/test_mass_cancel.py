@@ -0,0 +1,158 @@
+"""Tests for cancelling orders by owner, side, price and style"""
+
+from decimal import Decimal
+from functools import partial
+import random
+from typing import List
+
+from jetblack_finance.order_book import (
+    AggregateOrderSide,
+    ExchangeOrderBook,
+    LadderAggregateOrderSide,
+    LazyAggregateOrderSide,
+    Order,
+    OrderBook,
+    Side,
+    Style
+)
+
+
+def _orders(order_book: OrderBook) -> List[Order]:
+    return [
+        order
+        for side in (
+            order_book.bids,
+            order_book.offers,
+            order_book.stop_bids,
+            order_book.stop_offers
+        )
+        for level in side.depth(None)
+        for order in level.orders
+    ]
+
+
+def test_cancel_by_owner():
+    """The orders of an owner should be cancelled"""
+    order_book = OrderBook()
+
+    id1, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT, owner='a')
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT, owner='b')
+    id3, _, _ = order_book.add_order(Side.SELL, Decimal('12'), 5, Style.LIMIT, owner='a')
+    order_book.add_order(Side.SELL, Decimal('11'), 5, Style.LIMIT)
+
+    assert order_book.cancel_orders(owner='a') == [id1, id3]
+    assert str(order_book) == '10x5 : 11x5'
+    assert order_book.cancel_orders(owner='a') == [], "nothing left to cancel"
+
+
+def test_cancel_by_side_and_price():
+    """Levels in a price range should be removed"""
+    order_book = OrderBook(tick_size=Decimal('0.5'))
+
+    for price in ('9.0', '9.5', '10.0', '10.5'):
+        order_book.add_order(Side.BUY, Decimal(price), 5, Style.LIMIT)
+        order_book.add_order(Side.BUY, Decimal(price), 5, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('11.0'), 5, Style.LIMIT)
+
+    # The range need not be on ticks.
+    cancels = order_book.cancel_orders(
+        side=Side.BUY,
+        min_price=Decimal('9.25'),
+        max_price=Decimal('10.25')
+    )
+    assert cancels == [3, 4, 5, 6]
+    assert str(order_book) == '9.0x10,10.5x10 : 11.0x5'
+
+    version = order_book.version
+    assert order_book.cancel_orders(side=Side.SELL, max_price=Decimal('10.5')) == []
+    assert order_book.version == version, "the book is unchanged"
+
+    assert order_book.cancel_orders() == [1, 2, 7, 8, 9]
+    assert str(order_book) == ' : '
+
+
+def test_cancel_by_style():
+    """Only orders of a style should be cancelled"""
+    order_book = OrderBook()
+
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    id2, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.FILL_OR_KILL)
+    id3, _, _ = order_book.add_order(Side.BUY, Decimal('12'), 5, Style.STOP)
+
+    assert order_book.cancel_orders(style=Style.FILL_OR_KILL) == [id2]
+    assert order_book.cancel_orders(style=Style.STOP) == [id3]
+    assert str(order_book) == '10x5 : '
+    assert not order_book.stop_bids
+
+
+def test_exchange_cancel_by_owner():
+    """An owner's orders should be cancelled across tickers"""
+    order_book = ExchangeOrderBook(['AAPL', 'MSFT', 'IBM'])
+    order_book.add_order('AAPL', Side.BUY, Decimal('134.76'), 10, Style.LIMIT, owner='a')
+    order_book.add_order('MSFT', Side.SELL, Decimal('239.28'), 15, Style.LIMIT)
+    order_book.add_order('MSFT', Side.BUY, Decimal('239.23'), 5, Style.LIMIT, owner='a')
+
+    assert order_book.cancel_orders(owner='a') == {'AAPL': [1], 'MSFT': [2]}
+    assert str(order_book.books['MSFT']) == ' : 239.28x15'
+
+
+def test_random_mass_cancel():
+    """A mass cancel should match cancelling the selected orders in turn"""
+    factories = [
+        (None, AggregateOrderSide),
+        (Decimal('0.5'), AggregateOrderSide),
+        (
+            Decimal('0.5'),
+            partial(LadderAggregateOrderSide, floor=Decimal('98'), ceiling=Decimal('102'))
+        ),
+        (
+            None,
+            partial(LazyAggregateOrderSide, distance=Decimal('2'), bucket_size=Decimal('1'))
+        ),
+    ]
+    styles = [Style.LIMIT] * 6 + [Style.FILL_OR_KILL, Style.STOP]
+    for seed in range(40):
+        rnd = random.Random(seed)
+        tick_size, side_factory = factories[seed % len(factories)]
+        order_books = [
+            OrderBook(tick_size=tick_size, side_factory=side_factory, pooling=True)
+            for _ in range(2)
+        ]
+        for _ in range(150):
+            side = rnd.choice((Side.BUY, Side.SELL))
+            price = Decimal(rnd.randint(190, 210)) / 2
+            args = (side, price, rnd.randint(1, 10), rnd.choice(styles))
+            owner = rnd.choice(('a', 'b', None))
+            for order_book in order_books:
+                order_book.add_order(*args, owner=owner)
+
+        side = rnd.choice((Side.BUY, Side.SELL, None))
+        owner = rnd.choice(('a', None))
+        style = rnd.choice((Style.LIMIT, Style.STOP, None))
+        min_price = rnd.choice((Decimal('97.75'), Decimal('99.5'), None))
+        max_price = rnd.choice((Decimal('103'), Decimal('100.25'), None))
+
+        mass, single = order_books
+        scale = 1 if tick_size is None else tick_size
+        expected = sorted(
+            order.order_id
+            for order in _orders(single)
+            if (side is None or order.side == side) and
+            (owner is None or order.owner == owner) and
+            (style is None or order.style == style) and
+            (min_price is None or order.price * scale >= min_price) and
+            (max_price is None or order.price * scale <= max_price)
+        )
+        for order_id in expected:
+            single.cancel_order(order_id)
+
+        assert mass.cancel_orders(side, owner, style, min_price, max_price) == expected
+        assert str(mass) == str(single)
+        assert mass.bbo() == single.bbo()
+        assert sorted(
+            order.order_id for order in _orders(mass)
+        ) == sorted(order.order_id for order in _orders(single))
+        assert mass.cancel_orders() == sorted(
+            order.order_id for order in _orders(single)
+        )
+        assert not _orders(mass)
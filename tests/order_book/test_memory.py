@@ -0,0 +1,38 @@
+"""Tests for the memory used by resting orders"""
+
+from decimal import Decimal
+import gc
+import tracemalloc
+
+from jetblack_finance.order_book import Order, OrderBook, Side, Style
+
+# The documented cost of a resting order is about 265 bytes on CPython 3.11.
+# This allows some headroom for other versions of the interpreter.
+MAX_BYTES_PER_RESTING_ORDER = 300
+
+
+def test_order_has_no_dict():
+    """Orders should not carry an instance dictionary"""
+    order = Order(1, Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    assert not hasattr(order, '__dict__')
+
+
+def test_bytes_per_resting_order():
+    """Measure the memory used for each resting order"""
+    order_book = OrderBook()
+    prices = [Decimal('100.00') + Decimal('0.01') * i for i in range(100)]
+    count = 20_000
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(count):
+            order_book.add_order(Side.BUY, prices[i % 100], 10, Style.LIMIT)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    bytes_per_order = (after - before) / count
+    assert bytes_per_order < MAX_BYTES_PER_RESTING_ORDER, \
+        f"{bytes_per_order:.0f} bytes per resting order"
@@ -0,0 +1,159 @@
+"""Tests for order events"""
+
+from decimal import Decimal
+from typing import List
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    OrderBook,
+    OrderEvent,
+    OrderEventKind,
+    Side,
+    Style
+)
+
+
+def summarise(events: List[OrderEvent]) -> List[tuple]:
+    """The kind, order id, price and size of each event"""
+    return [
+        (event.kind, event.order_id, event.price, event.size)
+        for event in events
+    ]
+
+
+def test_order_events():
+    """Events should be delivered once per call, in sequence"""
+    batches: List[List[OrderEvent]] = []
+    order_book = OrderBook(tick_size=Decimal('0.5'), listener=batches.append)
+
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('9.5'), 8, Style.LIMIT)
+    order_book.amend_order(2, 2)
+    order_book.cancel_order(2)
+
+    assert [summarise(batch) for batch in batches] == [
+        [(OrderEventKind.ACCEPTED, 1, Decimal('10'), 5)],
+        [
+            (OrderEventKind.ACCEPTED, 2, Decimal('9.5'), 8),
+            (OrderEventKind.FILLED, 1, Decimal('9.5'), 5),
+            (OrderEventKind.FILLED, 2, Decimal('9.5'), 5),
+        ],
+        [(OrderEventKind.AMENDED, 2, Decimal('9.5'), 2)],
+        [(OrderEventKind.CANCELLED, 2, Decimal('9.5'), 2)],
+    ]
+    events = [event for batch in batches for event in batch]
+    assert [event.sequence for event in events] == list(range(1, 7))
+    assert all(
+        a.timestamp <= b.timestamp
+        for a, b in zip(events, events[1:])
+    ), "timestamps should be monotonic"
+
+    # A call which changes nothing delivers no batch.
+    order_book.cancel_orders(side=Side.BUY)
+    assert len(batches) == 4
+
+
+def test_plugin_cancel_events():
+    """Orders cancelled by the plugins should be reported"""
+    batches: List[List[OrderEvent]] = []
+    order_book = OrderBook(listener=batches.append)
+
+    order_book.add_order(Side.SELL, Decimal('10'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('10'), 8, Style.IMMEDIATE_OR_CANCEL)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 2, Decimal('10'), 8),
+        (OrderEventKind.FILLED, 2, Decimal('10'), 5),
+        (OrderEventKind.FILLED, 1, Decimal('10'), 5),
+        (OrderEventKind.CANCELLED, 2, Decimal('10'), 3),
+    ]
+
+    order_book.add_order(Side.SELL, Decimal('11'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('11'), 8, Style.FILL_OR_KILL)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 4, Decimal('11'), 8),
+        (OrderEventKind.CANCELLED, 4, Decimal('11'), 8),
+    ]
+
+    order_book.add_order(Side.BUY, Decimal('11'), 2, Style.BOOK_OR_CANCEL)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 5, Decimal('11'), 2),
+        (OrderEventKind.CANCELLED, 5, Decimal('11'), 2),
+    ]
+
+
+def test_stop_and_expiry_events():
+    """Triggered stops and expired orders should be reported"""
+    batches: List[List[OrderEvent]] = []
+    order_book = OrderBook(listener=batches.append)
+
+    order_book.add_order(Side.SELL, Decimal('12'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('13'), 3, Style.STOP)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 2, Decimal('13'), 3),
+    ], "the stop is not triggered by an offer below the stop price"
+
+    order_book.add_order(Side.SELL, Decimal('13'), 5, Style.LIMIT, expiry=10)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 3, Decimal('13'), 5),
+    ]
+    order_book.add_order(Side.BUY, Decimal('13'), 6, Style.LIMIT)
+    assert summarise(batches[-1])[-3:] == [
+        (OrderEventKind.TRIGGERED, 2, Decimal('13'), 3),
+        (OrderEventKind.FILLED, 2, Decimal('13'), 3),
+        (OrderEventKind.FILLED, 3, Decimal('13'), 3),
+    ]
+
+    order_book.expire(10)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.EXPIRED, 3, Decimal('13'), 1),
+    ]
+
+
+def test_iceberg_events():
+    """The events of an iceberg should give its displayed sizes"""
+    batches: List[List[OrderEvent]] = []
+    order_book = OrderBook(listener=batches.append)
+
+    order_book.add_order(Side.SELL, Decimal('10'), 10, Style.ICEBERG, peak=4)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 1, Decimal('10'), 4),
+    ], "the reserve should not be reported"
+
+    # Replenishing is reported as an amendment.
+    order_book.add_order(Side.BUY, Decimal('10'), 4, Style.LIMIT)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.ACCEPTED, 2, Decimal('10'), 4),
+        (OrderEventKind.FILLED, 2, Decimal('10'), 4),
+        (OrderEventKind.FILLED, 1, Decimal('10'), 4),
+        (OrderEventKind.AMENDED, 1, Decimal('10'), 4),
+    ]
+
+    order_book.amend_order(1, 3)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.AMENDED, 1, Decimal('10'), 3),
+    ]
+
+    order_book.cancel_order(1)
+    assert summarise(batches[-1]) == [
+        (OrderEventKind.CANCELLED, 1, Decimal('10'), 3),
+    ]
+
+
+def test_exchange_order_events():
+    """The events of all the tickers should share a sequence"""
+    events: List[tuple[str, OrderEvent]] = []
+    order_book = ExchangeOrderBook(
+        ['AAPL', 'MSFT'],
+        listener=lambda ticker, batch: events.extend(
+            (ticker, event) for event in batch
+        )
+    )
+    order_book.add_order('AAPL', Side.BUY, Decimal('134.76'), 10, Style.LIMIT)
+    order_book.add_order('MSFT', Side.BUY, Decimal('250.5'), 10, Style.LIMIT)
+    order_book.add_order('AAPL', Side.SELL, Decimal('134.80'), 10, Style.LIMIT)
+
+    assert [(ticker, event.sequence, event.order_id) for ticker, event in events] == [
+        ('AAPL', 1, 1),
+        ('MSFT', 2, 1),
+        ('AAPL', 3, 2),
+    ]
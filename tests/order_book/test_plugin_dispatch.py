@@ -0,0 +1,121 @@
+"""Tests for calling plugin hooks"""
+
+from decimal import Decimal
+from typing import List, Sequence
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    OrderBook,
+    Side,
+    Style
+)
+from jetblack_finance.order_book.abstract_types import (
+    AbstractOrderBookManager,
+    Plugin
+)
+from jetblack_finance.order_book.order import Order
+from jetblack_finance.order_book.order_book_manager import OrderBookManager
+
+
+class CountingPlugin(Plugin):
+    """A plugin which counts calls to the post-match hook"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def valid_styles(self) -> Sequence[Style]:
+        return (Style.FILL_OR_KILL,)
+
+    def post_match(self, manager: AbstractOrderBookManager) -> List[Order]:
+        self.calls += 1
+        return []
+
+
+def test_hooks_skipped_without_styles():
+    """A hook is only called when there are orders of the plugin styles"""
+    manager = OrderBookManager([CountingPlugin])
+    plugin = manager._plugins[0]  # pylint: disable=protected-access
+    assert isinstance(plugin, CountingPlugin)
+
+    manager.add_order(Side.BUY, Decimal('10'), 10, Style.LIMIT)
+    manager.add_order(Side.SELL, Decimal('10'), 5, Style.LIMIT)
+    assert plugin.calls == 0, "no orders of the plugin style"
+
+    manager.add_order(Side.SELL, Decimal('11'), 5, Style.FILL_OR_KILL)
+    manager.add_order(Side.SELL, Decimal('10'), 2, Style.LIMIT)
+    assert plugin.calls > 0, "there is an order of the plugin style"
+
+
+def test_only_overridden_hooks_bound():
+    """Hooks which a plugin does not override are not called"""
+    manager = OrderBookManager([CountingPlugin])
+    # pylint: disable=protected-access
+    assert len(manager._post_match_hooks) == 1
+    assert not manager._pre_create_hooks
+    assert not manager._post_create_hooks
+    assert not manager._post_delete_hooks
+    assert not manager._pre_fill_hooks
+
+
+def test_style_count():
+    """The manager counts the live orders of each style"""
+    manager = OrderBookManager([])
+
+    buy1, _, _ = manager.add_order(Side.BUY, Decimal('10'), 10, Style.LIMIT)
+    manager.add_order(Side.BUY, Decimal('9'), 10, Style.LIMIT)
+    manager.add_order(Side.SELL, Decimal('8'), 5, Style.STOP)
+    assert manager.style_count(Side.BUY, Style.LIMIT) == 2
+    assert manager.style_count(Side.SELL, Style.STOP) == 1
+    assert manager.style_count(Side.SELL, Style.LIMIT) == 0
+
+    manager.add_order(Side.SELL, Decimal('10'), 10, Style.LIMIT)
+    assert manager.style_count(Side.BUY, Style.LIMIT) == 1, "filled order"
+    assert manager.style_count(Side.SELL, Style.LIMIT) == 0, "filled order"
+
+    assert buy1 is not None
+    manager.cancel_order(buy1 + 1)
+    assert manager.style_count(Side.BUY, Style.LIMIT) == 0, "cancelled order"
+
+
+def test_cancelled_during_match():
+    """Orders cancelled while matching are removed from the book"""
+    order_book = OrderBook()
+
+    order_book.add_order(Side.SELL, Decimal('10'), 5, Style.LIMIT)
+    buy1, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        10,
+        Style.IMMEDIATE_OR_CANCEL
+    )
+    assert buy1 is not None
+    assert len(fills) == 1
+    assert cancels == [buy1]
+
+    try:
+        order_book.cancel_order(buy1)
+        assert False, "the cancelled order should not be found"
+    except KeyError:
+        pass
+
+
+def test_ticker_plugins():
+    """Tickers can have their own plugins"""
+    order_book = ExchangeOrderBook(
+        ['AAPL', 'MSFT'],
+        ticker_plugins={'MSFT': ()}
+    )
+
+    order_book.add_order('AAPL', Side.BUY, Decimal('10'), 5, Style.FILL_OR_KILL)
+    try:
+        order_book.add_order(
+            'MSFT',
+            Side.BUY,
+            Decimal('10'),
+            5,
+            Style.FILL_OR_KILL
+        )
+        assert False, "the style should not be supported"
+    except ValueError:
+        pass
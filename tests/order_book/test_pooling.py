@@ -0,0 +1,89 @@
+"""Tests for object pooling"""
+
+from decimal import Decimal
+import random
+
+from jetblack_finance.order_book import OrderBook, Side, Style
+from jetblack_finance.order_book.order_book_manager import OrderBookManager
+from jetblack_finance.order_book.constants import ALL_PLUGINS
+
+
+def test_same_as_unpooled():
+    """A pooled book should behave as an unpooled book"""
+    pooled_book = OrderBook(pooling=True)
+    unpooled_book = OrderBook()
+    rng = random.Random(42)
+    order_ids = []
+
+    for _ in range(3000):
+        if rng.random() < 0.3 and order_ids:
+            order_id = order_ids.pop(rng.randrange(len(order_ids)))
+            try:
+                unpooled_book.cancel_order(order_id)
+            except KeyError:
+                continue
+            pooled_book.cancel_order(order_id)
+        else:
+            side = rng.choice([Side.BUY, Side.SELL])
+            price = Decimal('0.5') * rng.randint(190, 210)
+            size = rng.randint(1, 20)
+            result = unpooled_book.add_order(side, price, size, Style.LIMIT)
+            assert pooled_book.add_order(side, price, size, Style.LIMIT) == result
+            if result[0] is not None:
+                order_ids.append(result[0])
+
+        assert str(pooled_book) == str(unpooled_book)
+
+
+def test_objects_are_reused():
+    """Removed orders and levels should be reused"""
+    manager = OrderBookManager(ALL_PLUGINS, pooling=True)
+    for _ in range(10):
+        order_id, _, _ = manager.add_order(
+            Side.BUY,
+            Decimal('10'),
+            5,
+            Style.LIMIT
+        )
+        assert order_id is not None
+        manager.cancel_order(order_id)
+
+    pool = manager._pool  # pylint: disable=protected-access
+    assert pool is not None
+    assert pool.created == 2, "one order and one level should be created"
+    assert pool.reused == 18
+
+
+def test_reused_levels_keep_their_queue():
+    """A reused level should reuse its order queue rather than allocate one"""
+    manager = OrderBookManager(ALL_PLUGINS, pooling=True)
+    order_id, _, _ = manager.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    assert order_id is not None
+    queue = manager.bids.best._orders  # pylint: disable=protected-access
+    manager.cancel_order(order_id)
+
+    manager.add_order(Side.BUY, Decimal('11'), 7, Style.LIMIT)
+    level = manager.bids.best
+    assert level.price == Decimal('11') and level.size == 7
+    assert level._orders is queue  # pylint: disable=protected-access
+
+
+def test_referenced_objects_are_not_reused():
+    """Objects held by a caller must not be reused"""
+    order_book = OrderBook(pooling=True)
+    order_id, _, _ = order_book.add_order(
+        Side.BUY,
+        Decimal('10'),
+        5,
+        Style.LIMIT
+    )
+    assert order_id is not None
+    level = order_book.bids.best
+    order = level.first
+
+    order_book.cancel_order(order_id)
+    for _ in range(10):
+        order_book.add_order(Side.BUY, Decimal('11'), 7, Style.LIMIT)
+
+    assert level.price == Decimal('10') and len(level) == 0
+    assert order.order_id == order_id and order.price == Decimal('10')
@@ -0,0 +1,141 @@
+"""Tests for quotes"""
+
+from decimal import Decimal
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    Fill,
+    OrderBook,
+    QuoteResult,
+    QuoteUpdate,
+    Side,
+    Style
+)
+
+
+def test_quote_unchanged():
+    """An unchanged side should be left alone"""
+    order_book = OrderBook()
+
+    bid_id, offer_id, fills, cancels = order_book.update_quote(
+        'a', Decimal('10'), 5, Decimal('11'), 5
+    )
+    assert (bid_id, offer_id) == (1, 2)
+    assert not fills and not cancels
+    assert str(order_book) == '10x5 : 11x5'
+
+    version = order_book.version
+    assert order_book.update_quote(
+        'a', Decimal('10'), 5, Decimal('11'), 5
+    ) == QuoteResult(1, 2, [], [])
+    assert order_book.version == version, "the book is unchanged"
+
+    # Only the offer is replaced.
+    assert order_book.update_quote(
+        'a', Decimal('10'), 5, Decimal('11.5'), 5
+    ) == QuoteResult(1, 3, [], [])
+    assert str(order_book) == '10x5 : 11.5x5'
+
+
+def test_quote_size_down():
+    """A smaller size at the same price should keep the place in the queue"""
+    order_book = OrderBook()
+
+    order_book.update_quote('a', Decimal('10'), 5, None, 0)
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+
+    assert order_book.update_quote(
+        'a', Decimal('10'), 3, None, 0
+    ) == QuoteResult(1, None, [], [])
+    assert [
+        (order.order_id, order.size) for order in order_book.bids.best.orders
+    ] == [(1, 3), (2, 5)]
+
+    # A larger size loses priority.
+    assert order_book.update_quote(
+        'a', Decimal('10'), 4, None, 0
+    ) == QuoteResult(3, None, [], [])
+    assert [
+        (order.order_id, order.size) for order in order_book.bids.best.orders
+    ] == [(2, 5), (3, 4)]
+
+
+def test_quote_fills():
+    """A quote which crosses should be filled, and refreshed when filled"""
+    order_book = OrderBook(tick_size=Decimal('0.5'))
+
+    sell_id, _, _ = order_book.add_order(Side.SELL, Decimal('10.5'), 3, Style.LIMIT)
+    result = order_book.update_quote('a', Decimal('10.5'), 5, Decimal('11'), 5)
+    assert result == QuoteResult(
+        2, 3, [Fill(2, sell_id, Decimal('10.5'), 3)], []
+    )
+    assert str(order_book) == '10.5x2 : 11.0x5'
+
+    # A partially filled side is replaced to restore its size.
+    result = order_book.update_quote('a', Decimal('10.5'), 5, Decimal('11'), 5)
+    assert result == QuoteResult(4, 3, [], [])
+    assert str(order_book) == '10.5x5 : 11.0x5'
+
+    try:
+        order_book.update_quote('a', Decimal('10.25'), 5, Decimal('11'), 5)
+        assert False, "should reject an off tick price"
+    except ValueError:
+        pass
+    assert str(order_book) == '10.5x5 : 11.0x5', "the quote should be unchanged"
+
+
+def test_quote_no_self_trade():
+    """A quote should not trade with the side it replaces"""
+    order_book = OrderBook()
+
+    order_book.update_quote('a', Decimal('10'), 5, Decimal('11'), 5)
+    result = order_book.update_quote('a', Decimal('11'), 5, Decimal('12'), 5)
+    assert result == QuoteResult(3, 4, [], [])
+    assert str(order_book) == '11x5 : 12x5'
+
+    for bid_price in (Decimal('12'), Decimal('13')):
+        try:
+            order_book.update_quote('a', bid_price, 5, Decimal('12'), 5)
+            assert False, "should reject a locked or crossed quote"
+        except ValueError:
+            pass
+    assert str(order_book) == '11x5 : 12x5', "the quote should be unchanged"
+
+
+def test_quote_withdraw():
+    """A side with no price or size should be withdrawn"""
+    order_book = OrderBook()
+
+    order_book.update_quote('a', Decimal('10'), 5, Decimal('11'), 5)
+    order_book.update_quote('b', Decimal('9'), 5, Decimal('12'), 5)
+
+    assert order_book.update_quote(
+        'a', None, 0, Decimal('11'), 0
+    ) == QuoteResult(None, None, [], [])
+    assert str(order_book) == '9x5 : 12x5'
+
+    # A cancelled side is added again.
+    order_book.cancel_order(3)
+    assert order_book.update_quote(
+        'b', Decimal('9'), 5, Decimal('12'), 5
+    ) == QuoteResult(5, 4, [], [])
+    assert order_book.cancel_orders(owner='b') == [4, 5]
+
+
+def test_exchange_update_quotes():
+    """Quotes should be updated across tickers"""
+    order_book = ExchangeOrderBook(['AAPL', 'MSFT'])
+    order_book.add_order('MSFT', Side.SELL, Decimal('239.28'), 15, Style.LIMIT)
+
+    results = order_book.update_quotes([
+        QuoteUpdate('AAPL', 'a', Decimal('134.76'), 10, Decimal('134.79'), 10),
+        QuoteUpdate('MSFT', 'a', Decimal('239.28'), 5, Decimal('239.30'), 5),
+        QuoteUpdate('AAPL', 'b', Decimal('134.75'), 10, None, 0),
+    ])
+    assert results == [
+        QuoteResult(1, 2, [], []),
+        QuoteResult(2, 3, [Fill(2, 1, Decimal('239.28'), 5)], []),
+        QuoteResult(3, None, [], []),
+    ]
+    assert str(order_book.books['AAPL']) == '134.75x10,134.76x10 : 134.79x10'
+    assert str(order_book.books['MSFT']) == ' : 239.28x10,239.30x5'
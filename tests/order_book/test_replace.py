@@ -0,0 +1,125 @@
+"""Tests for replacing orders"""
+
+from decimal import Decimal
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    Fill,
+    OrderBook,
+    Side,
+    Style
+)
+
+
+def test_replace_price():
+    """A new price should lose the place in the queue"""
+    order_book = OrderBook()
+
+    buy_id1, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    buy_id2, _, _ = order_book.add_order(Side.BUY, Decimal('11'), 5, Style.LIMIT)
+    order_book.add_order(Side.SELL, Decimal('12'), 5, Style.LIMIT)
+
+    order_id, fills, cancels = order_book.replace_order(buy_id1, Decimal('11'), 7)
+    assert order_id is not None and order_id != buy_id1, "should have a new id"
+    assert not fills and not cancels
+    assert str(order_book) == '11x12 : 12x5'
+    assert [
+        order.order_id for order in order_book.bids.best.orders
+    ] == [buy_id2, order_id], "the replaced order should be at the back"
+
+    try:
+        order_book.cancel_order(buy_id1)
+        assert False, "the old order should be gone"
+    except KeyError:
+        pass
+
+
+def test_replace_size_down():
+    """A smaller size at the same price should keep the place in the queue"""
+    order_book = OrderBook()
+
+    buy_id1, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    buy_id2, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+
+    assert order_book.replace_order(buy_id1, Decimal('10'), 3) == (buy_id1, [], [])
+    assert [
+        (order.order_id, order.size) for order in order_book.bids.best.orders
+    ] == [(buy_id1, 3), (buy_id2, 5)]
+
+    # A larger size loses priority.
+    order_id, _, _ = order_book.replace_order(buy_id1, Decimal('10'), 6)
+    assert [
+        (order.order_id, order.size) for order in order_book.bids.best.orders
+    ] == [(buy_id2, 5), (order_id, 6)]
+
+
+def test_replace_cross():
+    """A replaced order should be matched"""
+    order_book = OrderBook(tick_size=Decimal('0.5'))
+
+    sell_id, _, _ = order_book.add_order(Side.SELL, Decimal('10.5'), 5, Style.LIMIT)
+    buy_id, _, _ = order_book.add_order(Side.BUY, Decimal('10.0'), 8, Style.LIMIT)
+
+    order_id, fills, cancels = order_book.replace_order(buy_id, Decimal('10.5'), 8)
+    assert order_id is not None and sell_id is not None
+    assert fills == [Fill(order_id, sell_id, Decimal('10.5'), 5)]
+    assert not cancels
+    assert str(order_book) == '10.5x3 : '
+
+    try:
+        order_book.replace_order(order_id, Decimal('10.25'), 8)
+        assert False, "should reject an off tick price"
+    except ValueError:
+        pass
+    assert str(order_book) == '10.5x3 : ', "the order should be unchanged"
+
+
+def test_replace_cancelled():
+    """A replacement should be handled by the plugin for its style"""
+    order_book = OrderBook()
+
+    order_book.add_order(Side.SELL, Decimal('11'), 5, Style.LIMIT)
+    buy_id, _, _ = order_book.add_order(Side.BUY, Decimal('10'), 5, Style.BOOK_OR_CANCEL)
+
+    # A book-or-cancel order which would cross is cancelled.
+    order_id, fills, cancels = order_book.replace_order(buy_id, Decimal('11'), 5)
+    assert order_id is not None and not fills
+    assert cancels == [order_id]
+    assert str(order_book) == ' : 11x5'
+
+
+def test_replace_rejected():
+    """A rejected replacement should cancel the order"""
+    order_book = OrderBook()
+
+    order_book.add_order(Side.BUY, Decimal('11'), 5, Style.IMMEDIATE_OR_CANCEL)
+    buy_id, _, _ = order_book.add_order(Side.BUY, Decimal('11'), 5, Style.IMMEDIATE_OR_CANCEL)
+
+    # An immediate-or-cancel order worse than the others is rejected.
+    assert buy_id is not None
+    assert order_book.replace_order(buy_id, Decimal('10'), 5) == (None, [], [buy_id])
+    assert str(order_book) == '11x5 : '
+
+
+def test_replace_stop_limit():
+    """A stop-limit order should keep its stop price"""
+    order_book = ExchangeOrderBook(['AAPL'])
+
+    stop_id, _, _ = order_book.add_order(
+        'AAPL',
+        Side.BUY,
+        Decimal('12'),
+        5,
+        Style.STOP_LIMIT,
+        stop_price=Decimal('11'),
+        owner='a'
+    )
+    assert stop_id is not None
+    order_id, _, _ = order_book.replace_order('AAPL', stop_id, Decimal('13'), 5)
+    assert order_id is not None
+
+    stops = order_book.books['AAPL'].stop_bids
+    assert stops.best.price == Decimal('11'), "the stop price should be kept"
+    assert [
+        (order.order_id, order.price, order.owner) for order in stops.best.orders
+    ] == [(order_id, Decimal('13'), 'a')]
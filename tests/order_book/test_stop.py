@@ -117,3 +117,132 @@ def test_stop_buy():
         Fill(buy2, sell4, Decimal('10'), 5)
     ], "should fill with the stop"
     assert not cancels4, "should be no cancels"
+
+
+def test_stops_triggered_together():
+    """A trade through several stop levels releases them in time priority"""
+    order_book = OrderBook()
+
+    sell1, _, _ = order_book.add_order(Side.SELL, Decimal('10'), 5, Style.LIMIT)
+    sell2, _, _ = order_book.add_order(Side.SELL, Decimal('12'), 30, Style.LIMIT)
+    buy3, _, _ = order_book.add_order(Side.BUY, Decimal('12'), 5, Style.STOP)
+    buy4, _, _ = order_book.add_order(Side.BUY, Decimal('11'), 5, Style.STOP)
+    buy5, _, _ = order_book.add_order(Side.BUY, Decimal('13'), 5, Style.STOP)
+    assert len(order_book.stop_bids) == 3, "the stops should rest"
+
+    # A trade at 12 triggers the stops at 11 and 12, but not 13.
+    buy6, fills, cancels = order_book.add_order(
+        Side.BUY,
+        Decimal('12'),
+        10,
+        Style.LIMIT
+    )
+    assert buy6 is not None and buy3 is not None and buy4 is not None
+    assert fills == [
+        Fill(buy6, sell1, Decimal('12'), 5),
+        Fill(buy6, sell2, Decimal('12'), 5),
+        Fill(buy3, sell2, Decimal('12'), 5),
+    ], "the aggressor should fill first, then the stops in time priority"
+    assert not cancels
+    assert str(order_book) == '11x5 : 12x20', \
+        "the unfilled stop should rest as a limit order"
+    assert [order.order_id for order in order_book.stop_bids.best.orders] == [buy5]
+
+
+def test_stop_cascade():
+    """Fills from released stops can trigger further stops"""
+    order_book = OrderBook()
+
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('9'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('8'), 5, Style.LIMIT)
+    sell4, _, _ = order_book.add_order(Side.SELL, Decimal('9'), 5, Style.STOP)
+    sell5, _, _ = order_book.add_order(Side.SELL, Decimal('8'), 5, Style.STOP)
+
+    sell6, fills, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('10'),
+        5,
+        Style.LIMIT
+    )
+    assert sell6 is not None and sell4 is not None and sell5 is not None
+    assert [(fill.sell_order_id, fill.price) for fill in fills] == [
+        (sell6, Decimal('10')),
+        (sell4, Decimal('9')),
+        (sell5, Decimal('8'))
+    ], "each stop should be triggered by the trade before"
+    assert str(order_book) == ' : '
+
+
+def test_stop_limit():
+    """A stop-limit order is triggered at its stop price and rests at its price"""
+    order_book = OrderBook(tick_size=Decimal('0.5'))
+
+    order_book.add_order(Side.BUY, Decimal('10'), 5, Style.LIMIT)
+    sell2, _, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('9.5'),
+        10,
+        Style.STOP_LIMIT,
+        stop_price=Decimal('8.5')
+    )
+    assert sell2 is not None
+    assert str(order_book.stop_offers) == '8.5x10', \
+        "the stop should be held at its stop price"
+
+    order_book.add_order(Side.SELL, Decimal('10'), 5, Style.LIMIT)
+    order_book.add_order(Side.BUY, Decimal('8.5'), 5, Style.LIMIT)
+    assert not order_book.stop_offers, "the stop should be triggered"
+    assert str(order_book) == '8.5x5 : 9.5x10', \
+        "the triggered order should rest at its limit price"
+
+    # The released order can be amended and cancelled as a limit order.
+    order_book.amend_order(sell2, 3)
+    assert str(order_book) == '8.5x5 : 9.5x3'
+    order_book.cancel_order(sell2)
+    assert str(order_book) == '8.5x5 : '
+
+
+def test_cancel_stop():
+    """Resting stops can be amended and cancelled"""
+    order_book = OrderBook()
+
+    sell1, _, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('9'),
+        10,
+        Style.STOP_LIMIT,
+        stop_price=Decimal('8')
+    )
+    assert sell1 is not None
+    order_book.amend_order(sell1, 4)
+    assert str(order_book.stop_offers) == '8x4'
+    order_book.cancel_order(sell1)
+    assert not order_book.stop_offers
+
+
+def test_stop_price_validation():
+    """Only stop-limit orders take a stop price"""
+    order_book = OrderBook()
+
+    for style, stop_price in (
+            (Style.STOP_LIMIT, None),
+            (Style.LIMIT, Decimal('8')),
+            (Style.STOP, Decimal('8'))
+    ):
+        try:
+            order_book.add_order(Side.SELL, Decimal('9'), 10, style, stop_price)
+            assert False, "should reject the stop price"
+        except ValueError:
+            pass
+
+
+def test_stop_without_trades():
+    """A stop triggered by the quote with nothing to match rests as a limit"""
+    order_book = OrderBook()
+
+    sell1, _, _ = order_book.add_order(Side.SELL, Decimal('8'), 5, Style.STOP)
+    _, fills, _ = order_book.add_order(Side.BUY, Decimal('7'), 5, Style.LIMIT)
+    assert sell1 is not None
+    assert not fills
+    assert str(order_book) == '7x5 : 8x5'
@@ -0,0 +1,87 @@
+"""Tests for order books with a tick size"""
+
+from decimal import Decimal
+import random
+
+from jetblack_finance.order_book import (
+    ExchangeOrderBook,
+    Fill,
+    OrderBook,
+    Side,
+    Style
+)
+
+
+def test_tick_size():
+    """Prices are held in ticks, and presented as decimals"""
+    order_book = OrderBook(tick_size=Decimal('0.5'))
+
+    buy1, _, _ = order_book.add_order(
+        Side.BUY,
+        Decimal('10.5'),
+        5,
+        Style.LIMIT
+    )
+    order_book.add_order(Side.BUY, Decimal('10.0'), 10, Style.LIMIT)
+    assert str(order_book) == '10.0x10,10.5x5 : '
+
+    assert order_book.bids.best.key == 21, "prices should be held as ticks"
+    assert order_book.bids.best.price == Decimal('10.5')
+
+    sell1, fills, _ = order_book.add_order(
+        Side.SELL,
+        Decimal('10.5'),
+        3,
+        Style.LIMIT
+    )
+    assert buy1 is not None and sell1 is not None
+    assert fills == [Fill(buy1, sell1, Decimal('10.5'), 3)]
+    assert isinstance(fills[0].price, Decimal), "fill prices should be decimal"
+
+    bids, offers = order_book.depth(None)
+    assert [bid.price for bid in bids] == [Decimal('10.0'), Decimal('10.5')]
+    assert not offers
+
+
+def test_off_tick_price():
+    """Prices which are not a multiple of the tick size are rejected"""
+    order_book = ExchangeOrderBook(
+        ['AAPL', 'MSFT'],
+        tick_sizes={'AAPL': Decimal('0.01')}
+    )
+
+    try:
+        order_book.add_order('AAPL', Side.BUY, Decimal('134.765'), 10, Style.LIMIT)
+        assert False, "should reject an off tick price"
+    except ValueError:
+        pass
+
+    order_book.add_order('AAPL', Side.BUY, Decimal('134.76'), 10, Style.LIMIT)
+    order_book.add_order('MSFT', Side.BUY, Decimal('239.235'), 10, Style.LIMIT)
+    assert str(order_book.books['AAPL']) == '134.76x10 : '
+    assert str(order_book.books['MSFT']) == '239.235x10 : '
+
+
+def test_same_as_decimal():
+    """A book with a tick size should behave as a decimal book"""
+    tick_size = Decimal('0.25')
+    decimal_book = OrderBook()
+    tick_book = OrderBook(tick_size=tick_size)
+    rng = random.Random(42)
+    styles = [Style.LIMIT] * 6 + [
+        Style.FILL_OR_KILL,
+        Style.IMMEDIATE_OR_CANCEL,
+        Style.BOOK_OR_CANCEL
+    ]
+
+    for _ in range(2000):
+        side = rng.choice([Side.BUY, Side.SELL])
+        price = tick_size * rng.randint(380, 420)
+        size = rng.randint(1, 20)
+        style = rng.choice(styles)
+        assert decimal_book.add_order(
+            side, price, size, style
+        ) == tick_book.add_order(
+            side, price, size, style
+        )
+        assert str(decimal_book) == str(tick_book)